@@ -0,0 +1,44 @@
+"""Algorithms solving subset sum problem.
+
+Modules are imported on first use of their names, so ``import subset_sum`` and start of command line are fast
+and numpy is imported only when it is needed:
+
+    from subset_sum import SimulatedAnnealing, SubsetInstance
+    solver = ALGORITHMS["tabu_search"](5000, 1000, SubsetInstance(numbers))
+"""
+
+import importlib
+
+from .registry import ALGORITHMS, SOLVERS, solver_class
+
+_LAZY_NAMES = {class_name: module_name for module_name, class_name in SOLVERS.values()}
+_LAZY_NAMES.update({
+    "SubsetInstance": "subset_instance",
+    "CompactSubset": "compact_subset",
+    "SearchStatistics": "search_statistics",
+    "ResultCache": "result_cache",
+    "ReachabilityIndex": "reachability_index",
+    "MultiStartRunner": "multi_start",
+    "best_solution_of": "multi_start",
+    "CoolingSchedule": "cooling_schedule",
+    "COOLING_SCHEDULES": "cooling_schedule",
+    "create_cooling_schedule": "cooling_schedule",
+    "load_instance": "number_loader",
+    "save_binary": "number_loader",
+    "SolveService": "solve_service",
+    "SolveClient": "solve_service",
+})
+
+__all__ = ["ALGORITHMS", "SOLVERS", "solver_class"] + sorted(_LAZY_NAMES)
+
+
+def __getattr__(name):
+    if name not in _LAZY_NAMES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f"{__name__}.{_LAZY_NAMES[name]}"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_NAMES))
@@ -0,0 +1,206 @@
+from  .subset_creator import _SubsetCreator
+import math
+import time
+import numpy as np
+
+class ApproximationScheme(_SubsetCreator):
+    """Fully polynomial time approximation scheme (trimmed sorted list). Like dynamic programming it computes sums
+    of subsets number by number, but after every number the sorted list of sums is trimmed: sums are grouped into
+    buckets [(1 + delta)^k, (1 + delta)^(k + 1)) with delta = epsilon / 2n and only the lowest sum of every bucket is
+    kept. The list has O(n log(searched sum) / epsilon)
+    sums, whatever the size of numbers, and the found sum is at least (1 - epsilon) times the highest sum of any
+    subset which is not higher than searched sum.
+
+    Negative numbers are handled by starting from the subset of all negative numbers: leaving a negative number out
+    raises sum by its absolute value like taking a positive number does, so the algorithm works with absolute values
+    and searched sum minus sum of negative numbers, and the guarantee holds for this distance from sum of all
+    negative numbers."""
+
+    def __init__(self, target_sum, iterations, set_numbers, epsilon = 0.01, checkpoint_interval = None,
+                 time_limit = None, acceptable_gap = 0):
+        """
+
+        :param target_sum: Searched sum of numbers.
+        :type target_sum: int
+        :param iterations: Not used, algorithm always finishes. Kept for common interface of algorithms.
+        :type iterations: int
+        :param set_numbers: Initial set, from which we create subsets, which we search in order to find a solution.
+        :type set_numbers: set
+        :param epsilon: Allowed relative error, between 0 and 1. Time and memory grow as 1 / epsilon.
+        :type epsilon: float
+        :param checkpoint_interval: Every how many numbers list of sums is remembered for rebuilding solution.
+                                    By default square root of size of main set, which limits used memory.
+        :type checkpoint_interval: int
+        :param time_limit: Maximal time of computing sums (sec). When it passes, only numbers added until then
+                           are used.
+        :type time_limit: float
+        :param acceptable_gap: Numbers stop being added as soon as sum at most this far below searched sum is
+                               found.
+        :type acceptable_gap: int
+        """
+        super().__init__(target_sum, iterations, set_numbers, time_limit=time_limit, acceptable_gap=acceptable_gap)
+        if not 0 < epsilon < 1:
+            raise ValueError(f"epsilon must be between 0 and 1, got {epsilon!r}")
+        self.epsilon = epsilon
+        self.checkpoint_interval = checkpoint_interval
+        self.best_sum = None
+        self._sums = None
+
+    @staticmethod
+    def _add_number(sums, magnitude, capacity, bucket_width):
+        """
+        The function that adds sums created by taking number to sorted sums, removes sums higher than capacity
+        and trims the list: sums are divided into buckets [(1 + delta)^k, (1 + delta)^(k + 1)) and only the lowest
+        sum of every bucket is kept, so every removed sum z has kept sum y with y <= z < (1 + delta) * y.
+
+        :param sums: Sorted sums without duplicates, int64 or Python integers (object array) when sums can be
+                     higher than int64.
+        :type sums: numpy.ndarray
+        :param magnitude: Absolute value of added number.
+        :type magnitude: int
+        :param capacity: The highest allowed sum.
+        :type capacity: int
+        :param bucket_width: log(1 + delta).
+        :type bucket_width: float
+        :return: Sorted trimmed sums after adding number.
+        :rtype: numpy.ndarray
+        """
+
+        shifted = sums[:np.searchsorted(sums, capacity - magnitude, side="right")] + magnitude
+        merged = np.concatenate((sums, shifted))
+        # Two sorted runs are merged in linear time by stable sort.
+        merged.sort(kind="stable")
+        # The first sum is always 0, which has own bucket. Logarithms of other sums are not negative, so
+        # truncation to integer is floor. Logarithms are computed from floats, whose rounding is much smaller
+        # than bucket width, also for sums kept as Python integers.
+        buckets = np.log(merged[1:].astype(np.float64))
+        buckets *= 1 / bucket_width
+        buckets = buckets.astype(np.int64)
+        kept = np.empty(len(merged), dtype=np.bool_)
+        kept[:2] = True
+        np.not_equal(buckets[1:], buckets[:-1], out=kept[2:])
+        return merged.take(np.flatnonzero(kept))
+
+    def _trimmed_sums(self):
+        """
+        The function that computes trimmed lists of sums of absolute values of numbers. Numbers higher than
+        capacity (searched sum minus sum of negative numbers) can not be taken and are skipped. Adding of numbers
+        stops when time_limit passed or sum close enough to capacity is found.
+
+        :return: Capacity, positions of added numbers, absolute values of numbers, log(1 + delta), interval between
+                 checkpoints, checkpoints and the last list of sums.
+        :rtype: tuple
+        """
+
+        if self._sums is None:
+            deadline = self._search_deadline()
+            capacity = self.target_sum - self.instance.negative_total
+            magnitudes = np.abs(self.values_array)
+            positions = np.flatnonzero((magnitudes > 0) & (magnitudes <= capacity)).tolist()
+            magnitudes = magnitudes.tolist()
+            # delta = epsilon / 2n gives (1 + delta)^n <= e^(epsilon / 2) <= 1 / (1 - epsilon). It is lowered a bit,
+            # so rounding of logarithms can not break the guarantee.
+            delta = self.epsilon / (2 * max(len(positions), 1)) * (1 - 1e-9)
+            bucket_width = math.log1p(delta)
+            interval = self.checkpoint_interval or max(1, math.isqrt(len(positions)))
+            # Sums are not higher than capacity, so they fit into int64 unless capacity does not. Then they are
+            # kept as exact Python integers, because overflowed sums would break the guarantee.
+            dtype = np.int64 if capacity <= np.iinfo(np.int64).max else object
+            sums = np.zeros(1, dtype=dtype)
+            checkpoints = []
+            added_numbers = len(positions)
+            for index, position in enumerate(positions):
+                if capacity >= 0 and (self._deadline_passed(deadline)
+                                      or capacity - int(sums[-1]) <= self.acceptable_gap):
+                    added_numbers = index
+                    break
+                if index % interval == 0:
+                    checkpoints.append(sums)
+                sums = self._add_number(sums, magnitudes[position], capacity, bucket_width)
+            self._sums = (capacity, positions[:added_numbers], magnitudes, bucket_width, interval, checkpoints, sums)
+
+        return self._sums
+
+    def search_solution(self):
+        """
+        The function that search for solution. Sum of found subset is not higher than searched sum, and it is
+        at least (1 - epsilon) times the highest such sum when counted from sum of all negative numbers.
+
+        :return: Found solution.
+        :rtype: list
+        """
+
+        # Outside of range of sums the subset of all positive or all negative numbers is the best one.
+        closest_subset = self._closest_subset_out_of_range()
+        if closest_subset is not None:
+            self.best_sum = sum(closest_subset)
+            return closest_subset
+        try:
+            capacity, positions, magnitudes, bucket_width, interval, checkpoints, sums = self._trimmed_sums()
+        except TypeError:
+            print("TypeError: incorrect type for 'set_numbers' ")
+            return None
+
+        # Subset of all negative numbers, in which leaving out a negative number means choosing it.
+        taken = self.values_array < 0
+        if capacity >= 0:
+            chosen_sum = int(sums[-1])
+            for block in reversed(range(len(checkpoints))):
+                block_positions = positions[block * interval:(block + 1) * interval]
+                block_sums = [checkpoints[block]]
+                for position in block_positions[:-1]:
+                    block_sums.append(self._add_number(block_sums[-1], magnitudes[position], capacity, bucket_width))
+
+                for position, sums_before in zip(reversed(block_positions), reversed(block_sums)):
+                    index = np.searchsorted(sums_before, chosen_sum)
+                    if index < len(sums_before) and sums_before[index] == chosen_sum:
+                        continue
+                    taken[position] = not taken[position]
+                    chosen_sum -= magnitudes[position]
+
+        solution = self.values_array[taken].tolist()
+        self.best_sum = sum(solution)
+        return solution
+
+    def execution_time(self):
+        """
+        The function that return execution time for search of solution (sec).
+
+        :return: Time execution of search of solution.
+        :rtype: str
+        """
+
+        start_time = time.perf_counter()
+        self._sums = None
+        self.search_solution()
+        formatted_time = "{:.9f}".format(time.perf_counter() - start_time)
+        return formatted_time
+
+    def how_algorithm_works(self):
+        """
+        The function that display description how trimmed list approximation works for subset sum problem.
+        """
+
+        print("""
+        Start arguments: main_set = {104, 102, 201, 101} , sum_to_find = 308, epsilon = 0.4
+
+        1. Like in dynamic programming we keep sorted list of sums of subsets and every number adds its sums:
+                list + (list shifted by number), sums higher than 308 are removed.
+
+        2. After every number the list is trimmed with delta = epsilon / 2n = 0.05: sums are grouped into buckets
+            [1.05^k, 1.05^(k + 1)) and only the lowest sum of every bucket is kept, so the list stays short also
+            for huge numbers.
+                after 104:      [0, 104]
+                after 102:      [0, 102, 104, 206]
+                after 201:      [0, 102, 104, 201, 206, 303, 305] -> trimmed [0, 102, 104, 201, 206, 303]
+                after 101:      [0, 101, 102, 104, 201, 203, 205, 206, 302, 303, 307]
+                                -> trimmed [0, 101, 104, 201, 205, 302]
+
+        3. The highest sum 302 = 201 + 101 is returned. The best possible sum is 307 = 104 + 102 + 101, and 302 is
+            at least (1 - 0.4) * 307, because every trimming loses less than 1.05 times and
+            1.05^n <= 1 / (1 - epsilon).
+
+        4. Negative numbers: we start from subset of all negative numbers and search for
+            sum_to_find - sum_of_negative_numbers with absolute values, because leaving out a negative number
+            raises sum like taking a positive one.
+        """)
@@ -0,0 +1,287 @@
+"""Repeatable benchmark of subset sum algorithms.
+
+Runs every algorithm configuration on a matrix of set sizes, ranges of numbers and positions of searched sum,
+with warmup runs and repeated timed runs, and writes median and percentile times together with distance of
+found sums from searched sum (gap) to JSON file. Results can be compared with stored baseline in order to find
+regressions. Nothing is drawn, so it runs without display:
+
+    python -m subset_sum benchmark --output results.json
+    python -m subset_sum benchmark --output new.json --baseline results.json
+"""
+
+import argparse
+import json
+import platform
+import random
+import statistics
+import sys
+import time
+
+import numpy as np
+
+from .multi_start import best_solution_of
+from .registry import ALGORITHMS
+from .subset_instance import SubsetInstance
+
+DEFAULT_MATRIX = {
+    # 30 numbers are small enough for meet in the middle, so every algorithm is measured.
+    "sizes": [30, 100, 1000],
+    "value_ranges": [1000],
+    "target_positions": [0.25, 0.5, 0.9],
+    "iterations": 100,
+    "algorithms": [
+        {"name": "hill_climbing_deterministic", "parameters": {"implicit_neighbours": True}},
+        {"name": "hill_climbing_first_choice", "parameters": {}},
+        {"name": "simulated_annealing", "parameters": {}},
+        {"name": "genetic_algorithm", "parameters": {"start_population_size": 8}},
+        {"name": "genetic_algorithm", "label": "genetic_algorithm_vectorized",
+         "parameters": {"start_population_size": 8, "vectorized": True}},
+        {"name": "dynamic_programming", "parameters": {}},
+        {"name": "meet_in_the_middle", "parameters": {}, "max_size": 40},
+        {"name": "tabu_search", "parameters": {}},
+        {"name": "parallel_tempering", "parameters": {"workers": 1, "exchange_interval": 100}},
+        {"name": "approximation_scheme", "label": "approximation_scheme_0.1", "parameters": {"epsilon": 0.1}},
+        {"name": "approximation_scheme", "label": "approximation_scheme_0.01", "parameters": {"epsilon": 0.01}},
+    ],
+}
+
+
+def create_numbers(size, value_range, seed):
+    """
+    The function that creates main set of random numbers from range -value_range to value_range.
+
+    :param size: Number of drawn numbers.
+    :type size: int
+    :param value_range: Largest absolute value of number.
+    :type value_range: int
+    :param seed: Seed of random generator.
+    :type seed: int
+    :return: Prepared main set.
+    :rtype: SubsetInstance
+    """
+
+    generator = random.Random(seed)
+    return SubsetInstance(generator.randint(-value_range, value_range) for i in range(size))
+
+
+def target_for_position(instance, position):
+    """
+    The function that return searched sum lying on given position between the lowest and the highest sum
+    of any subset (0 is the lowest, 1 is the highest).
+
+    :param instance: Main set.
+    :type instance: SubsetInstance
+    :param position: Position of searched sum.
+    :type position: float
+    :return: Searched sum.
+    :rtype: int
+    """
+
+    return round(instance.negative_total + position * (instance.positive_total - instance.negative_total))
+
+
+def percentile(samples, fraction):
+    """
+    The function that return percentile of samples with linear interpolation.
+
+    :param samples: Measured values.
+    :type samples: list
+    :param fraction: Percentile as fraction, for example 0.9.
+    :type fraction: float
+    :return: Percentile of samples.
+    :rtype: float
+    """
+
+    return float(np.percentile(samples, fraction * 100))
+
+
+def run_case(algorithm, instance, target_sum, iterations, warmups, repeats, seed):
+    """
+    The function that measures one algorithm configuration on one main set.
+
+    :param algorithm: Configuration of algorithm from matrix.
+    :type algorithm: dict
+    :param instance: Main set.
+    :type instance: SubsetInstance
+    :param target_sum: Searched sum.
+    :type target_sum: int
+    :param iterations: Number of algorithm executions.
+    :type iterations: int
+    :param warmups: Number of not measured runs.
+    :type warmups: int
+    :param repeats: Number of measured runs.
+    :type repeats: int
+    :param seed: Seed of first measured run.
+    :type seed: int
+    :return: Times and gaps of measured runs.
+    :rtype: tuple
+    """
+
+    solver_class = ALGORITHMS[algorithm["name"]]
+    times = []
+    gaps = []
+    for run in range(warmups + repeats):
+        random.seed(seed + run)
+        solver = solver_class(target_sum, iterations, instance, **algorithm.get("parameters", {}))
+        start_time = time.perf_counter()
+        solution = best_solution_of(solver)
+        elapsed = time.perf_counter() - start_time
+        if run >= warmups:
+            times.append(elapsed)
+            gaps.append(abs(target_sum - sum(solution)))
+
+    return times, gaps
+
+
+def run_benchmark(matrix, warmups, repeats, seed, progress = None):
+    """
+    The function that measures all configurations of matrix.
+
+    :param matrix: Sizes, ranges of numbers, positions of searched sums, iterations and algorithms.
+    :type matrix: dict
+    :param warmups: Number of not measured runs of every case.
+    :type warmups: int
+    :param repeats: Number of measured runs of every case.
+    :type repeats: int
+    :param seed: Seed of drawn sets and runs.
+    :type seed: int
+    :param progress: Stream to which progress is written.
+    :return: Results of all cases.
+    :rtype: list
+    """
+
+    results = []
+    for size in matrix["sizes"]:
+        for value_range in matrix["value_ranges"]:
+            instance = create_numbers(size, value_range, seed)
+            for position in matrix["target_positions"]:
+                target_sum = target_for_position(instance, position)
+                for algorithm in matrix["algorithms"]:
+                    if size > algorithm.get("max_size", size):
+                        continue
+                    label = algorithm.get("label", algorithm["name"])
+                    times, gaps = run_case(algorithm, instance, target_sum, matrix["iterations"],
+                                           warmups, repeats, seed)
+                    result = {
+                        "algorithm": label,
+                        "parameters": algorithm.get("parameters", {}),
+                        "size": size,
+                        "value_range": value_range,
+                        "target_position": position,
+                        "target_sum": target_sum,
+                        "times": times,
+                        "median_time": statistics.median(times),
+                        "p90_time": percentile(times, 0.9),
+                        "gaps": gaps,
+                        "median_gap": statistics.median(gaps),
+                        "max_gap": max(gaps),
+                    }
+                    results.append(result)
+                    if progress is not None:
+                        print(f"{label:32} n={size:<7} range={value_range:<9} position={position:<5} "
+                              f"median={result['median_time']:.6f}s p90={result['p90_time']:.6f}s "
+                              f"median gap={result['median_gap']}", file=progress)
+
+    return results
+
+
+def case_key(result):
+    return result["algorithm"], result["size"], result["value_range"], result["target_position"]
+
+
+def find_regressions(results, baseline_results, time_tolerance, gap_tolerance):
+    """
+    The function that compares results with baseline. Case is regression when its median time is higher than
+    baseline time by more than time_tolerance (fraction), or its median gap is higher than baseline gap by more
+    than gap_tolerance.
+
+    :param results: New results.
+    :type results: list
+    :param baseline_results: Results of baseline.
+    :type baseline_results: list
+    :param time_tolerance: Allowed relative slowdown, for example 0.2 for 20%.
+    :type time_tolerance: float
+    :param gap_tolerance: Allowed increase of median gap.
+    :type gap_tolerance: float
+    :return: Descriptions of regressions.
+    :rtype: list
+    """
+
+    baseline_by_case = {case_key(result): result for result in baseline_results}
+    regressions = []
+    for result in results:
+        baseline = baseline_by_case.get(case_key(result))
+        if baseline is None:
+            continue
+        if result["median_time"] > baseline["median_time"] * (1 + time_tolerance):
+            regressions.append(f"{case_key(result)}: median time {result['median_time']:.6f}s, "
+                               f"baseline {baseline['median_time']:.6f}s")
+        if result["median_gap"] > baseline["median_gap"] + gap_tolerance:
+            regressions.append(f"{case_key(result)}: median gap {result['median_gap']}, "
+                               f"baseline {baseline['median_gap']}")
+
+    return regressions
+
+
+def parse_arguments(arguments):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--config", help="JSON file with matrix, keys as in DEFAULT_MATRIX")
+    parser.add_argument("--sizes", type=int, nargs="+", help="sizes of main set")
+    parser.add_argument("--value-ranges", type=int, nargs="+", help="numbers are drawn from -range to range")
+    parser.add_argument("--target-positions", type=float, nargs="+",
+                        help="positions of searched sum between the lowest (0) and the highest (1) subset sum")
+    parser.add_argument("--algorithms", nargs="+", help="labels of algorithms from matrix to run")
+    parser.add_argument("--iterations", type=int, help="iterations of algorithms")
+    parser.add_argument("--warmups", type=int, default=1)
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="JSON file for results")
+    parser.add_argument("--baseline", help="JSON file with results to compare with")
+    parser.add_argument("--time-tolerance", type=float, default=0.2)
+    parser.add_argument("--gap-tolerance", type=float, default=0)
+    return parser.parse_args(arguments)
+
+
+def main(arguments = None):
+    arguments = parse_arguments(arguments)
+    matrix = dict(DEFAULT_MATRIX)
+    if arguments.config:
+        with open(arguments.config) as config_file:
+            matrix.update(json.load(config_file))
+    for key in ("sizes", "value_ranges", "target_positions", "iterations"):
+        if getattr(arguments, key) is not None:
+            matrix[key] = getattr(arguments, key)
+    if arguments.algorithms:
+        matrix["algorithms"] = [algorithm for algorithm in matrix["algorithms"]
+                                if algorithm.get("label", algorithm["name"]) in arguments.algorithms]
+
+    results = run_benchmark(matrix, arguments.warmups, arguments.repeats, arguments.seed, progress=sys.stderr)
+    report = {
+        "environment": {"python": platform.python_version(), "numpy": np.__version__,
+                        "platform": platform.platform()},
+        "warmups": arguments.warmups,
+        "repeats": arguments.repeats,
+        "seed": arguments.seed,
+        "results": results,
+    }
+    if arguments.output:
+        with open(arguments.output, "w") as output_file:
+            json.dump(report, output_file, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+
+    if arguments.baseline:
+        with open(arguments.baseline) as baseline_file:
+            baseline = json.load(baseline_file)
+        regressions = find_regressions(results, baseline["results"], arguments.time_tolerance,
+                                       arguments.gap_tolerance)
+        for regression in regressions:
+            print(f"REGRESSION {regression}", file=sys.stderr)
+        if regressions:
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
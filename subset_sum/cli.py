@@ -0,0 +1,46 @@
+"""Command line of subset_sum package. Module of command is imported only when the command is run:
+
+    subset-sum compare --plot
+    subset-sum benchmark --output results.json
+    subset-sum serve --port 8765
+    subset-sum load numbers.i64 --target 5000
+"""
+
+import importlib
+import sys
+
+COMMANDS = {
+    "compare": ("compare", "compare algorithms on random set and optionally draw charts"),
+    "benchmark": ("benchmark", "run repeatable benchmark and compare it with baseline"),
+    "serve": ("solve_service", "run local service solving jobs in worker processes"),
+    "load": ("number_loader", "load large set from text or binary file and optionally solve it"),
+}
+
+
+def usage():
+    lines = ["usage: subset-sum <command> [options]", "", "commands:"]
+    lines += [f"  {command:<10} {description}" for command, (module_name, description) in COMMANDS.items()]
+    lines += ["", "Run 'subset-sum <command> --help' for options of command."]
+    return "\n".join(lines)
+
+
+def main(arguments = None):
+    """
+    The function that runs command given as first argument with the rest of arguments.
+
+    :param arguments: Command line arguments, by default sys.argv[1:].
+    :type arguments: list
+    :return: Exit status.
+    :rtype: int
+    """
+
+    arguments = sys.argv[1:] if arguments is None else list(arguments)
+    if not arguments or arguments[0] in ("-h", "--help"):
+        print(usage())
+        return 0
+    command, arguments = arguments[0], arguments[1:]
+    if command not in COMMANDS:
+        print(f"unknown command {command!r}\n\n{usage()}", file=sys.stderr)
+        return 2
+    module = importlib.import_module(f"{__package__}.{COMMANDS[command][0]}")
+    return module.main(arguments) or 0
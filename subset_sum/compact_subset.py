@@ -0,0 +1,131 @@
+import numpy as np
+
+
+class CompactSubset:
+    """Subset of 0 and 1 numbers stored in numpy array, which takes one byte per number instead of
+    eight bytes per element of python list. It behaves like list of 0 and 1 numbers, so it can be used
+    by all algorithms in place of lists."""
+
+    __slots__ = ("bits",)
+
+    def __init__(self, bits):
+        """
+
+        :param bits: 0 and 1 numbers of subset.
+        :type bits: list or numpy.ndarray
+        """
+
+        self.bits = np.array(bits, dtype=np.uint8)
+
+    @classmethod
+    def from_packed(cls, packed_bits, length):
+        """
+        The function that creates subset from bytes returned by packed().
+
+        :param packed_bits: 0 and 1 numbers packed eight per byte.
+        :type packed_bits: bytes
+        :param length: Number of positions of subset.
+        :type length: int
+        :return: Unpacked subset.
+        :rtype: CompactSubset
+        """
+
+        subset = cls.__new__(cls)
+        subset.bits = np.unpackbits(np.frombuffer(packed_bits, dtype=np.uint8), count=length)
+        return subset
+
+    def packed(self):
+        """
+        The function that packs 0 and 1 numbers eight per byte, for storing or sending subset to other process.
+
+        :return: Packed subset.
+        :rtype: bytes
+        """
+
+        return np.packbits(self.bits).tobytes()
+
+    def flip(self, index):
+        """
+        The function that change 0 or 1 number on given position in place.
+
+        :param index: Position of changed number.
+        :type index: int
+        """
+
+        self.bits[index] ^= 1
+
+    def sum(self, values):
+        """
+        The function that return sum of numbers chosen by subset.
+
+        :param values: Numbers of main set.
+        :type values: numpy.ndarray
+        :return: Sum of numbers of subset.
+        :rtype: int
+        """
+
+        return int(np.dot(values, self.bits))
+
+    def decode(self, values):
+        """
+        The function that convert subset into numbers of main set which it contains.
+
+        :param values: Numbers of main set.
+        :type values: numpy.ndarray
+        :return: Numbers of subset.
+        :rtype: list
+        """
+
+        return values[self.bits.view(np.bool_)].tolist()
+
+    def to_list(self):
+        """
+        The function that convert subset into list of 0 and 1 numbers.
+
+        :return: Subset as list.
+        :rtype: list
+        """
+
+        return self.bits.tolist()
+
+    def copy(self):
+        subset = CompactSubset.__new__(CompactSubset)
+        subset.bits = self.bits.copy()
+        return subset
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            subset = CompactSubset.__new__(CompactSubset)
+            subset.bits = self.bits[key]
+            return subset
+        return int(self.bits[key])
+
+    def __setitem__(self, key, value):
+        self.bits[key] = value
+
+    def __len__(self):
+        return len(self.bits)
+
+    def __iter__(self):
+        return iter(self.bits.tolist())
+
+    def __add__(self, other):
+        other_bits = other.bits if isinstance(other, CompactSubset) else np.asarray(other, dtype=np.uint8)
+        subset = CompactSubset.__new__(CompactSubset)
+        subset.bits = np.concatenate((self.bits, other_bits))
+        return subset
+
+    def __eq__(self, other):
+        if isinstance(other, CompactSubset):
+            return np.array_equal(self.bits, other.bits)
+        if isinstance(other, list):
+            return self.to_list() == other
+        return NotImplemented
+
+    def __array__(self, dtype=None, copy=None):
+        if dtype is None:
+            return self.bits.copy() if copy else self.bits
+        return self.bits.astype(dtype)
+
+    def __repr__(self):
+        return repr(self.to_list())
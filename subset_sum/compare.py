@@ -0,0 +1,62 @@
+"""Comparison of hill climbing, simulated annealing and genetic algorithm on one random main set.
+
+Execution times and sums of found solutions are printed, and with --plot also drawn (needs plotting extra):
+
+    python -m subset_sum compare --size 1000 --target 5000 --plot
+"""
+
+import argparse
+import random
+
+from .genetic_algorithm import GeneticAlgorithm
+from .hill_climbing_deterministic import HillClimbingDeterministic
+from .hill_climbing_first_choice import HillClimbingFirstChoice
+from .simulated_annealing import SimulatedAnnealing
+from .subset_instance import SubsetInstance
+
+
+def main(arguments = None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size", type=int, default=1000, help="number of random numbers")
+    parser.add_argument("--range", type=int, default=1000, dest="value_range",
+                        help="numbers are drawn from [-range, range]")
+    parser.add_argument("--target", type=int, default=5000, help="searched sum")
+    parser.add_argument("--iterations", type=int, default=100, help="iterations of algorithms")
+    parser.add_argument("--population", type=int, default=8, help="start population of genetic algorithm")
+    parser.add_argument("--plot", action="store_true", help="draw charts of results")
+    arguments = parser.parse_args(arguments)
+
+    random_numbers_list = [random.randint(-arguments.value_range, arguments.value_range)
+                           for i in range(arguments.size)]
+
+    # Numbers are prepared once and shared by all algorithms.
+    numbers = SubsetInstance(random_numbers_list)
+    target_sum = arguments.target
+    iterations = arguments.iterations
+
+    hill_deter = HillClimbingDeterministic(target_sum, iterations, numbers)
+    hill_first_choice = HillClimbingFirstChoice(target_sum, iterations, numbers)
+    simulated_annealing = SimulatedAnnealing(target_sum, iterations, numbers)
+    genetic_alg = GeneticAlgorithm(target_sum, iterations, numbers, arguments.population)
+
+    execution_time = [float(hill_deter.execution_time()), float(hill_first_choice.execution_time()),
+                      float(simulated_annealing.execution_time()), float(genetic_alg.execution_time())]
+    algorithms = ["hill climbing deterministic", "hill climbing first choice", "simulated annealing",
+                  "genetic algorithm"]
+
+    for algorithm, algorithm_time in zip(algorithms, execution_time):
+        print(f'{algorithm}: {algorithm_time}sec')
+    print()
+
+    solutions_sum = [sum(hill_deter.search_solution()), sum(hill_first_choice.search_solution()),
+                     sum(simulated_annealing.search_solution()), sum(genetic_alg.search_for_best_individual())]
+    for algorithm, solution_sum in zip(algorithms, solutions_sum):
+        print(f'{algorithm} sum of the found solution: {solution_sum}')
+
+    if arguments.plot:
+        from .plotting import plot_results
+        plot_results(algorithms, execution_time, solutions_sum)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+import math
+
+
+class CoolingSchedule:
+    """Base class of cooling schedules of simulated annealing. Simulated annealing asks schedule for new
+    temperature every few proposed neighbors, so schedule does not slow down single steps. Schedules keep no state
+    of search, so one schedule can be used by many searches."""
+
+    def next_temperature(self, initial_temperature, temperature, step, accepted_moves, acceptance_ratio):
+        """
+        The function that return temperature for next steps of annealing.
+
+        :param initial_temperature: Temperature at the start of annealing or at the last reheating.
+        :type initial_temperature: float
+        :param temperature: Current temperature.
+        :type temperature: float
+        :param step: Number of proposed neighbors since start or last reheating.
+        :type step: int
+        :param accepted_moves: Number of accepted neighbors since start or last reheating.
+        :type accepted_moves: int
+        :param acceptance_ratio: Part of neighbors accepted since temperature was changed last time.
+        :type acceptance_ratio: float
+        :return: New temperature.
+        :rtype: float
+        """
+
+        raise NotImplementedError
+
+    def __repr__(self):
+        parameters = ", ".join(f"{name}={value!r}" for name, value in vars(self).items())
+        return f"{type(self).__name__}({parameters})"
+
+
+class ClassicSchedule(CoolingSchedule):
+    """T = T0 / k, where k is number of accepted moves. Temperature falls only when neighbors are accepted."""
+
+    def next_temperature(self, initial_temperature, temperature, step, accepted_moves, acceptance_ratio):
+        return initial_temperature / max(accepted_moves, 1)
+
+
+class GeometricSchedule(CoolingSchedule):
+    """T = T * alpha after every change of temperature."""
+
+    def __init__(self, alpha = 0.99):
+        """
+
+        :param alpha: Factor of cooling, between 0 and 1.
+        :type alpha: float
+        """
+
+        if not 0 < alpha < 1:
+            raise ValueError(f"alpha must be between 0 and 1, got {alpha!r}")
+        self.alpha = alpha
+
+    def next_temperature(self, initial_temperature, temperature, step, accepted_moves, acceptance_ratio):
+        return temperature * self.alpha
+
+
+class LinearSchedule(CoolingSchedule):
+    """T = T0 * (1 - step / cooling_steps), and 0 (only better neighbors are accepted) after cooling_steps
+    proposed neighbors."""
+
+    def __init__(self, cooling_steps = 100000):
+        """
+
+        :param cooling_steps: Number of proposed neighbors after which temperature is 0, higher than 0.
+        :type cooling_steps: int
+        """
+
+        if not cooling_steps > 0:
+            raise ValueError(f"cooling_steps must be higher than 0, got {cooling_steps!r}")
+        self.cooling_steps = cooling_steps
+
+    def next_temperature(self, initial_temperature, temperature, step, accepted_moves, acceptance_ratio):
+        return initial_temperature * max(0.0, 1 - step / self.cooling_steps)
+
+
+class LogarithmicSchedule(CoolingSchedule):
+    """T = T0 / log(e + step). Very slow cooling, which in theory reaches global optimum."""
+
+    def next_temperature(self, initial_temperature, temperature, step, accepted_moves, acceptance_ratio):
+        return initial_temperature / math.log(math.e + step)
+
+
+class LundyMeesSchedule(CoolingSchedule):
+    """T = T / (1 + beta * T) after every change of temperature."""
+
+    def __init__(self, beta = None):
+        """
+
+        :param beta: Speed of cooling, higher than 0. By default 0.01 / T0, so temperature falls to
+                     T0 / (1 + 0.01 * k) after k changes of temperature.
+        :type beta: float
+        """
+
+        if beta is not None and not beta > 0:
+            raise ValueError(f"beta must be higher than 0, got {beta!r}")
+        self.beta = beta
+
+    def next_temperature(self, initial_temperature, temperature, step, accepted_moves, acceptance_ratio):
+        if self.beta is None and initial_temperature == 0:
+            # Annealing without worse moves stays at temperature 0.
+            return 0.0
+        beta = self.beta if self.beta is not None else 0.01 / initial_temperature
+        return temperature / (1 + beta * temperature)
+
+
+class AdaptiveSchedule(CoolingSchedule):
+    """Temperature is lowered when more neighbors than target_acceptance are accepted, and raised when fewer are
+    accepted, so annealing keeps the given ratio of accepted neighbors."""
+
+    def __init__(self, target_acceptance = 0.2, factor = 1.05):
+        """
+
+        :param target_acceptance: Searched part of accepted neighbors, between 0 and 1.
+        :type target_acceptance: float
+        :param factor: Temperature is multiplied or divided by factor on every change, higher than 1.
+        :type factor: float
+        """
+
+        if not 0 < target_acceptance < 1:
+            raise ValueError(f"target_acceptance must be between 0 and 1, got {target_acceptance!r}")
+        if not factor > 1:
+            raise ValueError(f"factor must be higher than 1, got {factor!r}")
+        self.target_acceptance = target_acceptance
+        self.factor = factor
+
+    def next_temperature(self, initial_temperature, temperature, step, accepted_moves, acceptance_ratio):
+        if acceptance_ratio > self.target_acceptance:
+            return temperature / self.factor
+        return temperature * self.factor
+
+
+COOLING_SCHEDULES = {
+    "classic": ClassicSchedule,
+    "geometric": GeometricSchedule,
+    "linear": LinearSchedule,
+    "logarithmic": LogarithmicSchedule,
+    "lundy_mees": LundyMeesSchedule,
+    "adaptive": AdaptiveSchedule,
+}
+
+
+def create_cooling_schedule(cooling_schedule):
+    """
+    The function that return schedule given by name with default parameters, or given schedule object.
+
+    :param cooling_schedule: Name from COOLING_SCHEDULES or CoolingSchedule object.
+    :type cooling_schedule: str or CoolingSchedule
+    :return: Cooling schedule.
+    :rtype: CoolingSchedule
+    """
+
+    if isinstance(cooling_schedule, CoolingSchedule):
+        return cooling_schedule
+    try:
+        return COOLING_SCHEDULES[cooling_schedule]()
+    except (KeyError, TypeError):
+        raise ValueError(f"unknown cooling schedule {cooling_schedule!r}, "
+                         f"expected one of {sorted(COOLING_SCHEDULES)} or CoolingSchedule object") from None
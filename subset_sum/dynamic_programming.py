@@ -0,0 +1,232 @@
+from  .subset_creator import _SubsetCreator
+import math
+import time
+
+# The largest memory (bits) of reachable sums with checkpoints, 1 GiB.
+MAX_BITSET_BITS = 2 ** 33
+
+class DynamicProgramming(_SubsetCreator):
+    """Exact algorithm which computes all sums reachable by subsets of main set. Reachable sums are stored as bits
+    of one big integer and every number of main set adds its sums with one shift and one or operation. It always
+    finds solution if one exists, and otherwise proves that no subset has searched sum."""
+
+    def __init__(self, target_sum, iterations, set_numbers, checkpoint_interval = None, time_limit = None,
+                 acceptable_gap = 0):
+        """
+
+        :param target_sum: Searched sum of numbers.
+        :type target_sum: int
+        :param iterations: Not used, exact algorithm always finishes. Kept for common interface of algorithms.
+        :type iterations: int
+        :param set_numbers: Initial set, from which we create subsets, which we search in order to find a solution.
+        :type set_numbers: set
+        :param checkpoint_interval: Every how many numbers reachable sums are remembered for rebuilding solution.
+                                    By default square root of size of main set, which limits used memory.
+        :type checkpoint_interval: int
+        :param time_limit: Maximal time of computing reachable sums (sec). When it passes, only numbers added
+                           until then are used and the closest sum of their subsets is returned.
+        :type time_limit: float
+        :param acceptable_gap: Numbers stop being added as soon as sum at most this far from searched sum is
+                               reachable. Checked at every checkpoint.
+        :type acceptable_gap: int
+        """
+        super().__init__(target_sum, iterations, set_numbers, time_limit=time_limit, acceptable_gap=acceptable_gap)
+        self.checkpoint_interval = checkpoint_interval
+        self._reachable = None
+
+    @staticmethod
+    def _add_number(reachable_sums, number):
+        """
+        The function that adds sums created by taking number to reachable sums.
+
+        :param reachable_sums: Bits of reachable sums.
+        :type reachable_sums: int
+        :param number: Added number.
+        :type number: int
+        :return: Bits of reachable sums after adding number.
+        :rtype: int
+        """
+
+        if number >= 0:
+            return reachable_sums | (reachable_sums << number)
+        return reachable_sums | (reachable_sums >> -number)
+
+    def _is_gap_reachable(self, offset, reachable_sums):
+        """
+        The function that checks if any sum at most acceptable_gap far from searched sum is reachable.
+
+        :param offset: Position of sum 0.
+        :type offset: int
+        :param reachable_sums: Bits of reachable sums.
+        :type reachable_sums: int
+        :rtype: bool
+        """
+
+        lowest_position = max(self.target_sum - self.acceptable_gap + offset, 0)
+        highest_position = self.target_sum + self.acceptable_gap + offset
+        if highest_position < lowest_position:
+            return False
+        return bool((reachable_sums >> lowest_position) & ((1 << (highest_position - lowest_position + 1)) - 1))
+
+    def _reachable_sums(self):
+        """
+        The function that computes reachable sums. Sum s is stored as bit on position s + offset, where offset is
+        the absolute value of sum of all negative numbers, so every sum has non-negative position.
+        Adding of numbers stops when time_limit passed or, at checkpoint, when sum close enough to searched sum is
+        reachable. Sets whose reachable sums with checkpoints would need more than MAX_BITSET_BITS bits are
+        refused with ValueError before any memory is allocated, because time_limit is checked only between numbers.
+
+        :return: Offset, interval between checkpoints, checkpoints, bits of reachable sums and number of
+                 added numbers.
+        :rtype: tuple
+        """
+
+        if self._reachable is None:
+            self.remove_duplicates()
+            deadline = self._search_deadline()
+            offset = -self.instance.negative_total
+            interval = self.checkpoint_interval or max(1, math.isqrt(len(self.instance)))
+            # Bits of all sums from the lowest to the highest one, kept in every checkpoint and in the last bitset.
+            width = self.instance.positive_total + offset + 1
+            needed_bits = width * (math.ceil(len(self.instance) / interval) + 1)
+            if needed_bits > MAX_BITSET_BITS:
+                raise ValueError(f"dynamic programming needs {needed_bits // 8 // 2 ** 20} MiB of reachable sums, "
+                                 f"more than {MAX_BITSET_BITS // 8 // 2 ** 20} MiB; use MeetInTheMiddle or "
+                                 f"ApproximationScheme")
+            reachable_sums = 1 << offset
+            checkpoints = []
+            added_numbers = len(self.instance)
+            for index, number in enumerate(self.values):
+                # Reading the clock is cheap compared to shift of reachable sums, the gap check is not.
+                if self._deadline_passed(deadline) or (index % interval == 0 and index > 0
+                                                       and self._is_gap_reachable(offset, reachable_sums)):
+                    added_numbers = index
+                    break
+                if index % interval == 0:
+                    checkpoints.append(reachable_sums)
+                reachable_sums = self._add_number(reachable_sums, number)
+            self._reachable = (offset, interval, checkpoints, reachable_sums, added_numbers)
+
+        return self._reachable
+
+    def _closest_reachable_position(self, offset, reachable_sums):
+        """
+        The function that finds position of reachable sum closest to searched sum.
+
+        :param offset: Position of sum 0.
+        :type offset: int
+        :param reachable_sums: Bits of all reachable sums.
+        :type reachable_sums: int
+        :return: Position of closest reachable sum.
+        :rtype: int
+        """
+
+        target_position = self.target_sum + offset
+        candidates = []
+        lowest_position = max(target_position, 0)
+        above = reachable_sums >> lowest_position
+        if above:
+            candidates.append(lowest_position + (above & -above).bit_length() - 1)
+        if target_position >= 0:
+            below = reachable_sums & ((1 << (target_position + 1)) - 1)
+            if below:
+                candidates.append(below.bit_length() - 1)
+
+        return min(candidates, key=lambda position: abs(position - target_position))
+
+    def is_reachable(self):
+        """
+        The function that checks if any subset of main set has searched sum.
+
+        :return: True if solution exists. None when computing was stopped by time_limit or acceptable_gap
+                 before searched sum became reachable, so the answer is not known.
+        :rtype: bool
+        """
+
+        if not self.instance.is_in_range(self.target_sum):
+            return False
+        try:
+            offset, interval, checkpoints, reachable_sums, added_numbers = self._reachable_sums()
+        except TypeError:
+            print("TypeError: incorrect type for 'set_numbers' ")
+            return None
+        target_position = self.target_sum + offset
+        if target_position >= 0 and (reachable_sums >> target_position) & 1:
+            return True
+        if added_numbers < len(self.instance):
+            return None
+        return False
+
+    def search_solution(self):
+        """
+        The function that search for solution. When no subset has searched sum, the subset with closest sum is
+        returned.
+
+        :return: Found solution.
+        :rtype: list
+        """
+
+        closest_subset = self._closest_subset_out_of_range()
+        if closest_subset is not None:
+            return closest_subset
+        try:
+            offset, interval, checkpoints, reachable_sums, added_numbers = self._reachable_sums()
+        except TypeError:
+            print("TypeError: incorrect type for 'set_numbers' ")
+            return None
+
+        position = self._closest_reachable_position(offset, reachable_sums)
+        taken = []
+        for block in reversed(range(len(checkpoints))):
+            start = block * interval
+            block_numbers = self.values[start:min(start + interval, added_numbers)]
+            block_sums = [checkpoints[block]]
+            for number in block_numbers[:-1]:
+                block_sums.append(self._add_number(block_sums[-1], number))
+
+            for number, sums_before in zip(reversed(block_numbers), reversed(block_sums)):
+                if not (sums_before >> position) & 1:
+                    taken.append(number)
+                    position -= number
+
+        taken.reverse()
+        return taken
+
+    def execution_time(self):
+        """
+        The function that return execution time for search of solution (sec).
+
+        :return: Time execution of search of solution.
+        :rtype: str
+        """
+
+        start_time = time.perf_counter()
+        self._reachable = None
+        self.search_solution()
+        formatted_time = "{:.9f}".format(time.perf_counter() - start_time)
+        return formatted_time
+
+    def how_algorithm_works(self):
+        """
+        The function that display description how dynamic programming works for subset sum problem.
+        """
+
+        print("""
+        Start arguments: main_set = {5, -1, 2} , sum_to_find = 4
+
+        1. Reachable sums are bits of one big number. At the start only sum 0 (empty subset) is reachable.
+            Negative sums are moved by offset = 1 (absolute value of sum of negative numbers),
+            so sum s is bit on position s + 1.
+
+        2. Every number adds new sums: reachable | (reachable shifted by number).
+                start:        {0}
+                after 5:      {0, 5}
+                after -1:     {-1, 0, 4, 5}
+                after 2:      {-1, 0, 1, 2, 4, 5, 6, 7}
+
+        3. Sum 4 is reachable, so solution exists. To find it we go back through numbers:
+            4 was not reachable before 2 was added? It was ({-1, 0, 4, 5}), so 2 is not taken.
+            4 was not reachable before -1 was added ({0, 5}), so -1 is taken and we look for 4 - (-1) = 5.
+            5 was not reachable before 5 was added ({0}), so 5 is taken and we look for 0, the empty subset.
+            Solution: [5, -1]
+        """)
@@ -0,0 +1,411 @@
+import time
+from bisect import bisect_left, bisect_right
+from itertools import accumulate
+import numpy as np
+from .search_statistics import GOAL_EVALUATIONS, NEIGHBOURS_GENERATED, ACCEPTED_MOVES, IMPROVEMENTS
+from .subset_creator import _SubsetCreator, SolutionUpdate
+
+class GeneticAlgorithm(_SubsetCreator):
+
+    def __init__(self, target_sum, iterations, set_numbers, start_population_size, compact_subsets = False,
+                 vectorized = False, selection = "roulette", tournament_size = 2, time_limit = None,
+                 acceptable_gap = 0, seed = None, start_strategy = "random"):
+        """
+
+        :param target_sum: Searched sum of numbers.
+        :type target_sum: int
+        :param iterations: Number of generations.
+        :type iterations: int
+        :param set_numbers: Initial set, from which we create subsets, which we search in order to find a solution.
+        :type set_numbers: set
+        :param start_population_size: Number of individuals in population.
+        :type start_population_size: int
+        :param compact_subsets: Individuals are stored as CompactSubset (one byte per number) instead of lists.
+        :type compact_subsets: bool
+        :param vectorized: Population is stored as numpy matrix (one row per individual) and all genetic
+                           operations are performed on whole matrix at once.
+        :type vectorized: bool
+        :param selection: Selection operator: "roulette", "stochastic_universal" or "tournament".
+        :type selection: str
+        :param tournament_size: Number of individuals competing in one tournament of tournament selection.
+        :type tournament_size: int
+        :param time_limit: Maximal time of search (sec), after which the last population is returned.
+                           Time is checked once per generation.
+        :type time_limit: float
+        :param acceptable_gap: Evolution stops when population contains individual with at most this many points.
+        :type acceptable_gap: int
+        :param seed: Seed of random generators, so search can be repeated.
+        :type seed: int
+        :param start_strategy: How start subsets are created: "random", "greedy", "differencing" or
+                               "restricted_greedy", see _SubsetCreator.
+        :type start_strategy: str
+        """
+        super().__init__(target_sum, iterations, set_numbers, compact_subsets, time_limit, acceptable_gap, seed,
+                         start_strategy)
+        self.start_population_size = start_population_size
+        self.vectorized = vectorized
+        self.tournament_size = tournament_size
+        selection_operators = {"roulette": self.roulette_selection,
+                               "stochastic_universal": self.stochastic_universal_selection,
+                               "tournament": self.tournament_selection}
+        try:
+            self.selection = selection_operators[selection]
+        except KeyError:
+            raise ValueError(f"unknown selection operator {selection!r}, "
+                             f"expected one of {sorted(selection_operators)}") from None
+
+
+    def create_start_population(self):
+        """
+        The function that creates start population with start_strategy. "greedy" and "differencing" create
+        the same individual every time, so individuals differ only after mutation; "restricted_greedy" creates
+        different individuals close to searched sum.
+
+        :return: Start population.
+        :rtype: list or numpy.ndarray
+        """
+
+        if self.vectorized:
+            self.remove_duplicates()
+            if self.start_strategy != "random":
+                return np.array([self.create_start_subset() for i in range(self.start_population_size)],
+                                dtype=np.uint8).reshape(self.start_population_size, len(self.instance))
+            return self.rng.integers(0, 2, size=(self.start_population_size, len(self.instance)), dtype=np.uint8)
+
+        population = []
+        for i in range(self.start_population_size):
+            individual = self.create_start_subset()
+            population.append(individual)
+
+        return population
+
+    def _population_sums(self, population, block_size = 256):
+        """
+        The function that return sums of all individuals of population stored as numpy matrix. Rows are
+        multiplied in blocks, in floating point when every possible sum is exactly representable, in int64 when
+        every possible sum fits into it, otherwise sums are exact Python ints (object array).
+
+        :param population: Population, one individual per row.
+        :type population: numpy.ndarray
+        :param block_size: Number of rows converted at once.
+        :type block_size: int
+        :return: Sums of individuals.
+        :rtype: numpy.ndarray
+        """
+
+        values = self.values_array
+        # Every sum, and every partial sum of matrix product, lies between the totals, which are exact ints.
+        sums_range = self.instance.positive_total - self.instance.negative_total
+        if sums_range > np.iinfo(np.int64).max:
+            return np.array([self.sum_of_subset(individual) for individual in population], dtype=object)
+        if sums_range < 2 ** 53:
+            values = values.astype(np.float64)
+        sums = np.empty(len(population), dtype=np.int64)
+        for start in range(0, len(population), block_size):
+            block = population[start:start + block_size].astype(values.dtype)
+            sums[start:start + block_size] = block @ values
+        return sums
+
+    def fitness(self, population):
+        if self.statistics is not None:
+            self.statistics.counters[GOAL_EVALUATIONS] += len(population)
+
+        if isinstance(population, np.ndarray):
+            return np.abs(self._population_sums(population) - self.target_sum)
+
+        rating = []
+        for i in range(len(population)):
+            points = abs(self.sum_of_subset(population[i]) - self.target_sum)
+            rating.append(points)
+
+        return rating
+
+    def rescaling_rating(self, rating):
+        sum_rating = sum(rating)
+        new_rating = []
+        for i in range(len(rating)):
+            new_rating.append(sum_rating-rating[i])
+
+        return new_rating
+
+    @staticmethod
+    def _cumulative_rescaled_rating(rating):
+        """
+        The function that return cumulative sums of rescaled points of population stored as numpy array, like
+        accumulate(rescaling_rating(rating)). They are int64 when no cumulative sum can overflow it, otherwise
+        float64, which is precise enough for choosing individuals.
+
+        :param rating: Points of individuals.
+        :type rating: numpy.ndarray
+        :rtype: numpy.ndarray
+        """
+
+        # Every rescaled point is at most the sum of points, so cumulative sums are at most len(rating) times it.
+        if int(rating.max()) * len(rating) ** 2 > np.iinfo(np.int64).max:
+            rating = rating.astype(np.float64)
+        return np.cumsum(rating.sum() - rating)
+
+    def roulette_selection(self, population, rating = None):
+        if rating is None:
+            rating = self.fitness(population)
+        if isinstance(population, np.ndarray):
+            cumulative_rating = self._cumulative_rescaled_rating(rating)
+            if cumulative_rating.dtype == np.float64:
+                random_individual_numbers = self.rng.uniform(0, cumulative_rating[-1], len(population))
+            else:
+                random_individual_numbers = self.rng.integers(0, cumulative_rating[-1], len(population),
+                                                              endpoint=True)
+            return population[np.searchsorted(cumulative_rating, random_individual_numbers)]
+
+        new_population = []
+        cumulative_rating = list(accumulate(self.rescaling_rating(rating)))
+        population_points = cumulative_rating[-1]
+
+        for i in range(len(population)):
+            random_individual_number = self.random.randint(0, population_points)
+            index = bisect_left(cumulative_rating, random_individual_number)
+            new_population.append(population[index])
+
+        return new_population
+
+    def stochastic_universal_selection(self, population, rating = None):
+        """
+        The function that selects individuals with one spin of roulette with equally spaced pointers,
+        so every individual is selected close to its expected number of times. Time is O(P log P).
+
+        :param population: Population from which individuals are selected.
+        :type population: list or numpy.ndarray
+        :param rating: Points of individuals of population, computed when not given.
+        :type rating: list or numpy.ndarray
+        :return: Selected population.
+        :rtype: list or numpy.ndarray
+        """
+
+        if rating is None:
+            rating = self.fitness(population)
+        if isinstance(population, np.ndarray):
+            cumulative_rating = self._cumulative_rescaled_rating(rating)
+            population_points = cumulative_rating[-1]
+            if population_points == 0:
+                return population.copy()
+            pointer_distance = population_points / len(population)
+            pointers = self.rng.uniform(0, pointer_distance) + pointer_distance * np.arange(len(population))
+            return population[np.searchsorted(cumulative_rating, pointers, side="right")]
+
+        cumulative_rating = list(accumulate(self.rescaling_rating(rating)))
+        population_points = cumulative_rating[-1]
+        if population_points == 0:
+            return list(population)
+
+        pointer_distance = population_points / len(population)
+        start_pointer = self.random.uniform(0, pointer_distance)
+        new_population = []
+        index = 0
+        for i in range(len(population)):
+            pointer = start_pointer + i * pointer_distance
+            index = bisect_right(cumulative_rating, pointer, index)
+            new_population.append(population[index])
+
+        return new_population
+
+    def tournament_selection(self, population, rating = None):
+        """
+        The function that selects every individual as the best of tournament_size randomly drawn individuals.
+        Time is O(P * tournament_size).
+
+        :param population: Population from which individuals are selected.
+        :type population: list or numpy.ndarray
+        :param rating: Points of individuals of population, computed when not given.
+        :type rating: list or numpy.ndarray
+        :return: Selected population.
+        :rtype: list or numpy.ndarray
+        """
+
+        if rating is None:
+            rating = self.fitness(population)
+
+        if isinstance(population, np.ndarray):
+            competitors = self.rng.integers(0, len(population), size=(len(population), self.tournament_size))
+            winners = np.argmin(rating[competitors], axis=1)
+            return population[competitors[np.arange(len(population)), winners]]
+
+        new_population = []
+        for i in range(len(population)):
+            competitors = [self.random.randrange(len(population)) for j in range(self.tournament_size)]
+            winner = min(competitors, key=rating.__getitem__)
+            new_population.append(population[winner])
+
+        return new_population
+
+    def crossbreeding_population(self, new_population):
+        if isinstance(new_population, np.ndarray):
+            crossbreeding_population = new_population.copy()
+            pairs_count = len(new_population) // 2
+            genes_count = new_population.shape[1]
+            if genes_count < 2:
+                return crossbreeding_population
+            first_parents = new_population[0:2 * pairs_count:2]
+            second_parents = new_population[1:2 * pairs_count:2]
+            dividers = self.rng.integers(1, genes_count, pairs_count)
+            # Genes from divider onwards are swapped between parents.
+            swap_mask = np.arange(genes_count) >= dividers[:, None]
+            crossbreeding_population[0:2 * pairs_count:2] = np.where(swap_mask, second_parents, first_parents)
+            crossbreeding_population[1:2 * pairs_count:2] = np.where(swap_mask, first_parents, second_parents)
+            return crossbreeding_population
+
+        crossbreeding_population = []
+        for i in range(0, len(new_population), 2):
+            first_parent = new_population[i]
+            second_parent = new_population[i + 1]
+            divider = self.random.randint(1, len(first_parent)-1)
+            first_child = first_parent[:divider] + second_parent[divider:]
+            second_child = second_parent[:divider] + first_parent[divider:]
+            crossbreeding_population.append(first_child)
+            crossbreeding_population.append(second_child)
+        return crossbreeding_population
+
+    def mutation(self, population, probability):
+        if isinstance(population, np.ndarray):
+            # Every gene mutates with probability 1 / (probability + 1), so gaps between mutated genes
+            # of flattened population are geometric and only mutated positions have to be drawn.
+            genes = population.reshape(-1)
+            chance = 1 / (probability + 1)
+            expected = genes.size * chance
+            gaps = self.rng.geometric(chance, int(expected + 6 * expected ** 0.5) + 16)
+            positions = np.cumsum(gaps) - 1
+            while positions[-1] < genes.size:
+                more_gaps = self.rng.geometric(chance, len(gaps))
+                positions = np.concatenate((positions, positions[-1] + np.cumsum(more_gaps)))
+            genes[positions[positions < genes.size]] ^= 1
+            return population
+
+        for i in range(len(population)):
+            for j in range(len(population[i])):
+                number = self.random.randint(0, probability)
+                if number == 0 and population[i][j] == 1:
+                    population[i][j] = 0
+                elif number == 0 and population[i][j] == 0:
+                    population[i][j] = 1
+
+        return population
+
+    def _next_generation(self, population, rating = None):
+        """
+        The function that creates next generation with selection, crossbreeding and mutation.
+
+        :param population: Current population.
+        :type population: list or numpy.ndarray
+        :param rating: Points of individuals of current population, computed when not given.
+        :type rating: list or numpy.ndarray
+        :return: Next population.
+        :rtype: list or numpy.ndarray
+        """
+
+        phase_start = self._phase_start()
+        selected_population = self.selection(population, rating)
+        self._phase_end("selection", phase_start)
+        phase_start = self._phase_start()
+        crossed_population = self.crossbreeding_population(selected_population)
+        self._phase_end("crossbreeding", phase_start)
+        phase_start = self._phase_start()
+        mutated_population = self.mutation(crossed_population, 100)
+        self._phase_end("mutation", phase_start)
+        return mutated_population
+
+    def search_solution(self):
+
+        return self._run_search(self._search_population(False))
+
+    def _search_population(self, report_improvements):
+        """
+        The function that evolves population and yields best individual of generation whenever it is better than
+        all individuals before, when report_improvements is True. Evolution stops earlier when population contains
+        individual with at most acceptable_gap points or when time_limit passes. Every child is counted as
+        generated neighbor and accepted move, because it replaces its parents in next generation, and every
+        generation whose best individual is better than all before is counted as improvement.
+
+        :param report_improvements: Yield new best solutions.
+        :type report_improvements: bool
+        :return: Last population.
+        :rtype: list or numpy.ndarray
+        """
+
+        search_start = time.perf_counter()
+        deadline = self._search_deadline()
+        best_points = None
+        counters = self.statistics.counters if self.statistics is not None else None
+        phase_start = self._phase_start()
+        new_population = self.create_start_population()
+        self._phase_end("start", phase_start)
+        for i in range(self.iterations + 2):
+            # Rating of generation is used by selection of next generation, so it is computed only once.
+            rating = self.fitness(new_population)
+            best_individual_index = int(np.argmin(rating))
+            generation_points = int(rating[best_individual_index])
+            if best_points is None or generation_points < best_points:
+                if best_points is not None:
+                    if counters is not None:
+                        counters[IMPROVEMENTS] += 1
+                    if self.observers:
+                        self._notify("improvement", points=generation_points, iteration=i)
+                best_points = generation_points
+                if report_improvements:
+                    yield SolutionUpdate(self.convert_subset_into_decimal(new_population[best_individual_index]),
+                                         best_points, time.perf_counter() - search_start)
+            if (i == self.iterations + 1 or generation_points <= self.acceptable_gap
+                    or self._deadline_passed(deadline)):
+                break
+            new_population = self._next_generation(new_population, rating)
+            if counters is not None:
+                counters[NEIGHBOURS_GENERATED] += len(new_population)
+                counters[ACCEPTED_MOVES] += len(new_population)
+        if self.observers:
+            self._notify("finished", points=generation_points, statistics=self.statistics)
+        return new_population
+
+    def _search(self, report_improvements):
+        """
+        The function that search for best individual and yields every better individual when
+        report_improvements is True.
+
+        :param report_improvements: Yield new best solutions.
+        :type report_improvements: bool
+        :return: Best found solution.
+        :rtype: list
+        """
+
+        population = yield from self._search_population(report_improvements)
+        rating = self.fitness(population)
+        return self.convert_subset_into_decimal(population[int(np.argmin(rating))])
+
+    def search_for_best_individual(self):
+        population = self.search_solution()
+        rating = self.fitness(population)
+        best_individual_index = int(np.argmin(rating))
+
+        return self.convert_subset_into_decimal(population[best_individual_index])
+
+    def execution_time(self):
+        """
+        The function that return execution time for search of solution (sec).
+
+        :return: Time execution of search of solution.
+        :rtype: str
+        """
+
+        start_time = time.perf_counter()
+        self.search_solution()
+        formatted_time = "{:.9f}".format(time.perf_counter() - start_time)
+        return formatted_time
+
+
+
+
+
+
+
+
+
+
+
+
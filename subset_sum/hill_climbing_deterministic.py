@@ -0,0 +1,375 @@
+from  .subset_creator import _SubsetCreator, SolutionUpdate, DEADLINE_CHECK_INTERVAL
+import time
+import numpy as np
+from .search_statistics import GOAL_EVALUATIONS, NEIGHBOURS_GENERATED, ACCEPTED_MOVES, REJECTED_MOVES, IMPROVEMENTS
+
+class HillClimbingDeterministic(_SubsetCreator):
+    """Hill climbing is a simple optimization algorithm used to find the best possible solution. It always chooses
+       the best neighboring solutions."""
+
+    def __init__(self, target_sum, iterations, set_numbers, end_in_optimum = False, display_steps = False,
+                 implicit_neighbours = False, compact_subsets = False, time_limit = None, acceptable_gap = 0,
+                 seed = None, start_strategy = "random", use_swap_moves = False):
+        """
+
+        :param target_sum: Searched sum of numbers.
+        :type target_sum: int
+        :param iterations: Number of algorithm executions.
+        :type iterations: int
+        :param set_numbers: Initial set, from which we create subsets, which we search in order to find a solution.
+        :type set_numbers: set
+        :param end_in_optimum: The algorithm terminates working when is at the optimum of the function.
+        :type end_in_optimum: bool
+        :param display_steps: Allows to display the steps that the algorithm performs in order to find
+               solutions. Not recommended due to the huge amount of displayed information.
+        :type display_steps: bool
+        :param implicit_neighbours: Scores all neighboring solutions at once with vectorized sums of changes,
+               without creating lists of neighbors. The best change is applied in place.
+        :type implicit_neighbours: bool
+        :param compact_subsets: Subsets are stored as CompactSubset (one byte per number) instead of lists.
+        :type compact_subsets: bool
+        :param time_limit: Maximal time of search (sec), after which the best solution found so far is returned.
+               Time is checked once per iteration and, while neighbors are scored, once per
+               DEADLINE_CHECK_INTERVAL neighbors.
+        :type time_limit: float
+        :param acceptable_gap: Search stops when solution with at most this many points is found.
+        :type acceptable_gap: int
+        :param seed: Seed of random generators, so search can be repeated.
+        :type seed: int
+        :param start_strategy: How start subsets are created: "random", "greedy", "differencing" or
+                               "restricted_greedy", see _SubsetCreator.
+        :type start_strategy: str
+        :param use_swap_moves: When no neighbor is better than current subset, search also for swap of one
+                               number of subset for one number outside of it which gives exactly searched sum,
+                               see find_closing_swap().
+        :type use_swap_moves: bool
+        """
+        super().__init__(target_sum, iterations, set_numbers, compact_subsets, time_limit, acceptable_gap, seed,
+                         start_strategy)
+        self.end_in_optimum = end_in_optimum
+        self.display_steps = display_steps
+        self.implicit_neighbours = implicit_neighbours
+        self.use_swap_moves = use_swap_moves
+
+    def search_solution(self):
+        """
+        The function that search for best solution.
+
+        :return: Best found solution.
+        :rtype: list
+        """
+
+        return self._run_search(self._search(False))
+
+    def _search(self, report_improvements):
+        """
+        The function that search for best solution and yields every better solution when report_improvements
+        is True.
+
+        :param report_improvements: Yield new best solutions.
+        :type report_improvements: bool
+        :return: Best found solution.
+        :rtype: list
+        """
+
+        if self.implicit_neighbours:
+            return (yield from self._search_implicit(report_improvements))
+
+        search_start = time.perf_counter()
+        deadline = self._search_deadline()
+        phase_start = self._phase_start()
+        start_subset = self.create_start_subset()
+        iter_count = 1
+        best_subset_sum = self.sum_of_subset(start_subset)
+        best_subset_points = self.points_of_sum(best_subset_sum)
+        best_solution = []
+        best_subset = start_subset.copy()
+        counters = self.statistics.counters if self.statistics is not None else None
+        if counters is not None:
+            counters[GOAL_EVALUATIONS] += 1
+        self._phase_end("start", phase_start)
+        if report_improvements:
+            yield SolutionUpdate(self.convert_subset_into_decimal(best_subset), best_subset_points,
+                                 time.perf_counter() - search_start)
+        phase_start = self._phase_start()
+
+        if self.display_steps:
+                print(f"Iter: {iter_count} start subset: {best_subset} start subset points: "
+                      f" {best_subset_points}")
+
+        try:
+            while iter_count <= self.iterations:
+                if best_subset_points <= self.acceptable_gap or self._deadline_passed(deadline):
+                    best_solution = self.convert_subset_into_decimal(best_subset)
+                    break
+                best_solution_copy = best_solution.copy()
+                parent_subset = best_subset
+                parent_sum = best_subset_sum
+                parent_points = best_subset_points
+                best_index, scored_neighbours = self._score_neighbours(parent_subset, parent_sum, iter_count,
+                                                                       deadline)
+                if best_index is not None:
+                    best_subset = parent_subset.copy()
+                    self.flip(best_subset, best_index)
+                    best_subset_sum = self.flip_sum(parent_subset, parent_sum, best_index)
+                    best_subset_points = self.points_of_sum(best_subset_sum)
+
+                if self.use_swap_moves and best_subset_points >= parent_points:
+                    swap = self.find_closing_swap(best_subset, best_subset_sum)
+                    if swap is not None:
+                        best_subset = best_subset.copy()
+                        best_subset_sum = self.apply_swap(best_subset, best_subset_sum, swap)
+                        best_subset_points = self.points_of_sum(best_subset_sum)
+
+                iter_count += 1
+                if counters is not None:
+                    counters[NEIGHBOURS_GENERATED] += scored_neighbours - 1
+                    counters[GOAL_EVALUATIONS] += scored_neighbours
+                    counters[REJECTED_MOVES if best_subset is parent_subset else ACCEPTED_MOVES] += 1
+                    if best_subset_points < parent_points:
+                        counters[IMPROVEMENTS] += 1
+                if self.observers and best_subset_points < parent_points:
+                    self._notify("improvement", points=best_subset_points, iteration=iter_count - 1)
+                if report_improvements and best_subset_points < parent_points:
+                    yield SolutionUpdate(self.convert_subset_into_decimal(best_subset), best_subset_points,
+                                         time.perf_counter() - search_start)
+
+                if self.display_steps:
+                    print("\n")
+
+                best_solution = self.convert_subset_into_decimal(best_subset)
+
+                if self.end_in_optimum:
+                    if best_solution_copy == best_solution:
+                        break
+
+            self._phase_end("search", phase_start)
+            if self.observers:
+                self._notify("finished", points=best_subset_points, statistics=self.statistics)
+            return best_solution
+
+        except TypeError:
+            print("TypeError: incorrect type of parameter for HillClimbingDeterministic()")
+
+
+    def _score_neighbours(self, parent_subset, parent_sum, iter_count, deadline):
+        """
+        The function that scores neighbors of subset without creating n copies of subset, and checks deadline
+        while scoring, so search with time limit stops in time also for large sets. When deadline passes, the best
+        of already scored neighbors is chosen.
+
+        :param parent_subset: Subset whose neighbors are scored.
+        :type parent_subset: list
+        :param parent_sum: Sum of numbers of parent_subset.
+        :type parent_sum: int
+        :param iter_count: Number of iteration, for display of steps.
+        :type iter_count: int
+        :param deadline: Deadline of search, None when search has no time limit.
+        :type deadline: float
+        :return: Position changed by the best neighbor (None when no neighbor is as good as parent_subset) and
+                 number of scored subsets including parent_subset.
+        :rtype: tuple
+        """
+
+        best_index = None
+        best_points = self.points_of_sum(parent_sum)
+        deadline_countdown = DEADLINE_CHECK_INTERVAL
+        scored_neighbours = 1
+        for index in range(len(parent_subset)):
+            deadline_countdown -= 1
+            if deadline_countdown == 0 and deadline is not None:
+                if self._deadline_passed(deadline):
+                    break
+                deadline_countdown = DEADLINE_CHECK_INTERVAL
+            current_subset_points = self.points_of_sum(self.flip_sum(parent_subset, parent_sum, index))
+            scored_neighbours += 1
+            # The last neighbor with the lowest points wins.
+            if current_subset_points <= best_points:
+                best_index = index
+                best_points = current_subset_points
+            if self.display_steps:
+                neighbor = parent_subset.copy()
+                self.flip(neighbor, index)
+                print(f"Iter: {iter_count} current subset: {neighbor}, current subset points: "
+                      f"{current_subset_points}, best_subset points: {best_points}")
+
+        return best_index, scored_neighbours
+
+    def _search_implicit(self, report_improvements):
+        """
+        The function that search for best solution without creating lists of neighbors. Points of all neighbors
+        are computed as abs(target_sum - (subset_sum +/- value)) in one vectorized operation, and the neighbor
+        with the lowest points is created by changing one position of current subset.
+
+        :param report_improvements: Yield new best solutions.
+        :type report_improvements: bool
+        :return: Best found solution.
+        :rtype: list
+        """
+
+        search_start = time.perf_counter()
+        deadline = self._search_deadline()
+        phase_start = self._phase_start()
+        best_subset = self.create_start_subset()
+        values = self.values_array
+        signs = 1 - 2 * np.array(best_subset, dtype=np.int64)
+        neighbours_points = np.empty(len(values), dtype=np.int64)
+        reversed_points = neighbours_points[::-1]
+        best_subset_sum = self.sum_of_subset(signs < 0)
+        best_subset_points = self.points_of_sum(best_subset_sum)
+        iter_count = 1
+        counters = self.statistics.counters if self.statistics is not None else None
+        if counters is not None:
+            counters[GOAL_EVALUATIONS] += 1
+        self._phase_end("start", phase_start)
+        if report_improvements:
+            yield SolutionUpdate(self.convert_subset_into_decimal(signs < 0), best_subset_points,
+                                 time.perf_counter() - search_start)
+        phase_start = self._phase_start()
+
+        if self.display_steps:
+                print(f"Iter: {iter_count} start subset: {best_subset} start subset points: "
+                      f" {best_subset_points}")
+
+        if len(values) == 0:
+            return []
+
+        while iter_count <= self.iterations:
+            if best_subset_points <= self.acceptable_gap or self._deadline_passed(deadline):
+                break
+            np.multiply(signs, values, out=neighbours_points)
+            neighbours_points += best_subset_sum - self.target_sum
+            np.abs(neighbours_points, out=neighbours_points)
+            # The last neighbor with the lowest points wins, like in the scan of the list of neighbors.
+            change_index = len(values) - 1 - int(reversed_points.argmin())
+            current_subset_points = int(neighbours_points[change_index])
+            iter_count += 1
+            if counters is not None:
+                counters[GOAL_EVALUATIONS] += len(values)
+
+            parent_points = best_subset_points
+            moved = current_subset_points <= best_subset_points
+            if moved:
+                best_subset_sum += int(signs[change_index] * values[change_index])
+                best_subset_points = current_subset_points
+                self.flip(best_subset, change_index)
+                signs[change_index] = -signs[change_index]
+
+            # Like in search with list of neighbors, swap is searched also when the best neighbor is only as good
+            # as current subset.
+            if self.use_swap_moves and best_subset_points >= parent_points:
+                swap = self.find_closing_swap(best_subset, best_subset_sum)
+                if swap is not None:
+                    best_subset_sum = self.apply_swap(best_subset, best_subset_sum, swap)
+                    best_subset_points = self.points_of_sum(best_subset_sum)
+                    for index in swap:
+                        signs[index] = -signs[index]
+                    moved = True
+
+            improved = best_subset_points < parent_points
+            if counters is not None:
+                counters[ACCEPTED_MOVES if moved else REJECTED_MOVES] += 1
+                if improved:
+                    counters[IMPROVEMENTS] += 1
+            if not moved:
+                if self.end_in_optimum:
+                    break
+                continue
+            if self.observers and improved:
+                self._notify("improvement", points=best_subset_points, iteration=iter_count - 1)
+            if report_improvements and improved:
+                yield SolutionUpdate(self.convert_subset_into_decimal(signs < 0), best_subset_points,
+                                     time.perf_counter() - search_start)
+
+            if self.display_steps:
+                print(f"Iter: {iter_count - 1} changed position: {change_index}, best_subset points: "
+                      f"{best_subset_points}, best subset: {best_subset}")
+
+        self._phase_end("search", phase_start)
+        phase_start = self._phase_start()
+        best_solution = self.convert_subset_into_decimal(signs < 0)
+        self._phase_end("decode", phase_start)
+        if self.observers:
+            self._notify("finished", points=best_subset_points, statistics=self.statistics)
+        return best_solution
+
+    def execution_time(self):
+        """
+        The function that return execution time for search of solution (sec).
+
+        :return: Time execution of search of solution.
+        :rtype: str
+        """
+
+        start_time = time.perf_counter()
+        self.search_solution()
+        formatted_time = "{:.9f}".format(time.perf_counter() - start_time)
+        return formatted_time
+
+    def how_algorithm_works(self):
+        """
+        The function that display description how hill climbing deterministic version works for subset sum problem.
+        """
+
+        print("""
+        Start arguments: main_set = {5, 1, 2, 3, 4} , sum_to_find = 5
+        
+        All duplicates of numbers are removing from main set!!!!
+        
+        1. We create first subset which contains random 0 and 1 numbers, for example [0, 1, 0, 1, 1] 
+            (list have always same length as 'main_set').
+            [0, 1, 0, 1, 1] is the subset from which the computation will start. 
+           
+            What does 0 and 1 numbers means ?
+           
+                1 is information for algorithm that number will be taken for our computation.
+                0 is information for algorithm that number will not be taken for our computation.
+                That's mean subset [0, 1, 0, 1, 1] contains decimal numbers [1, 3, 4], because:
+                
+                {5, 1, 2, 3, 4}
+                [0, 1, 0, 1, 1]  = [1, 3, 4]
+        
+        2. When we have subset [0, 1, 0, 1, 1] , we can create neighboring solutions 
+            (amount of neighbours is always same as length of subset).
+           
+            Neighboring solution is a subset that have one change of 0 or 1 number from original subset. 
+            (in this case we modify subset [0, 1, 0, 1, 1] ). 
+           
+            So first neighboring solution for [0, 1, 0, 1, 1] is [1, 1, 0, 1, 1], 
+            because we change 0 (on x position [x, 1, 0, 1, 1]) from [0, 1, 0, 1, 1] to 1 
+           
+            The second neighboring solution is change on next position from [0, 1, 0, 1, 1], so next neighbor change is:
+                [0, 1, 0, 1, 1] -> [0, 0, 0, 1, 1]
+                
+                all neighboring solutions for [0, 1, 0, 1, 1]:
+                                              [1, 1, 0, 1, 1] -> {5, 1, 3, 4}
+                                              [0, 0, 0, 1, 1] -> {3, 4}
+                                              [0, 1, 1, 1, 1] -> {1, 2, 3, 4}
+                                              [0, 1, 0, 0, 1] -> {1, 4}
+                                              [0, 1, 0, 1, 0] -> {1, 3}
+                                  
+            so we have nested list which that contains all neighboring solutions.
+           
+        3. Now we search for best solution in our list of neighbors.
+            Every neighbor must be rated, to do it we use formula:
+                points = abs(sum_to_find - sum_of_current_neighbor) 
+                
+            That's mean the best neighboring solution is that with the lowest points (I know it sounds weird).
+           
+            For example:
+            
+                Start arguments: main_set = {5, 1, 2, 3, 4} , sum_to_find = 5 
+                random subset from which we start the search [0, 1, 0, 1, 1] -> {1, 3, 5} -> points = abs(5 - 9) = 4
+                                                             [1, 1, 0, 1, 1] -> {5, 1, 3, 4} -> points = abs(5 - 13) = 8 
+                                                             [0, 0, 0, 1, 1] -> {3, 4} -> points = abs(5 - 7) = 2 
+                                                             [0, 1, 1, 1, 1] -> {1, 2, 3, 4} -> points = abs(5 - 10) = 5
+                                                             [0, 1, 0, 0, 1] -> {1, 4} -> points = abs(5 - 5) = 0 
+                                                             [0, 1, 0, 1, 0] -> {1, 3} -> points = abs(5 - 1) = 1 
+                                         
+                We can see that the best solution is subset with 0 points {1,4} so this is solution, 
+                that we exactly needed, so program stops execution.
+                
+                if we do not find searched solution, is selected neighboring solution with the lowest points
+                and we back to point 2 to create new neighboring solution using selected solution.
+                The action is performed as many times as we specify iterations.
+        """)
\ No newline at end of file
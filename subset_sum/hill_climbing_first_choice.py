@@ -1,7 +1,6 @@
-from  subset_creator import _SubsetCreator
-import random
+from  .subset_creator import _SubsetCreator, SolutionUpdate, DEADLINE_CHECK_INTERVAL
 import time
-import math
+from .search_statistics import GOAL_EVALUATIONS, NEIGHBOURS_GENERATED, ACCEPTED_MOVES, REJECTED_MOVES, IMPROVEMENTS
 
 class HillClimbingFirstChoice(_SubsetCreator):
     """First-Choice Hill Climbing is an optimization algorithm used to find approximate solutions to optimization
@@ -9,7 +8,9 @@ class HillClimbingFirstChoice(_SubsetCreator):
     search space and avoid getting trapped in local optima. The algorithm starts from random initial solutions
     and iteratively moves towards better solutions, making the first improving move it encounters."""
 
-    def __init__(self, target_sum, iterations, set_numbers, display_steps = False, max_neighbor_iterations = 100):
+    def __init__(self, target_sum, iterations, set_numbers, display_steps = False, max_neighbor_iterations = 100,
+                 compact_subsets = False, time_limit = None, acceptable_gap = 0, seed = None,
+                 start_strategy = "random", use_swap_moves = False):
         """
 
         :param target_sum: Searched sum of numbers.
@@ -23,10 +24,27 @@ class HillClimbingFirstChoice(_SubsetCreator):
         :type display_steps: bool
         :param max_neighbor_iterations: Limit the number of attempts for generating neighboring solution.
         :type max_neighbor_iterations: int
+        :param compact_subsets: Subsets are stored as CompactSubset (one byte per number) instead of lists.
+        :type compact_subsets: bool
+        :param time_limit: Maximal time of search (sec), after which the best solution found so far is returned.
+        :type time_limit: float
+        :param acceptable_gap: Search stops when solution with at most this many points is found.
+        :type acceptable_gap: int
+        :param seed: Seed of random generators, so search can be repeated.
+        :type seed: int
+        :param start_strategy: How start subsets are created: "random", "greedy", "differencing" or
+                               "restricted_greedy", see _SubsetCreator.
+        :type start_strategy: str
+        :param use_swap_moves: When search stops without solution, search also for swap of one number of subset
+                               for one number outside of it which gives exactly searched sum, see
+                               find_closing_swap().
+        :type use_swap_moves: bool
         """
-        super().__init__(target_sum, iterations, set_numbers)
+        super().__init__(target_sum, iterations, set_numbers, compact_subsets, time_limit, acceptable_gap, seed,
+                         start_strategy)
         self.display_steps = display_steps
         self.max_neighbor_iterations = max_neighbor_iterations
+        self.use_swap_moves = use_swap_moves
         self.is_error = bool
 
     def _generate_random_neighbor(self, subset):
@@ -40,13 +58,7 @@ class HillClimbingFirstChoice(_SubsetCreator):
         """
 
         neighbour_solution = subset.copy()
-
-
-        change_index = random.randint(0, len(subset)-1)
-        if neighbour_solution[change_index] == 0:
-           neighbour_solution[change_index] = 1
-        else:
-            neighbour_solution[change_index] = 0
+        self.flip(neighbour_solution, self.random_flip_index(subset))
         return neighbour_solution
     def search_solution(self):
         """
@@ -56,16 +68,47 @@ class HillClimbingFirstChoice(_SubsetCreator):
         :rtype: list
         """
 
+        return self._run_search(self._search(False))
+
+    def _search(self, report_improvements):
+        """
+        The function that search for best solution and yields every better solution when report_improvements
+        is True.
 
+        :param report_improvements: Yield new best solutions.
+        :type report_improvements: bool
+        :return: Best found solution.
+        :rtype: list
+        """
+
+        search_start = time.perf_counter()
+        deadline = self._search_deadline()
+        deadline_countdown = DEADLINE_CHECK_INTERVAL
+        acceptable_gap = self.acceptable_gap
+        phase_start = self._phase_start()
         best_solution = self.create_start_subset()
-        best_solution_points = self.goal_function(best_solution)
-        neighboring_solution = self._generate_random_neighbor(best_solution)
-        neighboring_points = self.goal_function(neighboring_solution)
+        random_positions = self._random_positions()
+        best_solution_sum = self.sum_of_subset(best_solution)
+        best_solution_points = self.points_of_sum(best_solution_sum)
+        change_index = next(random_positions)
+        neighboring_sum = self.flip_sum(best_solution, best_solution_sum, change_index)
+        neighboring_points = self.points_of_sum(neighboring_sum)
         iter_count = 1
         neighboring_generator_count = 1
         runing_main_loop = True
+        counters = self.statistics.counters if self.statistics is not None else None
+        if counters is not None:
+            counters[GOAL_EVALUATIONS] += 2
+            counters[NEIGHBOURS_GENERATED] += 1
+        self._phase_end("start", phase_start)
+        if report_improvements:
+            yield SolutionUpdate(self.convert_subset_into_decimal(best_solution), best_solution_points,
+                                 time.perf_counter() - search_start)
+        phase_start = self._phase_start()
 
         if self.display_steps:
+                    neighboring_solution = best_solution.copy()
+                    self.flip(neighboring_solution, change_index)
                     print(f"Iter: {iter_count} first neighboring subset: {neighboring_solution}, "
                           f"first neighboring subset points: "
                           f"{neighboring_points}, first subset points: {best_solution_points}, "
@@ -75,26 +118,45 @@ class HillClimbingFirstChoice(_SubsetCreator):
             runing = True
             while runing:
 
-                if best_solution_points == 0:
+                if best_solution_points <= acceptable_gap:
                     runing_main_loop = False
                     break
 
                 elif neighboring_points < best_solution_points:
-                    best_solution = neighboring_solution
+                    self.flip(best_solution, change_index)
+                    best_solution_sum = neighboring_sum
                     best_solution_points = neighboring_points
-                    neighboring_solution = self._generate_random_neighbor(best_solution)
-                    neighboring_points = self.goal_function(neighboring_solution)
+                    change_index = next(random_positions)
+                    neighboring_sum = self.flip_sum(best_solution, best_solution_sum, change_index)
+                    neighboring_points = self.points_of_sum(neighboring_sum)
                     neighboring_generator_count = 1
                     iter_count += 1
+                    if counters is not None:
+                        counters[ACCEPTED_MOVES] += 1
+                        counters[IMPROVEMENTS] += 1
+                        counters[NEIGHBOURS_GENERATED] += 1
+                        counters[GOAL_EVALUATIONS] += 1
+                    if self.observers:
+                        self._notify("improvement", points=best_solution_points, iteration=iter_count)
+                    if report_improvements:
+                        yield SolutionUpdate(self.convert_subset_into_decimal(best_solution), best_solution_points,
+                                             time.perf_counter() - search_start)
                     if self.display_steps:
                         print("\n")
 
                 else:
-                    neighboring_solution = self._generate_random_neighbor(best_solution)
-                    neighboring_points = self.goal_function(neighboring_solution)
+                    change_index = next(random_positions)
+                    neighboring_sum = self.flip_sum(best_solution, best_solution_sum, change_index)
+                    neighboring_points = self.points_of_sum(neighboring_sum)
                     neighboring_generator_count += 1
+                    if counters is not None:
+                        counters[REJECTED_MOVES] += 1
+                        counters[NEIGHBOURS_GENERATED] += 1
+                        counters[GOAL_EVALUATIONS] += 1
 
                 if self.display_steps:
+                    neighboring_solution = best_solution.copy()
+                    self.flip(neighboring_solution, change_index)
                     self.display_search_solution_steps(iter_count, neighboring_solution, neighboring_points,
                                                        best_solution, best_solution_points)
 
@@ -107,11 +169,39 @@ class HillClimbingFirstChoice(_SubsetCreator):
                     runing_main_loop = False
                     break
 
+                if deadline is not None:
+                    deadline_countdown -= 1
+                    if deadline_countdown == 0:
+                        deadline_countdown = DEADLINE_CHECK_INTERVAL
+                        if self._deadline_passed(deadline):
+                            runing_main_loop = False
+                            break
+
+            if self.use_swap_moves and best_solution_points > acceptable_gap:
+                swap = self.find_closing_swap(best_solution, best_solution_sum)
+                if swap is not None:
+                    best_solution_sum = self.apply_swap(best_solution, best_solution_sum, swap)
+                    best_solution_points = self.points_of_sum(best_solution_sum)
+                    if counters is not None:
+                        counters[ACCEPTED_MOVES] += 1
+                        counters[IMPROVEMENTS] += 1
+                    if self.observers:
+                        self._notify("improvement", points=best_solution_points, iteration=iter_count)
+                    if report_improvements:
+                        yield SolutionUpdate(self.convert_subset_into_decimal(best_solution), best_solution_points,
+                                             time.perf_counter() - search_start)
+
+            self._phase_end("search", phase_start)
+            phase_start = self._phase_start()
             best_solution = self.convert_subset_into_decimal(best_solution)
+            self._phase_end("decode", phase_start)
 
         if self.display_steps:
             print("\n")
 
+        if self.observers:
+            self._notify("finished", points=best_solution_points, statistics=self.statistics)
+
         return best_solution
 
 
@@ -123,9 +213,9 @@ class HillClimbingFirstChoice(_SubsetCreator):
         :return: Time execution of search of solution.
         :rtype: str
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
         self.search_solution()
-        formatted_time = "{:.9f}".format(time.time() - start_time)
+        formatted_time = "{:.9f}".format(time.perf_counter() - start_time)
         return formatted_time
 
     def how_algorithm_works(self):
@@ -0,0 +1,425 @@
+from  .subset_creator import _SubsetCreator, DEADLINE_CHECK_INTERVAL
+import heapq
+import time
+import numpy as np
+
+# The largest sets of variants. Horowitz-Sahni keeps 2^22 sums of every half (about 250 MiB) for 44 numbers.
+# Schroeppel-Shamir keeps only 2^15 sums of every quarter for 60 numbers, but it joins 2^30 sums of halves, which
+# takes minutes: about 4 s for 48 numbers and 4 times more for every 4 more numbers.
+MAX_SET_SIZES = {"horowitz_sahni": 44, "schroeppel_shamir": 60}
+# The largest number of sums of halves joined at once by vectorized join.
+JOIN_CHUNK_SIZE = 2 ** 20
+
+class MeetInTheMiddle(_SubsetCreator):
+    """Exact algorithm which splits main set into parts, computes sums of all subsets of every part and joins
+    sorted sums of parts in order to find subset with searched sum. It does not depend on size of numbers,
+    so it works when numbers are too large for dynamic programming."""
+
+    def __init__(self, target_sum, iterations, set_numbers, variant = None, time_limit = None, acceptable_gap = 0):
+        """
+
+        :param target_sum: Searched sum of numbers.
+        :type target_sum: int
+        :param iterations: Not used, exact algorithm always finishes. Kept for common interface of algorithms.
+        :type iterations: int
+        :param set_numbers: Initial set, from which we create subsets, which we search in order to find a solution.
+        :type set_numbers: set
+        :param variant: "horowitz_sahni" splits set into two halves and keeps all 2^(n/2) sums of both halves
+                        in memory. "schroeppel_shamir" splits set into four quarters, keeps only 2^(n/4) sums
+                        of every quarter and creates sums of halves in ranges of their values.
+                        By default Horowitz-Sahni is used for sets up to 44 numbers. Larger sets than
+                        MAX_SET_SIZES of variant are refused with ValueError by search_solution().
+        :type variant: str
+        :param time_limit: Maximal time of joining sums of halves (sec), after which the closest sum found so far
+                           is returned.
+        :type time_limit: float
+        :param acceptable_gap: Joining stops as soon as sum at most this far from searched sum is found.
+        :type acceptable_gap: int
+        """
+        super().__init__(target_sum, iterations, set_numbers, time_limit=time_limit, acceptable_gap=acceptable_gap)
+        if variant not in (None, "horowitz_sahni", "schroeppel_shamir"):
+            raise ValueError(f"unknown variant {variant!r}, expected 'horowitz_sahni' or 'schroeppel_shamir'")
+        self.variant = variant
+        self.best_sum = None
+        self.stopped_early = False
+
+    @staticmethod
+    def _sorted_subset_sums(numbers, first_index):
+        """
+        The function that computes sorted sums of all subsets of numbers as Python ints, for sums which do not fit
+        into int64. Every sum is returned together with mask, whose bit i means that number on position i of main
+        set is taken.
+
+        :param numbers: Numbers of part of main set.
+        :type numbers: list
+        :param first_index: Position of first number of part in main set.
+        :type first_index: int
+        :return: Pairs of sum and mask sorted by sum.
+        :rtype: list
+        """
+
+        sums = [0]
+        masks = [0]
+        for index, number in enumerate(numbers, first_index):
+            bit = 1 << index
+            sums += [subset_sum + number for subset_sum in sums]
+            masks += [mask | bit for mask in masks]
+
+        return sorted(zip(sums, masks))
+
+    @staticmethod
+    def _ascending_pair_sums(first, second):
+        """
+        The function that generates sums of pairs of subsets from first and second part in ascending order.
+        Heap holds one candidate for every subset of first part, so memory is O(len(first)).
+
+        :param first: Sorted sums of first part.
+        :type first: list
+        :param second: Sorted sums of second part.
+        :type second: list
+        :return: Generator of pairs of sum and mask.
+        :rtype: generator
+        """
+
+        heap = [(first_sum + second[0][0], index, 0) for index, (first_sum, mask) in enumerate(first)]
+        heapq.heapify(heap)
+        while heap:
+            pair_sum, first_index, second_index = heap[0]
+            yield pair_sum, first[first_index][1] | second[second_index][1]
+            if second_index + 1 < len(second):
+                heapq.heapreplace(heap, (first[first_index][0] + second[second_index + 1][0],
+                                         first_index, second_index + 1))
+            else:
+                heapq.heappop(heap)
+
+    @staticmethod
+    def _descending_pair_sums(first, second):
+        """
+        The function that generates sums of pairs of subsets from first and second part in descending order.
+
+        :param first: Sorted sums of first part.
+        :type first: list
+        :param second: Sorted sums of second part.
+        :type second: list
+        :return: Generator of pairs of sum and mask.
+        :rtype: generator
+        """
+
+        last = len(second) - 1
+        heap = [(-(first_sum + second[last][0]), index, last) for index, (first_sum, mask) in enumerate(first)]
+        heapq.heapify(heap)
+        while heap:
+            negative_sum, first_index, second_index = heap[0]
+            yield -negative_sum, first[first_index][1] | second[second_index][1]
+            if second_index > 0:
+                heapq.heapreplace(heap, (-(first[first_index][0] + second[second_index - 1][0]),
+                                         first_index, second_index - 1))
+            else:
+                heapq.heappop(heap)
+
+    def _closest_pair(self, ascending, descending, deadline = None):
+        """
+        The function that joins sums of two halves with two pointers: the lower sum moves up when joined sum is
+        too small, and the higher sum moves down when it is too large. Joining stops earlier when sum at most
+        acceptable_gap far from searched sum is found or deadline passes.
+
+        :param ascending: Sums and masks of first half in ascending order.
+        :type ascending: iterator
+        :param descending: Sums and masks of second half in descending order.
+        :type descending: iterator
+        :param deadline: Time (time.perf_counter) when joining stops.
+        :type deadline: float
+        :return: Sum and mask of subset with sum closest to searched sum.
+        :rtype: tuple
+        """
+
+        low = next(ascending)
+        high = next(descending)
+        best = (low[0] + high[0], low[1] | high[1])
+        deadline_countdown = DEADLINE_CHECK_INTERVAL
+        while True:
+            pair_sum = low[0] + high[0]
+            if abs(self.target_sum - pair_sum) < abs(self.target_sum - best[0]):
+                best = (pair_sum, low[1] | high[1])
+                if abs(self.target_sum - pair_sum) <= self.acceptable_gap:
+                    self.stopped_early = pair_sum != self.target_sum
+                    return best
+            if deadline is not None:
+                deadline_countdown -= 1
+                if deadline_countdown == 0:
+                    deadline_countdown = DEADLINE_CHECK_INTERVAL
+                    if self._deadline_passed(deadline):
+                        self.stopped_early = True
+                        return best
+            if pair_sum < self.target_sum:
+                low = next(ascending, None)
+            elif pair_sum > self.target_sum:
+                high = next(descending, None)
+            else:
+                return best
+            if low is None or high is None:
+                return best
+
+    @staticmethod
+    def _sorted_part_sums(numbers):
+        """
+        The function that computes sums of all subsets of part of main set as sorted int64 array. Bit i of position
+        of sum before sorting means that number i of part is taken, so sorted order gives subsets of sums.
+
+        :param numbers: Numbers of part of main set.
+        :type numbers: list
+        :return: Sorted sums and their positions before sorting.
+        :rtype: tuple
+        """
+
+        sums = np.zeros(1, dtype=np.int64)
+        for number in numbers:
+            sums = np.concatenate((sums, sums + number))
+        order = np.argsort(sums, kind="stable")
+        return sums[order], order
+
+    @staticmethod
+    def _pair_count(first, second, lowest, highest):
+        """
+        The function that counts pairs of sums of two parts whose sum lies in range [lowest, highest).
+
+        :param first: Sorted sums of first part.
+        :type first: numpy.ndarray
+        :param second: Sorted sums of second part.
+        :type second: numpy.ndarray
+        :rtype: int
+        """
+
+        if len(first) > len(second):
+            first, second = second, first
+        return int(np.searchsorted(second, highest - first).sum() - np.searchsorted(second, lowest - first).sum())
+
+    @staticmethod
+    def _pairs_in_range(first, second, lowest, highest):
+        """
+        The function that creates all pairs of sums of two parts whose sum lies in range [lowest, highest).
+
+        :param first: Sorted sums of first part.
+        :type first: numpy.ndarray
+        :param second: Sorted sums of second part.
+        :type second: numpy.ndarray
+        :return: Sums of pairs and positions of their sums in first and in second.
+        :rtype: tuple
+        """
+
+        if len(first) > len(second):
+            # Binary search is done for every sum of the shorter part.
+            sums, second_positions, first_positions = MeetInTheMiddle._pairs_in_range(second, first, lowest, highest)
+            return sums, first_positions, second_positions
+        starts = np.searchsorted(second, lowest - first)
+        counts = np.searchsorted(second, highest - first) - starts
+        first_positions = np.repeat(np.arange(len(first)), counts)
+        # Position in second is start of range of sum of first plus position of pair in this range.
+        second_positions = np.arange(len(first_positions)) + np.repeat(starts - (np.cumsum(counts) - counts), counts)
+        return first[first_positions] + second[second_positions], first_positions, second_positions
+
+    @staticmethod
+    def _nearest_pair(first, second, value, below):
+        """
+        The function that finds pair of sums of two parts with the highest sum lower than value (below is True)
+        or with the lowest sum not lower than value.
+
+        :param first: Sorted sums of first part.
+        :type first: numpy.ndarray
+        :param second: Sorted sums of second part.
+        :type second: numpy.ndarray
+        :param value: Bound of sum.
+        :type value: int
+        :param below: Search below value.
+        :type below: bool
+        :return: Sum of pair and positions of its sums in first and in second as arrays of length 1, or empty arrays
+                 when there is no such pair.
+        :rtype: tuple
+        """
+
+        if len(first) > len(second):
+            sums, second_positions, first_positions = MeetInTheMiddle._nearest_pair(second, first, value, below)
+            return sums, first_positions, second_positions
+        second_positions = np.searchsorted(second, value - first) - below
+        valid = (second_positions >= 0) & (second_positions < len(second))
+        first_positions = np.flatnonzero(valid)
+        second_positions = second_positions[valid]
+        sums = first[first_positions] + second[second_positions]
+        if len(sums):
+            best = sums.argmax() if below else sums.argmin()
+            sums, first_positions, second_positions = (sums[best:best + 1], first_positions[best:best + 1],
+                                                       second_positions[best:best + 1])
+        return sums, first_positions, second_positions
+
+    def _closest_sum_of_halves(self, quarters, deadline = None):
+        """
+        The function that finds pair of sums of halves with sum closest to searched sum, where sum of every half is
+        sum of pair of sums of its quarters, without creating all sums of halves. Sums of first half are split into
+        ranges of values with at most JOIN_CHUNK_SIZE sums. For range [lowest, highest) only sums of second half
+        in range (target_sum - highest, target_sum - lowest], and the nearest sums around it, can be the closest,
+        so every range is joined with vectorized binary search. Every sum of halves is created once, memory is
+        O(2^(n/4) + JOIN_CHUNK_SIZE). Joining stops earlier when sum at most acceptable_gap far from searched sum is
+        found or deadline passes.
+
+        :param quarters: Sorted sums of four quarters of main set.
+        :type quarters: list
+        :param deadline: Time (time.perf_counter) when joining stops.
+        :type deadline: float
+        :return: Closest sum and positions of its sums in quarters.
+        :rtype: tuple
+        """
+
+        first, second, third, fourth = quarters
+        best_gap = best = None
+        ranges = [(int(first[0] + second[0]), int(first[-1] + second[-1]) + 1)]
+        while ranges:
+            if self._deadline_passed(deadline) and best is not None:
+                self.stopped_early = True
+                break
+            lowest, highest = ranges.pop()
+            first_count = self._pair_count(first, second, lowest, highest)
+            if first_count == 0:
+                continue
+            window = (self.target_sum - highest + 1, self.target_sum - lowest + 1)
+            if highest - lowest > 1 and max(first_count, self._pair_count(third, fourth, *window)) > JOIN_CHUNK_SIZE:
+                middle = (lowest + highest) // 2
+                ranges += [(middle, highest), (lowest, middle)]
+                continue
+
+            if highest - lowest == 1:
+                # All sums are equal, so one of them and the nearest sums around target_sum - lowest are enough.
+                first_half = self._nearest_pair(first, second, lowest, False)
+                parts = [self._nearest_pair(third, fourth, window[0], True),
+                         self._nearest_pair(third, fourth, window[0], False)]
+            else:
+                first_half = self._pairs_in_range(first, second, lowest, highest)
+                parts = [self._nearest_pair(third, fourth, window[0], True),
+                         self._pairs_in_range(third, fourth, *window),
+                         self._nearest_pair(third, fourth, window[1], False)]
+            second_sums, third_positions, fourth_positions = (np.concatenate(arrays) for arrays in zip(*parts))
+            order = np.argsort(second_sums, kind="stable")
+            second_sums = second_sums[order]
+            wanted = self.target_sum - first_half[0]
+            candidates = np.searchsorted(second_sums, wanted)
+            candidates = np.where((candidates == len(second_sums))
+                                  | ((candidates > 0) & (wanted - second_sums[candidates - 1]
+                                                         < second_sums[np.minimum(candidates, len(second_sums) - 1)]
+                                                         - wanted)),
+                                  candidates - 1, candidates)
+            gaps = np.abs(wanted - second_sums[candidates])
+            closest = int(gaps.argmin())
+            if best_gap is None or gaps[closest] < best_gap:
+                best_gap = int(gaps[closest])
+                second_position = order[candidates[closest]]
+                best = (int(first_half[0][closest] + second_sums[candidates[closest]]),
+                        (int(first_half[1][closest]), int(first_half[2][closest]),
+                         int(third_positions[second_position]), int(fourth_positions[second_position])))
+                if best_gap <= self.acceptable_gap:
+                    self.stopped_early = best_gap != 0
+                    break
+
+        return best
+
+    def search_solution(self):
+        """
+        The function that search for solution. When no subset has searched sum, the subset with closest sum is
+        returned.
+
+        :return: Found solution.
+        :rtype: list
+        """
+
+        self.remove_duplicates()
+        deadline = self._search_deadline()
+        self.stopped_early = False
+        closest_subset = self._closest_subset_out_of_range()
+        if closest_subset is not None:
+            self.best_sum = sum(closest_subset)
+            return closest_subset
+        values = self.values
+        variant = self.variant or ("horowitz_sahni" if len(values) <= MAX_SET_SIZES["horowitz_sahni"]
+                                   else "schroeppel_shamir")
+        if len(values) > MAX_SET_SIZES[variant]:
+            # Sums of halves of too large set would not fit into memory (Horowitz-Sahni) or they would be
+            # joined for hours (Schroeppel-Shamir).
+            raise ValueError(f"meet in the middle variant {variant!r} supports at most {MAX_SET_SIZES[variant]} "
+                             f"numbers, got {len(values)}; use DynamicProgramming or ApproximationScheme")
+
+        try:
+            if self.instance.positive_total - self.instance.negative_total >= 2 ** 62:
+                # Sums do not fit into int64, so they are joined as Python ints.
+                return self._search_python_ints(values, variant, deadline)
+            if variant == "horowitz_sahni":
+                half = len(values) // 2
+                parts = [values[:half], (), values[half:], ()]
+            else:
+                borders = [len(values) * quarter // 4 for quarter in range(5)]
+                parts = [values[borders[i]:borders[i + 1]] for i in range(4)]
+            sorted_parts = [self._sorted_part_sums(part) for part in parts]
+            best_sum, positions = self._closest_sum_of_halves([sums for sums, order in sorted_parts], deadline)
+        except TypeError:
+            print("TypeError: incorrect type for 'set_numbers' ")
+            return None
+
+        self.best_sum = best_sum
+        solution = []
+        for part, (sums, order), position in zip(parts, sorted_parts, positions):
+            mask = int(order[position])
+            solution += [number for index, number in enumerate(part) if mask >> index & 1]
+        return solution
+
+    def _search_python_ints(self, values, variant, deadline):
+        """
+        The function that search for solution with sums of parts kept as Python ints, which is used when sums do
+        not fit into int64. Sums of halves are joined with two pointers, Schroeppel-Shamir variant generates them
+        in sorted order with heaps.
+
+        :param values: Numbers of main set.
+        :type values: tuple
+        :param variant: "horowitz_sahni" or "schroeppel_shamir".
+        :type variant: str
+        :param deadline: Time (time.perf_counter) when joining stops.
+        :type deadline: float
+        :return: Found solution.
+        :rtype: list
+        """
+
+        if variant == "horowitz_sahni":
+            half = len(values) // 2
+            first = self._sorted_subset_sums(values[:half], 0)
+            second = self._sorted_subset_sums(values[half:], half)
+            ascending = iter(first)
+            descending = reversed(second)
+        else:
+            borders = [len(values) * quarter // 4 for quarter in range(5)]
+            quarters = [self._sorted_subset_sums(values[borders[i]:borders[i + 1]], borders[i]) for i in range(4)]
+            ascending = self._ascending_pair_sums(quarters[0], quarters[1])
+            descending = self._descending_pair_sums(quarters[2], quarters[3])
+        self.best_sum, best_mask = self._closest_pair(ascending, descending, deadline)
+        return [number for index, number in enumerate(values) if best_mask >> index & 1]
+
+    def is_reachable(self):
+        """
+        The function that checks if any subset of main set has searched sum.
+
+        :return: True if solution exists. None when joining was stopped by time_limit or acceptable_gap before
+                 searched sum was found, so the answer is not known.
+        :rtype: bool
+        """
+
+        if self.search_solution() is None or self.stopped_early:
+            return None
+        return self.best_sum == self.target_sum
+
+    def execution_time(self):
+        """
+        The function that return execution time for search of solution (sec).
+
+        :return: Time execution of search of solution.
+        :rtype: str
+        """
+
+        start_time = time.perf_counter()
+        self.search_solution()
+        formatted_time = "{:.9f}".format(time.perf_counter() - start_time)
+        return formatted_time
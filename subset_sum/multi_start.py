@@ -0,0 +1,133 @@
+import multiprocessing
+import os
+import random
+import time
+from .subset_instance import SubsetInstance
+
+_worker_set_numbers = None
+
+
+def _initialize_worker(set_numbers):
+    """
+    The function that stores main set in worker process, so it is sent to every worker only once
+    instead of with every restart.
+
+    :param set_numbers: Main set prepared once in main process.
+    :type set_numbers: SubsetInstance
+    """
+
+    global _worker_set_numbers
+    _worker_set_numbers = set_numbers
+
+
+def best_solution_of(solver):
+    """
+    The function that runs solver and return its best found solution as list of numbers.
+
+    :param solver: Algorithm object.
+    :type solver: _SubsetCreator
+    :return: Best found solution.
+    :rtype: list
+    """
+
+    if hasattr(solver, "search_for_best_individual"):
+        return solver.search_for_best_individual()
+    return solver.search_solution()
+
+
+def _run_restart(task):
+    """
+    The function that runs one independent restart of algorithm in worker process.
+
+    :param task: Seed, algorithm class, searched sum, iterations and parameters of algorithm.
+    :type task: tuple
+    :return: Seed, points and solution of restart.
+    :rtype: tuple
+    """
+
+    seed, solver_class, target_sum, iterations, solver_parameters = task
+    random.seed(seed)
+    solver = solver_class(target_sum, iterations, _worker_set_numbers, **solver_parameters)
+    solution = best_solution_of(solver)
+    return seed, abs(target_sum - sum(solution)), solution
+
+
+class MultiStartRunner:
+    """Runner which starts many independent restarts of one algorithm in a pool of processes and keeps the best
+    solution. When any restart finds solution with at most acceptable_gap points (0 by default), all other restarts
+    are stopped."""
+
+    def __init__(self, solver_class, target_sum, iterations, set_numbers, restarts, workers = None, seed = None,
+                 **solver_parameters):
+        """
+
+        :param solver_class: Algorithm class, subclass of _SubsetCreator.
+        :type solver_class: type
+        :param target_sum: Searched sum of numbers.
+        :type target_sum: int
+        :param iterations: Number of algorithm executions in every restart.
+        :type iterations: int
+        :param set_numbers: Initial set, from which we create subsets, which we search in order to find a solution.
+        :type set_numbers: set
+        :param restarts: Number of independent restarts.
+        :type restarts: int
+        :param workers: Number of worker processes, by default number of processors.
+        :type workers: int
+        :param seed: Seed of first restart, next restarts use following seeds. Random when not given.
+        :type seed: int
+        :param solver_parameters: Other parameters passed to algorithm class, for example time_limit of every
+                                  restart or acceptable_gap.
+        """
+
+        self.solver_class = solver_class
+        self.target_sum = target_sum
+        self.iterations = iterations
+        self.set_numbers = SubsetInstance.of(set_numbers)
+        self.restarts = restarts
+        self.workers = workers or os.cpu_count()
+        self.seed = seed
+        self.solver_parameters = solver_parameters
+        self.best_points = None
+        self.best_seed = None
+        self.finished_restarts = 0
+
+    def search_solution(self):
+        """
+        The function that runs restarts and return best found solution.
+
+        :return: Best found solution.
+        :rtype: list
+        """
+
+        first_seed = self.seed if self.seed is not None else random.randrange(2 ** 32)
+        tasks = [(first_seed + restart, self.solver_class, self.target_sum, self.iterations, self.solver_parameters)
+                 for restart in range(self.restarts)]
+        best_solution = None
+        self.best_points = None
+        self.best_seed = None
+        self.finished_restarts = 0
+
+        with multiprocessing.Pool(min(self.workers, max(self.restarts, 1)), _initialize_worker,
+                                  (self.set_numbers,)) as pool:
+            for seed, points, solution in pool.imap_unordered(_run_restart, tasks):
+                self.finished_restarts += 1
+                if self.best_points is None or points < self.best_points:
+                    best_solution, self.best_points, self.best_seed = solution, points, seed
+                if points <= self.solver_parameters.get("acceptable_gap", 0):
+                    # Leaving the block terminates workers which are still searching.
+                    break
+
+        return best_solution
+
+    def execution_time(self):
+        """
+        The function that return execution time of search for solution (sec).
+
+        :return: Time execution of search of solution.
+        :rtype: str
+        """
+
+        start_time = time.perf_counter()
+        self.search_solution()
+        formatted_time = "{:.9f}".format(time.perf_counter() - start_time)
+        return formatted_time
@@ -0,0 +1,280 @@
+"""Loading of large main sets from files without creating Python lists of numbers.
+
+Text files (numbers separated by whitespace, commas or new lines, optionally CSV with header and chosen column)
+are read in chunks, and every chunk is parsed by numpy straight into int64 array. Binary files of little-endian
+int64 numbers (and .npy files) are memory mapped, so their numbers are used by algorithms without copying.
+Duplicates are removed and statistics are computed by SubsetInstance with one sort of the array:
+
+    python -m subset_sum load numbers.csv --column 1 --save-binary numbers.i64
+    python -m subset_sum load numbers.i64 --target 5000 --algorithm tabu_search --iterations 1000
+"""
+
+import argparse
+import io
+import os
+import time
+import warnings
+from collections import namedtuple
+import numpy as np
+from .subset_instance import SubsetInstance
+
+TEXT_CHUNK_SIZE = 16 * 1024 * 1024
+BINARY_SUFFIXES = (".bin", ".i64", ".int64")
+
+LoadStatistics = namedtuple("LoadStatistics", ["count", "unique", "minimum", "maximum", "negative_total",
+                                               "positive_total"])
+LoadStatistics.__doc__ = """Number of read numbers, number of numbers without duplicates, the lowest and the highest
+number and sums of negative and positive numbers without duplicates."""
+
+
+def _parse_text_chunk(chunk, column, delimiter):
+    """
+    The function that parses chunk of text file into int64 array.
+
+    :param chunk: Whole lines of text file.
+    :type chunk: bytes
+    :param column: Index of column of CSV file, all numbers of chunk are read when it is None.
+    :type column: int
+    :param delimiter: Delimiter of columns.
+    :type delimiter: str
+    :rtype: numpy.ndarray
+    """
+
+    if column is not None:
+        return np.loadtxt(io.BytesIO(chunk), dtype=np.int64, delimiter=delimiter, usecols=column, ndmin=1)
+    numbers = None
+    with warnings.catch_warnings():
+        # Older numpy only warns when text can not be read to its end.
+        warnings.simplefilter("error", DeprecationWarning)
+        try:
+            numbers = np.fromstring(chunk.replace(b",", b" "), dtype=np.int64, sep=" ")
+        except (ValueError, DeprecationWarning):
+            pass
+    bounds = np.iinfo(np.int64)
+    # Numbers out of int64 are read as one of its bounds without error, so only chunks with a bound are checked
+    # again number by number.
+    if numbers is not None and not (len(numbers) and (numbers.max() == bounds.max or numbers.min() == bounds.min)):
+        return numbers
+    parsed = []
+    for token in chunk.replace(b",", b" ").split():
+        try:
+            parsed.append(int(token))
+        except ValueError:
+            raise ValueError(f"{token.decode(errors='replace')!r} is not integer number") from None
+        if not bounds.min <= parsed[-1] <= bounds.max:
+            raise ValueError(f"number {token.decode()} does not fit into int64")
+    return np.array(parsed, dtype=np.int64)
+
+
+def _has_number(line):
+    """
+    The function that checks if any word of line is integer number.
+
+    :param line: Line of text file.
+    :type line: bytes
+    :rtype: bool
+    """
+
+    for token in line.replace(b",", b" ").split():
+        try:
+            int(token)
+            return True
+        except ValueError:
+            pass
+    return False
+
+
+def iterate_text_chunks(path, chunk_size = TEXT_CHUNK_SIZE, column = None, delimiter = ",", skip_header = None):
+    """
+    The function that reads text file in chunks of whole lines and yields numbers of every chunk as int64 array,
+    so the whole file is never held as text or as Python numbers.
+
+    :param path: Path of text file.
+    :type path: str
+    :param chunk_size: Number of bytes read at once.
+    :type chunk_size: int
+    :param column: Index of column of CSV file. By default all numbers of file are read.
+    :type column: int
+    :param delimiter: Delimiter of columns, used with column.
+    :type delimiter: str
+    :param skip_header: Skip first line. By default it is skipped when it can not be read as numbers and, unless
+                        column is given, it contains no number.
+    :type skip_header: bool
+    :return: Generator of int64 arrays.
+    :rtype: generator
+    """
+
+    with open(path, "rb") as file:
+        remainder = b""
+        first_chunk = True
+        while True:
+            block = file.read(chunk_size)
+            if not block:
+                chunk, remainder = remainder, b""
+            else:
+                block = remainder + block
+                end = block.rfind(b"\n") + 1
+                if end == 0:
+                    # Line longer than chunk is read further.
+                    remainder = block
+                    continue
+                chunk, remainder = block[:end], block[end:]
+
+            if first_chunk:
+                first_chunk = False
+                header_end = chunk.find(b"\n") + 1 or len(chunk)
+                if skip_header is None:
+                    try:
+                        _parse_text_chunk(chunk[:header_end], column, delimiter)
+                        skip_header = False
+                    except ValueError:
+                        # Line of names is header, but line of numbers with mistake is not skipped, its error is
+                        # raised when the chunk is parsed.
+                        skip_header = column is not None or not _has_number(chunk[:header_end])
+                if skip_header:
+                    chunk = chunk[header_end:]
+            if chunk.strip():
+                yield _parse_text_chunk(chunk, column, delimiter)
+            if not block:
+                return
+
+
+def read_text(path, chunk_size = TEXT_CHUNK_SIZE, column = None, delimiter = ",", skip_header = None):
+    """
+    The function that reads all numbers of text file into one int64 array. Chunks are copied into array which
+    grows twice when it is full. Parameters are the same as in iterate_text_chunks().
+
+    :return: Read numbers.
+    :rtype: numpy.ndarray
+    """
+
+    numbers = np.empty(max(1, os.path.getsize(path) // 8), dtype=np.int64)
+    count = 0
+    for chunk in iterate_text_chunks(path, chunk_size, column, delimiter, skip_header):
+        if count + len(chunk) > len(numbers):
+            numbers.resize(max(2 * len(numbers), count + len(chunk)), refcheck=False)
+        numbers[count:count + len(chunk)] = chunk
+        count += len(chunk)
+    numbers.resize(count, refcheck=False)
+    return numbers
+
+
+def map_binary(path):
+    """
+    The function that maps binary file of little-endian int64 numbers (or .npy file) into memory. Numbers are read
+    from disk only when they are used.
+
+    :param path: Path of binary file.
+    :type path: str
+    :return: Read-only array backed by file.
+    :rtype: numpy.ndarray
+    """
+
+    if str(path).endswith(".npy"):
+        return np.load(path, mmap_mode="r")
+    if os.path.getsize(path) % 8:
+        raise ValueError(f"size of {path!r} is not multiple of 8 bytes of int64 number")
+    if os.path.getsize(path) == 0:
+        return np.empty(0, dtype="<i8")
+    return np.memmap(path, dtype="<i8", mode="r")
+
+
+def save_binary(numbers, path):
+    """
+    The function that writes numbers as binary file of little-endian int64 numbers, which is loaded with
+    map_binary().
+
+    :param numbers: Numbers of main set.
+    :type numbers: numpy.ndarray or SubsetInstance
+    :param path: Path of written file.
+    :type path: str
+    """
+
+    if isinstance(numbers, SubsetInstance):
+        numbers = numbers.array
+    np.asarray(numbers, dtype="<i8").tofile(path)
+
+
+def load_instance(path, file_format = None, **text_options):
+    """
+    The function that loads main set from file and prepares it for algorithms.
+
+    :param path: Path of file.
+    :type path: str
+    :param file_format: "text", "binary" or "npy". By default chosen by suffix: .bin, .i64 and .int64 are binary,
+                        .npy is numpy file, everything else is text.
+    :type file_format: str
+    :param text_options: chunk_size, column, delimiter and skip_header of read_text().
+    :return: Prepared instance and statistics of file.
+    :rtype: tuple
+    """
+
+    if file_format is None:
+        suffix = os.path.splitext(str(path))[1].lower()
+        file_format = "binary" if suffix in BINARY_SUFFIXES else "npy" if suffix == ".npy" else "text"
+    if file_format in ("binary", "npy"):
+        numbers = map_binary(path)
+    elif file_format == "text":
+        numbers = read_text(path, **text_options)
+    else:
+        raise ValueError(f"unknown file format {file_format!r}, expected 'text', 'binary' or 'npy'")
+
+    instance = SubsetInstance(numbers)
+    return instance, statistics_of(instance, len(numbers))
+
+
+def statistics_of(instance, count):
+    """
+    The function that return statistics of loaded main set from already prepared instance.
+
+    :param instance: Prepared main set.
+    :type instance: SubsetInstance
+    :param count: Number of read numbers, with duplicates.
+    :type count: int
+    :rtype: LoadStatistics
+    """
+
+    if len(instance) == 0:
+        return LoadStatistics(count, 0, None, None, 0, 0)
+    return LoadStatistics(count, len(instance), int(instance.array[instance.sorted_order[0]]),
+                          int(instance.array[instance.sorted_order[-1]]), instance.negative_total,
+                          instance.positive_total)
+
+
+def main(arguments = None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("path", help="text, CSV, binary int64 or .npy file with numbers")
+    parser.add_argument("--format", choices=("text", "binary", "npy"), help="format of file, by default by suffix")
+    parser.add_argument("--column", type=int, help="index of column of CSV file")
+    parser.add_argument("--delimiter", default=",", help="delimiter of columns of CSV file")
+    parser.add_argument("--save-binary", help="write numbers without duplicates as binary int64 file")
+    parser.add_argument("--target", type=int, help="searched sum, the set is solved when it is given")
+    parser.add_argument("--algorithm", default="tabu_search")
+    parser.add_argument("--iterations", type=int, default=1000)
+    parser.add_argument("--time-limit", type=float)
+    arguments = parser.parse_args(arguments)
+
+    start_time = time.perf_counter()
+    text_options = {}
+    if arguments.column is not None:
+        text_options = {"column": arguments.column, "delimiter": arguments.delimiter}
+    instance, statistics = load_instance(arguments.path, arguments.format, **text_options)
+    print(f"loaded in {time.perf_counter() - start_time:.3f} sec")
+    for name, value in statistics._asdict().items():
+        print(f"{name}: {value}")
+    if arguments.save_binary:
+        save_binary(instance, arguments.save_binary)
+
+    if arguments.target is not None:
+        from .registry import ALGORITHMS
+        from .multi_start import best_solution_of
+        solver = ALGORITHMS[arguments.algorithm](arguments.target, arguments.iterations, instance,
+                                                 time_limit=arguments.time_limit)
+        start_time = time.perf_counter()
+        solution = best_solution_of(solver)
+        print(f"{arguments.algorithm}: sum {sum(solution)}, gap {abs(arguments.target - sum(solution))}, "
+              f"{len(solution)} numbers, {time.perf_counter() - start_time:.3f} sec")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,220 @@
+import math
+import multiprocessing
+import os
+import time
+from .compact_subset import CompactSubset
+from .search_statistics import GOAL_EVALUATIONS, NEIGHBOURS_GENERATED, ACCEPTED_MOVES, REJECTED_MOVES, IMPROVEMENTS
+from .simulated_annealing import SimulatedAnnealing
+from .subset_creator import SolutionUpdate
+
+_worker_problem = None
+
+
+def _initialize_worker(problem):
+    """
+    The function that stores main set, searched sum, number of steps between exchanges and acceptable gap in
+    worker process, so they are sent to every worker only once.
+
+    :param problem: SubsetInstance, searched sum, steps and acceptable gap.
+    :type problem: tuple
+    """
+
+    global _worker_problem
+    _worker_problem = problem
+
+
+def _run_replica(task):
+    """
+    The function that runs chain of one replica at its temperature. Subsets are sent between processes packed
+    eight positions per byte.
+
+    :param task: Seed, packed subset and temperature of replica.
+    :type task: tuple
+    :return: Packed last subset, its points, packed best subset, its points and number of accepted neighbors.
+    :rtype: tuple
+    """
+
+    seed, packed_subset, temperature = task
+    instance, target_sum, steps, acceptable_gap = _worker_problem
+    chain = SimulatedAnnealing(target_sum, steps, instance, acceptable_gap=acceptable_gap, seed=seed)
+    subset = CompactSubset.from_packed(packed_subset, len(instance)).to_list()
+    points, best_subset, best_points, accepted_moves = chain._run_chain(subset, temperature, steps)
+    return (CompactSubset(subset).packed(), points, CompactSubset(best_subset).packed(), best_points,
+            accepted_moves)
+
+
+class ParallelTempering(SimulatedAnnealing):
+    """Parallel tempering (replica exchange) runs several annealing chains, every one at constant temperature from
+    a ladder of temperatures, in worker processes. After every exchange_interval proposed neighbors, subsets of
+    chains with neighboring temperatures are swapped with Metropolis probability
+    min(1, exp((1 / T_i - 1 / T_j) * (points_i - points_j))), so good subsets move to cold chains, which improve
+    them, and hot chains keep exploring. The best subset of all chains is returned."""
+
+    def __init__(self, target_sum, iterations, set_numbers, replicas = 8, temperatures = None, exchange_interval = 5000,
+                 workers = None, temperature_ratio = 1000, initial_acceptance = 0.8, time_limit = None,
+                 acceptable_gap = 0, seed = None, start_strategy = "random"):
+        """
+
+        :param target_sum: Searched sum of numbers.
+        :type target_sum: int
+        :param iterations: Number of exchanges.
+        :type iterations: int
+        :param set_numbers: Initial set, from which we create subsets, which we search in order to find a solution.
+        :type set_numbers: set
+        :param replicas: Number of chains. Ignored when temperatures are given.
+        :type replicas: int
+        :param temperatures: Temperatures of chains. By default geometric ladder from temperature computed like
+                             SimulatedAnnealing with temperature="auto" down to it divided by temperature_ratio.
+        :type temperatures: list
+        :param exchange_interval: Number of proposed neighbors of every chain between exchanges.
+        :type exchange_interval: int
+        :param workers: Number of worker processes, by default number of processors. With one worker, or when
+                        this process is daemon (for example worker of SolveService), chains run in this process.
+        :type workers: int
+        :param temperature_ratio: Ratio of the highest and the lowest temperature of default ladder.
+        :type temperature_ratio: float
+        :param initial_acceptance: Probability of accepting worse neighbor in the hottest chain of default ladder.
+        :type initial_acceptance: float
+        :param time_limit: Maximal time of search (sec), after which the best solution found so far is returned.
+                           Time is checked at every exchange.
+        :type time_limit: float
+        :param acceptable_gap: Search stops when solution with at most this many points is found.
+        :type acceptable_gap: int
+        :param seed: Seed of random generators, so search can be repeated.
+        :type seed: int
+        :param start_strategy: How start subsets are created: "random", "greedy", "differencing" or
+                               "restricted_greedy", see _SubsetCreator.
+        :type start_strategy: str
+        """
+        super().__init__(target_sum, iterations, set_numbers, temperature="auto", time_limit=time_limit,
+                         acceptable_gap=acceptable_gap, seed=seed, start_strategy=start_strategy,
+                         initial_acceptance=initial_acceptance)
+        self.replicas = len(temperatures) if temperatures is not None else replicas
+        self.temperatures = temperatures
+        self.exchange_interval = exchange_interval
+        self.workers = workers or os.cpu_count()
+        self.temperature_ratio = temperature_ratio
+        self.exchange_attempts = 0
+        self.accepted_exchanges = 0
+
+    def _temperature_ladder(self, subset, subset_sum):
+        """
+        The function that return temperatures of chains from the lowest.
+
+        :param subset: Start subset.
+        :type subset: list
+        :param subset_sum: Sum of numbers of start subset.
+        :type subset_sum: int
+        :rtype: list
+        """
+
+        if self.temperatures is not None:
+            return sorted(self.temperatures)
+
+        highest_temperature = self._initial_temperature(subset, subset_sum)
+        if self.replicas == 1:
+            return [highest_temperature]
+        return [highest_temperature / self.temperature_ratio ** (1 - replica / (self.replicas - 1))
+                for replica in range(self.replicas)]
+
+    def _search(self, report_improvements):
+        """
+        The function that search for best solution and yields every new best solution of all chains when
+        report_improvements is True.
+
+        :param report_improvements: Yield new best solutions.
+        :type report_improvements: bool
+        :return: Best found solution.
+        :rtype: list
+        """
+
+        search_start = time.perf_counter()
+        deadline = self._search_deadline()
+        phase_start = self._phase_start()
+        start_subsets = [self.create_start_subset() for replica in range(self.replicas)]
+        start_sums = [self.sum_of_subset(subset) for subset in start_subsets]
+        temperatures = self._temperature_ladder(start_subsets[0], start_sums[0])
+        subsets = [CompactSubset(subset).packed() for subset in start_subsets]
+        points = [self.points_of_sum(subset_sum) for subset_sum in start_sums]
+        best_replica = min(range(self.replicas), key=points.__getitem__)
+        best_subset = subsets[best_replica]
+        best_points = points[best_replica]
+        self.exchange_attempts = 0
+        self.accepted_exchanges = 0
+        counters = self.statistics.counters if self.statistics is not None else None
+        if counters is not None:
+            counters[GOAL_EVALUATIONS] += self.replicas
+        self._phase_end("start", phase_start)
+        if report_improvements:
+            yield SolutionUpdate(self._decode_packed(best_subset), best_points, time.perf_counter() - search_start)
+
+        problem = (self.instance, self.target_sum, self.exchange_interval, self.acceptable_gap)
+        pool = None
+        # Daemon processes can not have children.
+        if self.workers > 1 and self.replicas > 1 and not multiprocessing.current_process().daemon:
+            pool = multiprocessing.Pool(min(self.workers, self.replicas), _initialize_worker, (problem,))
+        else:
+            _initialize_worker(problem)
+        try:
+            for exchange in range(self.iterations):
+                if best_points <= self.acceptable_gap or self._deadline_passed(deadline):
+                    break
+                phase_start = self._phase_start()
+                tasks = [(int(self.rng.integers(2 ** 63)), subsets[replica], temperatures[replica])
+                         for replica in range(self.replicas)]
+                results = pool.map(_run_replica, tasks) if pool is not None else list(map(_run_replica, tasks))
+                self._phase_end("chains", phase_start)
+
+                improved = False
+                for replica, (subset, subset_points, chain_best, chain_best_points, accepted) in enumerate(results):
+                    subsets[replica] = subset
+                    points[replica] = subset_points
+                    if chain_best_points < best_points:
+                        best_subset = chain_best
+                        best_points = chain_best_points
+                        improved = True
+                    if counters is not None:
+                        counters[NEIGHBOURS_GENERATED] += self.exchange_interval
+                        counters[GOAL_EVALUATIONS] += self.exchange_interval
+                        counters[ACCEPTED_MOVES] += accepted
+                        counters[REJECTED_MOVES] += self.exchange_interval - accepted
+
+                if improved:
+                    if counters is not None:
+                        counters[IMPROVEMENTS] += 1
+                    if self.observers:
+                        self._notify("improvement", points=best_points, iteration=exchange + 1)
+                    if report_improvements:
+                        yield SolutionUpdate(self._decode_packed(best_subset), best_points,
+                                             time.perf_counter() - search_start)
+
+                # Even and odd pairs of neighboring temperatures are exchanged alternately.
+                for replica in range(exchange % 2, self.replicas - 1, 2):
+                    self.exchange_attempts += 1
+                    exponent = ((1 / temperatures[replica] - 1 / temperatures[replica + 1])
+                                * (points[replica] - points[replica + 1]))
+                    if exponent >= 0 or self.random.random() < math.exp(exponent):
+                        self.accepted_exchanges += 1
+                        subsets[replica], subsets[replica + 1] = subsets[replica + 1], subsets[replica]
+                        points[replica], points[replica + 1] = points[replica + 1], points[replica]
+        finally:
+            if pool is not None:
+                pool.terminate()
+
+        phase_start = self._phase_start()
+        best_solution = self._decode_packed(best_subset)
+        self._phase_end("decode", phase_start)
+        if self.observers:
+            self._notify("finished", points=best_points, statistics=self.statistics)
+        return best_solution
+
+    def _decode_packed(self, packed_subset):
+        """
+        The function that converts packed subset into list of numbers of main set.
+
+        :param packed_subset: Subset packed eight positions per byte.
+        :type packed_subset: bytes
+        :rtype: list
+        """
+
+        return self.convert_subset_into_decimal(CompactSubset.from_packed(packed_subset, len(self.instance)))
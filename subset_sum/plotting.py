@@ -0,0 +1,47 @@
+"""Charts of results of algorithms. Needs matplotlib, which is installed with optional extra:
+
+    pip install subset-sum-problem[plot]
+"""
+
+
+def _pyplot():
+    try:
+        from matplotlib import pyplot
+    except ImportError as error:
+        raise ImportError("plotting needs matplotlib, install it with: pip install subset-sum-problem[plot]") from error
+    return pyplot
+
+
+def plot_bar_chart(labels, values, ylabel):
+    """
+    The function that shows bar chart with one bar for every algorithm.
+
+    :param labels: Names of algorithms.
+    :type labels: list
+    :param values: Values of bars.
+    :type values: list
+    :param ylabel: Label of vertical axis.
+    :type ylabel: str
+    """
+
+    pyplot = _pyplot()
+    pyplot.bar(labels, values, width=0.4)
+    pyplot.xticks(rotation=15)
+    pyplot.ylabel(ylabel)
+    pyplot.show()
+
+
+def plot_results(algorithms, execution_time, solutions_sum):
+    """
+    The function that shows charts of execution times and sums of found solutions of algorithms.
+
+    :param algorithms: Names of algorithms.
+    :type algorithms: list
+    :param execution_time: Execution times of algorithms (sec).
+    :type execution_time: list
+    :param solutions_sum: Sums of best found sets.
+    :type solutions_sum: list
+    """
+
+    plot_bar_chart(algorithms, execution_time, "execution time (sec)")
+    plot_bar_chart(algorithms, solutions_sum, "sum of best found set")
@@ -0,0 +1,143 @@
+import numpy as np
+from .subset_instance import SubsetInstance
+
+UNREACHABLE = -2
+EMPTY_SUBSET = -1
+# The largest memory (bytes) of index while it is built, 1 GiB: int32 position and bool flag for every sum.
+MAX_INDEX_BYTES = 2 ** 30
+INDEX_BYTES_PER_SUM = 5
+
+
+class ReachabilityIndex:
+    """Index of all sums reachable by subsets of one main set. It is built once and then answers for any
+    searched sum whether it is reachable in constant time, and which subset reaches it in time proportional
+    to size of that subset. Index can be saved to file and loaded later."""
+
+    def __init__(self, set_numbers):
+        """
+
+        :param set_numbers: Initial set, whose subsets sums are indexed. Duplicates are removed. Sets whose
+                            index of all sums from the lowest to the highest one would need more than
+                            MAX_INDEX_BYTES are refused with ValueError before any memory is allocated.
+        :type set_numbers: set or SubsetInstance
+        """
+
+        instance = SubsetInstance.of(set_numbers)
+        self.instance = instance
+        self.values = instance.array
+        self.offset = -instance.negative_total
+        width = instance.positive_total + self.offset + 1
+        if width * INDEX_BYTES_PER_SUM > MAX_INDEX_BYTES:
+            raise ValueError(f"reachability index needs {width * INDEX_BYTES_PER_SUM // 2 ** 20} MiB, more than "
+                             f"{MAX_INDEX_BYTES // 2 ** 20} MiB; use MeetInTheMiddle or ApproximationScheme")
+        # first_item[s + offset] is position of number, whose adding made sum s reachable for the first time.
+        self.first_item = np.full(width, UNREACHABLE, dtype=np.int32)
+        self.first_item[self.offset] = EMPTY_SUBSET
+
+        reachable = np.zeros(width, dtype=np.bool_)
+        reachable[self.offset] = True
+        for index, number in enumerate(self.values.tolist()):
+            if number > 0:
+                new_sums = np.flatnonzero(reachable[:width - number] & ~reachable[number:]) + number
+            elif number < 0:
+                new_sums = np.flatnonzero(reachable[-number:] & ~reachable[:width + number])
+            else:
+                continue
+            self.first_item[new_sums] = index
+            reachable[new_sums] = True
+
+    @classmethod
+    def load(cls, path):
+        """
+        The function that loads index saved by save().
+
+        :param path: Path of file with index.
+        :type path: str
+        :return: Loaded index.
+        :rtype: ReachabilityIndex
+        """
+
+        with np.load(path) as data:
+            index = cls.__new__(cls)
+            index.values = data["values"]
+            index.instance = SubsetInstance(index.values)
+            index.offset = int(data["offset"])
+            index.first_item = data["first_item"]
+        return index
+
+    def save(self, path):
+        """
+        The function that saves index to compressed numpy file. File is written through open file, so numpy does
+        not add ".npz" to path and load() finds the file under the same path.
+
+        :param path: Path of file with index.
+        :type path: str
+        """
+
+        with open(path, "wb") as index_file:
+            np.savez_compressed(index_file, values=self.values, offset=self.offset, first_item=self.first_item)
+
+    def is_reachable(self, target_sum):
+        """
+        The function that checks if any subset has searched sum.
+
+        :param target_sum: Searched sum of numbers.
+        :type target_sum: int
+        :return: True if sum is reachable.
+        :rtype: bool
+        """
+
+        if not self.instance.is_in_range(target_sum):
+            return False
+        return self.first_item[target_sum + self.offset] != UNREACHABLE
+
+    def are_reachable(self, target_sums):
+        """
+        The function that checks many searched sums at once.
+
+        :param target_sums: Searched sums of numbers.
+        :type target_sums: list or numpy.ndarray
+        :return: True for every reachable sum.
+        :rtype: numpy.ndarray
+        """
+
+        target_sums = np.asarray(target_sums, dtype=np.int64)
+        in_range = (target_sums >= self.instance.negative_total) & (target_sums <= self.instance.positive_total)
+        reachable = np.zeros(target_sums.shape, dtype=np.bool_)
+        reachable[in_range] = self.first_item[target_sums[in_range] + self.offset] != UNREACHABLE
+        return reachable
+
+    def solution(self, target_sum):
+        """
+        The function that return subset with searched sum.
+
+        :param target_sum: Searched sum of numbers.
+        :type target_sum: int
+        :return: Numbers of subset, or None when sum is not reachable.
+        :rtype: list
+        """
+
+        if not self.is_reachable(target_sum):
+            return None
+
+        position = target_sum + self.offset
+        taken = []
+        while self.first_item[position] != EMPTY_SUBSET:
+            number = int(self.values[self.first_item[position]])
+            taken.append(number)
+            position -= number
+
+        taken.reverse()
+        return taken
+
+    def solutions(self, target_sums):
+        """
+        The function that return subsets for many searched sums.
+
+        :param target_sums: Searched sums of numbers.
+        :type target_sums: list
+        :return: Subset for every searched sum, None for not reachable sums.
+        :rtype: list
+        """
+
+        return [self.solution(int(target_sum)) for target_sum in target_sums]
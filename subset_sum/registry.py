@@ -0,0 +1,68 @@
+"""Registry of algorithms by name. Module of algorithm is imported when algorithm is used for the first time, so
+importing the package, starting command line or worker process does not import all algorithms."""
+
+import importlib
+from collections.abc import Mapping
+
+SOLVERS = {
+    "hill_climbing_deterministic": ("hill_climbing_deterministic", "HillClimbingDeterministic"),
+    "hill_climbing_first_choice": ("hill_climbing_first_choice", "HillClimbingFirstChoice"),
+    "simulated_annealing": ("simulated_annealing", "SimulatedAnnealing"),
+    "genetic_algorithm": ("genetic_algorithm", "GeneticAlgorithm"),
+    "dynamic_programming": ("dynamic_programming", "DynamicProgramming"),
+    "meet_in_the_middle": ("meet_in_the_middle", "MeetInTheMiddle"),
+    "tabu_search": ("tabu_search", "TabuSearch"),
+    "approximation_scheme": ("approximation_scheme", "ApproximationScheme"),
+    "parallel_tempering": ("parallel_tempering", "ParallelTempering"),
+}
+
+
+def solver_class(name):
+    """
+    The function that return class of algorithm, its module is imported on first use.
+
+    :param name: Name of algorithm from SOLVERS.
+    :type name: str
+    :return: Class of algorithm.
+    :rtype: type
+    """
+
+    try:
+        module_name, class_name = SOLVERS[name]
+    except (KeyError, TypeError):
+        raise ValueError(f"unknown algorithm {name!r}, expected one of {sorted(SOLVERS)}") from None
+    return getattr(importlib.import_module(f"{__package__}.{module_name}"), class_name)
+
+
+def solver_modules():
+    """
+    The function that return full names of modules of all algorithms, for example to import them in advance.
+
+    :rtype: list
+    """
+
+    return sorted({f"{__package__}.{module_name}" for module_name, class_name in SOLVERS.values()})
+
+
+class _SolverRegistry(Mapping):
+    """Read-only mapping from names of algorithms to their classes, which are imported on first access."""
+
+    def __getitem__(self, name):
+        if name not in SOLVERS:
+            raise KeyError(name)
+        return solver_class(name)
+
+    def __iter__(self):
+        return iter(SOLVERS)
+
+    def __len__(self):
+        return len(SOLVERS)
+
+    def __contains__(self, name):
+        return name in SOLVERS
+
+    def __repr__(self):
+        return f"ALGORITHMS({', '.join(SOLVERS)})"
+
+
+ALGORITHMS = _SolverRegistry()
@@ -0,0 +1,248 @@
+import hashlib
+import json
+import sqlite3
+import time
+from collections import OrderedDict
+from .multi_start import best_solution_of
+from .subset_instance import SubsetInstance
+
+
+class ResultCache:
+    """Cache of solutions in front of search_solution(). Results are kept in memory (the least recently used are
+    removed first) and optionally in sqlite file, which keeps them between runs and is limited by size in bytes.
+
+    Key is hash of sorted numbers of main set without duplicates, searched sum, algorithm and its parameters,
+    so the same job sent again returns its solution without searching. Heuristics without seed are cached too:
+    their next run would give different, but not better in general, solution.
+
+    Results of exact algorithms (with is_reachable(), without time_limit and acceptable_gap) do not depend on
+    algorithm, so they are stored under one key of main set and searched sum. The closest subset found by dynamic
+    programming is returned also for meet in the middle, and cached "searched sum is not reachable" answers
+    is_reachable() of every exact algorithm."""
+
+    def __init__(self, max_entries = 1024, path = None, max_disk_bytes = 64 * 1024 * 1024):
+        """
+
+        :param max_entries: Maximal number of results kept in memory.
+        :type max_entries: int
+        :param path: Path of sqlite file with results. Only memory is used when not given.
+        :type path: str
+        :param max_disk_bytes: Maximal size of stored solutions in sqlite file. The least recently used results
+                               are removed when it is exceeded.
+        :type max_disk_bytes: int
+        """
+
+        self.max_entries = max_entries
+        self.max_disk_bytes = max_disk_bytes
+        self.memory = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.connection = None
+        if path is not None:
+            self.connection = sqlite3.connect(path)
+            self.connection.execute("CREATE TABLE IF NOT EXISTS results (key TEXT PRIMARY KEY, payload TEXT NOT NULL, "
+                                    "size INTEGER NOT NULL, last_used REAL NOT NULL)")
+            self.connection.execute("CREATE INDEX IF NOT EXISTS results_last_used ON results (last_used)")
+            self.connection.commit()
+
+    @staticmethod
+    def is_exact(solver_class, solver_parameters):
+        """
+        The function that checks if algorithm with given parameters always returns subset with the closest sum.
+
+        :param solver_class: Algorithm class.
+        :type solver_class: type
+        :param solver_parameters: Parameters of algorithm.
+        :type solver_parameters: dict
+        :rtype: bool
+        """
+
+        return (hasattr(solver_class, "is_reachable") and solver_parameters.get("time_limit") is None
+                and not solver_parameters.get("acceptable_gap"))
+
+    @staticmethod
+    def key(solver_class, target_sum, iterations, set_numbers, solver_parameters):
+        """
+        The function that creates key of job. Order and duplicates of numbers do not change the key.
+
+        :param solver_class: Algorithm class.
+        :type solver_class: type
+        :param target_sum: Searched sum of numbers.
+        :type target_sum: int
+        :param iterations: Number of algorithm executions.
+        :type iterations: int
+        :param set_numbers: Main set.
+        :type set_numbers: set or SubsetInstance
+        :param solver_parameters: Other parameters of algorithm.
+        :type solver_parameters: dict
+        :return: Hexadecimal sha256 hash.
+        :rtype: str
+        """
+
+        values = sorted(SubsetInstance.of(set_numbers).values)
+        if ResultCache.is_exact(solver_class, solver_parameters):
+            job = ["exact", target_sum, values]
+        else:
+            job = [f"{solver_class.__module__}.{solver_class.__qualname__}", target_sum, iterations,
+                   sorted(solver_parameters.items()), values]
+        return hashlib.sha256(json.dumps(job, default=repr).encode()).hexdigest()
+
+    def get(self, key):
+        """
+        The function that return cached result, from memory or from sqlite file.
+
+        :param key: Key of job.
+        :type key: str
+        :return: Solution, its points and information if result is exact, or None when it is not cached.
+        :rtype: tuple
+        """
+
+        result = self.memory.get(key)
+        if result is not None:
+            self.memory.move_to_end(key)
+            return result
+
+        if self.connection is not None:
+            row = self.connection.execute("SELECT payload FROM results WHERE key = ?", (key,)).fetchone()
+            if row is not None:
+                self.connection.execute("UPDATE results SET last_used = ? WHERE key = ?", (time.time(), key))
+                self.connection.commit()
+                solution, points, exact = json.loads(row[0])
+                result = (tuple(solution), points, exact)
+                self._remember(key, result)
+                return result
+
+        return None
+
+    def put(self, key, solution, points, exact):
+        """
+        The function that stores result in memory and in sqlite file.
+
+        :param key: Key of job.
+        :type key: str
+        :param solution: Found solution.
+        :type solution: list
+        :param points: Points of solution.
+        :type points: int
+        :param exact: Solution has the closest sum of all subsets.
+        :type exact: bool
+        """
+
+        result = (tuple(solution), points, exact)
+        self._remember(key, result)
+        if self.connection is not None:
+            payload = json.dumps([solution, points, exact])
+            self.connection.execute("INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?)",
+                                    (key, payload, len(payload), time.time()))
+            self._evict_disk()
+            self.connection.commit()
+
+    def _remember(self, key, result):
+        self.memory[key] = result
+        self.memory.move_to_end(key)
+        while len(self.memory) > self.max_entries:
+            self.memory.popitem(last=False)
+
+    def _evict_disk(self):
+        """
+        The function that removes the least recently used results from sqlite file until size of stored solutions
+        is at most max_disk_bytes.
+        """
+
+        if self.max_disk_bytes is None:
+            return
+        excess = self.connection.execute("SELECT TOTAL(size) FROM results").fetchone()[0] - self.max_disk_bytes
+        if excess <= 0:
+            return
+        removed_keys = []
+        for key, size in self.connection.execute("SELECT key, size FROM results ORDER BY last_used"):
+            removed_keys.append((key,))
+            excess -= size
+            if excess <= 0:
+                break
+        self.connection.executemany("DELETE FROM results WHERE key = ?", removed_keys)
+
+    def _result(self, solver_class, target_sum, iterations, set_numbers, solver_parameters):
+        key = self.key(solver_class, target_sum, iterations, set_numbers, solver_parameters)
+        result = self.get(key)
+        if result is not None:
+            self.hits += 1
+            return result
+
+        self.misses += 1
+        solver = solver_class(target_sum, iterations, set_numbers, **solver_parameters)
+        solution = best_solution_of(solver)
+        if solution is None:
+            return None
+        points = abs(target_sum - sum(solution))
+        exact = self.is_exact(solver_class, solver_parameters)
+        self.put(key, solution, points, exact)
+        return tuple(solution), points, exact
+
+    def search_solution(self, solver_class, target_sum, iterations, set_numbers, **solver_parameters):
+        """
+        The function that return cached solution of job, or runs algorithm and caches its solution.
+
+        :param solver_class: Algorithm class.
+        :type solver_class: type
+        :param target_sum: Searched sum of numbers.
+        :type target_sum: int
+        :param iterations: Number of algorithm executions.
+        :type iterations: int
+        :param set_numbers: Main set.
+        :type set_numbers: set or SubsetInstance
+        :param solver_parameters: Other parameters passed to algorithm class.
+        :return: Best found solution.
+        :rtype: list
+        """
+
+        result = self._result(solver_class, target_sum, iterations, set_numbers, solver_parameters)
+        if result is None:
+            return None
+        return list(result[0])
+
+    def is_reachable(self, solver_class, target_sum, iterations, set_numbers, **solver_parameters):
+        """
+        The function that checks with exact algorithm if any subset has searched sum. Cached answer, also
+        negative one, is returned without searching.
+
+        :param solver_class: Exact algorithm class.
+        :type solver_class: type
+        :param target_sum: Searched sum of numbers.
+        :type target_sum: int
+        :param iterations: Not used by exact algorithms.
+        :type iterations: int
+        :param set_numbers: Main set.
+        :type set_numbers: set or SubsetInstance
+        :param solver_parameters: Other parameters passed to algorithm class.
+        :return: True if solution exists, None when the answer is not known (algorithm is not exact).
+        :rtype: bool
+        """
+
+        result = self._result(solver_class, target_sum, iterations, set_numbers, solver_parameters)
+        if result is None:
+            return None
+        solution, points, exact = result
+        if points == 0:
+            return True
+        if exact:
+            return False
+        return None
+
+    def clear(self):
+        """
+        The function that removes all results from memory and from sqlite file.
+        """
+
+        self.memory.clear()
+        if self.connection is not None:
+            self.connection.execute("DELETE FROM results")
+            self.connection.commit()
+
+    def close(self):
+        if self.connection is not None:
+            self.connection.close()
+            self.connection = None
+
+    def __len__(self):
+        return len(self.memory)
@@ -0,0 +1,63 @@
+from array import array
+
+GOAL_EVALUATIONS = 0
+NEIGHBOURS_GENERATED = 1
+ACCEPTED_MOVES = 2
+REJECTED_MOVES = 3
+IMPROVEMENTS = 4
+COUNTER_NAMES = ("goal_evaluations", "neighbours_generated", "accepted_moves", "rejected_moves", "improvements")
+
+
+class SearchStatistics:
+    """Counters and times of phases of search for solution. Counters are kept in compact array indexed by
+    constants of this module, so algorithms can increase them with one indexing operation."""
+
+    __slots__ = ("counters", "phase_names", "phase_times")
+
+    def __init__(self):
+        self.counters = array("q", bytes(8 * len(COUNTER_NAMES)))
+        self.phase_names = []
+        self.phase_times = array("d")
+
+    def add_phase_time(self, phase_name, seconds):
+        """
+        The function that adds time spent in phase of algorithm.
+
+        :param phase_name: Name of phase, for example "selection".
+        :type phase_name: str
+        :param seconds: Time spent in phase.
+        :type seconds: float
+        """
+
+        try:
+            phase_index = self.phase_names.index(phase_name)
+        except ValueError:
+            self.phase_names.append(phase_name)
+            self.phase_times.append(seconds)
+        else:
+            self.phase_times[phase_index] += seconds
+
+    def reset(self):
+        """
+        The function that sets all counters and times to zero.
+        """
+
+        for counter_index in range(len(self.counters)):
+            self.counters[counter_index] = 0
+        self.phase_names.clear()
+        del self.phase_times[:]
+
+    def as_dict(self):
+        """
+        The function that return counters and times of phases (sec) by their names.
+
+        :return: Statistics by names.
+        :rtype: dict
+        """
+
+        statistics = dict(zip(COUNTER_NAMES, self.counters))
+        statistics["phase_times"] = dict(zip(self.phase_names, self.phase_times))
+        return statistics
+
+    def __repr__(self):
+        return f"SearchStatistics({self.as_dict()})"
@@ -0,0 +1,390 @@
+from  .subset_creator import _SubsetCreator, SolutionUpdate, DEADLINE_CHECK_INTERVAL
+import math
+import time
+import numpy as np
+from .cooling_schedule import create_cooling_schedule
+from .search_statistics import GOAL_EVALUATIONS, NEIGHBOURS_GENERATED, ACCEPTED_MOVES, REJECTED_MOVES, IMPROVEMENTS
+
+TEMPERATURE_UPDATE_INTERVAL = 16
+TEMPERATURE_SAMPLES = 256
+
+class SimulatedAnnealing(_SubsetCreator):
+    """Simulated Annealing is a probabilistic optimization algorithm inspired by the annealing process in metallurgy."""
+
+    def __init__(self, target_sum, iterations, set_numbers, temperature = 1000, display_steps = False, max_neighbor_iterations = 100,
+                 compact_subsets = False, time_limit = None, acceptable_gap = 0, seed = None,
+                 start_strategy = "random", cooling_schedule = "classic", reheat_after = None,
+                 initial_acceptance = 0.8, use_swap_moves = False):
+        """
+        :param target_sum: Searched sum of numbers.
+        :type target_sum: int
+        :param iterations: Number of algorithm executions.
+        :type iterations: int
+        :param set_numbers: Initial set, from which we create subsets, which we search in order to find a solution.
+        :type set_numbers: set
+        :param temperature: The initial temperature of annealing process,
+                            controlling probability of accepting worse solution. "auto" computes it from
+                            changes of points of random neighbors of start subset, so that worse neighbor
+                            is accepted with probability initial_acceptance at the start.
+        :type temperature: float or str
+        :param display_steps: Allows to display the steps that the algorithm performs in order to find
+                              solutions. Not recommended due to the huge amount of displayed information.
+        :type display_steps: bool
+        :param max_neighbor_iterations: Limit the number of attempts for generating neighboring solution.
+        :type max_neighbor_iterations: int
+        :param compact_subsets: Subsets are stored as CompactSubset (one byte per number) instead of lists.
+        :type compact_subsets: bool
+        :param time_limit: Maximal time of search (sec), after which the best solution found so far is returned.
+        :type time_limit: float
+        :param acceptable_gap: Search stops when solution with at most this many points is found.
+        :type acceptable_gap: int
+        :param seed: Seed of random generators, so search can be repeated.
+        :type seed: int
+        :param start_strategy: How start subsets are created: "random", "greedy", "differencing" or
+                               "restricted_greedy", see _SubsetCreator.
+        :type start_strategy: str
+        :param cooling_schedule: "classic" (temperature / number of accepted moves), "geometric", "linear",
+                                 "logarithmic", "lundy_mees", "adaptive" or CoolingSchedule object with
+                                 own parameters. Temperature is changed every 16 proposed neighbors.
+        :type cooling_schedule: str or CoolingSchedule
+        :param reheat_after: Number of proposed neighbors without new best solution after which temperature
+                             goes back to the initial temperature and schedule starts again. No reheating by default.
+        :type reheat_after: int
+        :param initial_acceptance: Probability of accepting worse neighbor at the start, used by temperature="auto".
+                                   Between 0 and 1.
+        :type initial_acceptance: float
+        :param use_swap_moves: Every n proposed neighbors (n is size of main set), and at the end of search,
+                               search also for swap of one number of current subset for one number outside of it
+                               which gives exactly searched sum, see find_closing_swap().
+        :type use_swap_moves: bool
+        """
+        super().__init__(target_sum, iterations, set_numbers, compact_subsets, time_limit, acceptable_gap, seed,
+                         start_strategy)
+        self.display_steps = display_steps
+        self.max_neighbor_iterations = max_neighbor_iterations
+        self.is_error = bool
+        self.temperature = temperature
+        self.cooling_schedule = create_cooling_schedule(cooling_schedule)
+        self.reheat_after = reheat_after
+        if not 0 < initial_acceptance < 1:
+            raise ValueError(f"initial_acceptance must be between 0 and 1, got {initial_acceptance!r}")
+        self.initial_acceptance = initial_acceptance
+        self.use_swap_moves = use_swap_moves
+
+    def _generate_random_neighbor(self, subset):
+        """The function that generate random neighboring solution.
+
+        :param subset: Subset from which we create neighboring solutions.
+        :type subset: list
+        :return: Random neighboring solution.
+        :rtype: list
+        """
+        neighbour_solution = subset.copy()
+        self.flip(neighbour_solution, self.random_flip_index(subset))
+        return neighbour_solution
+
+
+    def _initial_temperature(self, subset, subset_sum):
+        """
+        The function that return initial temperature. For temperature="auto" it is computed from changes of points
+        of random neighbors of start subset: worse neighbor with average change is accepted with probability
+        initial_acceptance, so exp(-average / T) = initial_acceptance.
+
+        :param subset: Start subset.
+        :type subset: list
+        :param subset_sum: Sum of numbers of start subset.
+        :type subset_sum: int
+        :return: Initial temperature.
+        :rtype: float
+        """
+
+        if self.temperature != "auto":
+            return self.temperature
+
+        positions = self.rng.integers(0, len(self.instance), TEMPERATURE_SAMPLES)
+        signs = 1 - 2 * np.asarray(subset, dtype=np.int64)[positions]
+        neighbours_points = np.abs(subset_sum + signs * self.values_array[positions] - self.target_sum)
+        changes = neighbours_points - self.points_of_sum(subset_sum)
+        worse_changes = changes[changes > 0]
+        if len(worse_changes) == 0:
+            return 1.0
+        return float(worse_changes.mean()) / -math.log(self.initial_acceptance)
+
+    def _run_chain(self, subset, temperature, steps):
+        """
+        The function that runs annealing at constant temperature (Metropolis chain) for given number of proposed
+        neighbors. Neighbors and points are the same as in search_solution(): one random position is changed and
+        points are abs(target_sum - sum). Subset is changed in place.
+
+        :param subset: Subset from which chain starts.
+        :type subset: list
+        :param temperature: Temperature of chain.
+        :type temperature: float
+        :param steps: Number of proposed neighbors.
+        :type steps: int
+        :return: Points of last subset, the best subset of chain, its points and number of accepted neighbors.
+        :rtype: tuple
+        """
+
+        subset_sum = self.sum_of_subset(subset)
+        points = self.points_of_sum(subset_sum)
+        # None while subset is the best one of chain, so it is copied only before chain moves away from it.
+        best_subset = None
+        best_points = points
+        accepted_moves = 0
+        random_positions = self._random_positions()
+        random_exponentials = self._random_exponentials()
+        for step in range(steps):
+            if best_points <= self.acceptable_gap:
+                break
+            change_index = next(random_positions)
+            neighboring_sum = self.flip_sum(subset, subset_sum, change_index)
+            neighboring_points = self.points_of_sum(neighboring_sum)
+            if neighboring_points < points or neighboring_points - points < next(random_exponentials) * temperature:
+                if best_subset is None and neighboring_points >= best_points:
+                    best_subset = subset.copy()
+                self.flip(subset, change_index)
+                subset_sum = neighboring_sum
+                points = neighboring_points
+                accepted_moves += 1
+                if points < best_points:
+                    best_points = points
+                    best_subset = None
+
+        if best_subset is None:
+            best_subset = subset.copy()
+        return points, best_subset, best_points, accepted_moves
+
+    def search_solution(self):
+        """
+        The function that search for best solution.
+
+        :return: Best found solution.
+        :rtype: list
+        """
+
+        return self._run_search(self._search(False))
+
+    def _search(self, report_improvements):
+        """
+        The function that search for best solution and yields every new globally best solution when
+        report_improvements is True.
+
+        :param report_improvements: Yield new best solutions.
+        :type report_improvements: bool
+        :return: Best found solution.
+        :rtype: list
+        """
+
+        search_start = time.perf_counter()
+        deadline = self._search_deadline()
+        deadline_countdown = DEADLINE_CHECK_INTERVAL
+        acceptable_gap = self.acceptable_gap
+        phase_start = self._phase_start()
+        best_solution = self.create_start_subset()
+        random_positions = self._random_positions()
+        random_exponentials = self._random_exponentials()
+        best_solution_sum = self.sum_of_subset(best_solution)
+        best_solution_points = self.points_of_sum(best_solution_sum)
+        change_index = next(random_positions)
+        neighboring_sum = self.flip_sum(best_solution, best_solution_sum, change_index)
+        neighboring_points = self.points_of_sum(neighboring_sum)
+        global_best_solution = best_solution.copy()
+        global_best_solution_points = best_solution_points
+        iter_count = 1
+        neighboring_generator_count = 1
+        runing_main_loop = True
+        schedule = self.cooling_schedule
+        initial_temperature = self._initial_temperature(best_solution, best_solution_sum)
+        temperature = initial_temperature
+        temperature_countdown = TEMPERATURE_UPDATE_INTERVAL
+        schedule_step = 0
+        schedule_start_iteration = 0
+        window_start_iteration = iter_count
+        reheat_after = self.reheat_after
+        stagnant_steps = 0
+        window_best_points = global_best_solution_points
+        use_swap_moves = self.use_swap_moves
+        # Search for swap costs O(n), so it is done once per n proposed neighbors.
+        swap_interval = max(len(self.instance), TEMPERATURE_UPDATE_INTERVAL)
+        swap_countdown = swap_interval
+        counters = self.statistics.counters if self.statistics is not None else None
+        if counters is not None:
+            counters[GOAL_EVALUATIONS] += 2
+            counters[NEIGHBOURS_GENERATED] += 1
+        self._phase_end("start", phase_start)
+        if report_improvements:
+            yield SolutionUpdate(self.convert_subset_into_decimal(global_best_solution), global_best_solution_points,
+                                 time.perf_counter() - search_start)
+        phase_start = self._phase_start()
+
+        if self.display_steps:
+                    neighboring_solution = best_solution.copy()
+                    self.flip(neighboring_solution, change_index)
+                    print(f"Iter: {iter_count} first neighboring subset: {neighboring_solution}, first neighboring subset points: "
+                            f"{neighboring_points}, first subset points: {best_solution_points}, "
+                            f"first subset: {best_solution}")
+
+        while runing_main_loop:
+            runing = True
+            while runing:
+                if best_solution_points <= acceptable_gap:
+                    runing_main_loop = False
+                    break
+                elif neighboring_points < best_solution_points:
+                    self.flip(best_solution, change_index)
+                    best_solution_sum = neighboring_sum
+                    best_solution_points = neighboring_points
+                    change_index = next(random_positions)
+                    neighboring_sum = self.flip_sum(best_solution, best_solution_sum, change_index)
+                    neighboring_points = self.points_of_sum(neighboring_sum)
+                    neighboring_generator_count = 1
+                    iter_count += 1
+                    if counters is not None:
+                        counters[ACCEPTED_MOVES] += 1
+                        counters[NEIGHBOURS_GENERATED] += 1
+                        counters[GOAL_EVALUATIONS] += 1
+                    if self.display_steps:
+                        print("\n")
+                # u < exp(-delta / T) for uniform u is the same as delta < E * T for E = -log(u), which has
+                # exponential distribution, so no exp is computed and E is drawn only for worse neighbors.
+                elif neighboring_points - best_solution_points < next(random_exponentials) * temperature:
+                    self.flip(best_solution, change_index)
+                    best_solution_sum = neighboring_sum
+                    best_solution_points = neighboring_points
+                    neighboring_generator_count = 1
+                    iter_count += 1
+                    change_index = next(random_positions)
+                    neighboring_sum = self.flip_sum(best_solution, best_solution_sum, change_index)
+                    neighboring_points = self.points_of_sum(neighboring_sum)
+                    if counters is not None:
+                        counters[ACCEPTED_MOVES] += 1
+                        counters[NEIGHBOURS_GENERATED] += 1
+                        counters[GOAL_EVALUATIONS] += 1
+                    if self.display_steps:
+                        print("\n")
+                else:
+                    change_index = next(random_positions)
+                    neighboring_sum = self.flip_sum(best_solution, best_solution_sum, change_index)
+                    neighboring_points = self.points_of_sum(neighboring_sum)
+                    neighboring_generator_count += 1
+                    if counters is not None:
+                        counters[REJECTED_MOVES] += 1
+                        counters[NEIGHBOURS_GENERATED] += 1
+                        counters[GOAL_EVALUATIONS] += 1
+
+                if self.display_steps:
+                    neighboring_solution = best_solution.copy()
+                    self.flip(neighboring_solution, change_index)
+                    self.display_search_solution_steps(iter_count, neighboring_solution, neighboring_points,
+                                                       best_solution, best_solution_points)
+
+
+                if neighboring_generator_count >= self.max_neighbor_iterations:
+                    runing_main_loop = False
+                    break
+
+                if iter_count >= self.iterations:
+                    runing_main_loop = False
+                    break
+
+                if use_swap_moves:
+                    swap_countdown -= 1
+                    if swap_countdown == 0:
+                        swap_countdown = swap_interval
+                        swap = self.find_closing_swap(best_solution, best_solution_sum)
+                        if swap is not None:
+                            best_solution_sum = self.apply_swap(best_solution, best_solution_sum, swap)
+                            best_solution_points = self.points_of_sum(best_solution_sum)
+                            neighboring_sum = self.flip_sum(best_solution, best_solution_sum, change_index)
+                            neighboring_points = self.points_of_sum(neighboring_sum)
+                            if counters is not None:
+                                counters[ACCEPTED_MOVES] += 1
+
+                if global_best_solution_points > best_solution_points:
+                    global_best_solution_points = best_solution_points
+                    global_best_solution = best_solution.copy()
+                    if counters is not None:
+                        counters[IMPROVEMENTS] += 1
+                    if self.observers:
+                        self._notify("improvement", points=global_best_solution_points, iteration=iter_count)
+                    if report_improvements:
+                        yield SolutionUpdate(self.convert_subset_into_decimal(global_best_solution),
+                                             global_best_solution_points, time.perf_counter() - search_start)
+
+                temperature_countdown -= 1
+                if temperature_countdown == 0:
+                    temperature_countdown = TEMPERATURE_UPDATE_INTERVAL
+                    schedule_step += TEMPERATURE_UPDATE_INTERVAL
+                    if global_best_solution_points < window_best_points:
+                        window_best_points = global_best_solution_points
+                        stagnant_steps = 0
+                    else:
+                        stagnant_steps += TEMPERATURE_UPDATE_INTERVAL
+                    if reheat_after is not None and stagnant_steps >= reheat_after:
+                        temperature = initial_temperature
+                        schedule_step = 0
+                        schedule_start_iteration = iter_count
+                        stagnant_steps = 0
+                    else:
+                        acceptance_ratio = (iter_count - window_start_iteration) / TEMPERATURE_UPDATE_INTERVAL
+                        temperature = schedule.next_temperature(initial_temperature, temperature, schedule_step,
+                                                                iter_count - schedule_start_iteration,
+                                                                acceptance_ratio)
+                    window_start_iteration = iter_count
+
+                if deadline is not None:
+                    deadline_countdown -= 1
+                    if deadline_countdown == 0:
+                        deadline_countdown = DEADLINE_CHECK_INTERVAL
+                        if self._deadline_passed(deadline):
+                            runing_main_loop = False
+                            break
+
+
+        if use_swap_moves and global_best_solution_points > acceptable_gap:
+            global_best_solution_sum = self.sum_of_subset(global_best_solution)
+            swap = self.find_closing_swap(global_best_solution, global_best_solution_sum)
+            if swap is not None:
+                global_best_solution_sum = self.apply_swap(global_best_solution, global_best_solution_sum, swap)
+                global_best_solution_points = self.points_of_sum(global_best_solution_sum)
+                if counters is not None:
+                    counters[ACCEPTED_MOVES] += 1
+                    counters[IMPROVEMENTS] += 1
+                if self.observers:
+                    self._notify("improvement", points=global_best_solution_points, iteration=iter_count)
+                if report_improvements:
+                    yield SolutionUpdate(self.convert_subset_into_decimal(global_best_solution),
+                                         global_best_solution_points, time.perf_counter() - search_start)
+
+        self._phase_end("search", phase_start)
+        if self.display_steps:
+            print("\n")
+
+        phase_start = self._phase_start()
+        global_best_solution_converted = self.convert_subset_into_decimal(global_best_solution)
+        self._phase_end("decode", phase_start)
+        if self.observers:
+            self._notify("finished", points=global_best_solution_points, statistics=self.statistics)
+
+        return global_best_solution_converted
+
+
+
+    def execution_time(self):
+        """
+        The function that return execution time of search for solution (sec).
+
+        :return: Time execution of search of solution.
+        :rtype: str
+        """
+        start_time = time.perf_counter()
+        self.search_solution()
+        formatted_time = "{:.9f}".format(time.perf_counter() - start_time)
+        return formatted_time
+
+    def how_algorithm_works(self):
+        """
+        The function that display information how hill climbing deterministic version works for subset sum problem
+        """
+        pass
\ No newline at end of file
@@ -0,0 +1,529 @@
+"""Local service which solves subset sum jobs in worker processes.
+
+Requests and responses are JSON objects, one per line (newline-delimited JSON), sent over TCP or Unix socket:
+
+    {"op": "solve", "numbers": [...], "target": 5000, "algorithm": "simulated_annealing", "iterations": 1000,
+     "parameters": {...}, "deadline": 2.5, "stream": false}
+    {"op": "status", "job": 1}
+    {"op": "result", "job": 1}        (waits until job is finished)
+    {"op": "cancel", "job": 1}
+
+Every job runs in its own process, at most max_workers at once, so a slow job does not block others and can be
+cancelled by stopping its process. With "stream": true every new best solution is sent as soon as it is found.
+
+    python -m subset_sum serve --port 8765
+    python -m subset_sum serve --unix /tmp/subset_sum.sock
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import multiprocessing
+import os
+import time
+from collections import OrderedDict
+from .registry import ALGORITHMS, solver_modules
+
+# Time after deadline in which job has to finish by itself, otherwise its process is stopped.
+DEADLINE_GRACE = 1.0
+FINISHED_STATES = ("done", "cancelled", "failed")
+# The longest request or response line (bytes). Default limit of asyncio streams (64 KiB) is exceeded already by
+# job of about 10 thousand numbers.
+LINE_LIMIT = 2 ** 30
+
+
+def _solve_job(connection, algorithm, target_sum, iterations, numbers, parameters):
+    """
+    The function that runs algorithm in worker process and sends every new best solution through connection.
+
+    :param connection: Sending end of pipe.
+    :type connection: multiprocessing.connection.Connection
+    :param algorithm: Name of algorithm from ALGORITHMS.
+    :type algorithm: str
+    :param target_sum: Searched sum of numbers.
+    :type target_sum: int
+    :param iterations: Number of algorithm executions.
+    :type iterations: int
+    :param numbers: Main set.
+    :type numbers: list
+    :param parameters: Other parameters of algorithm.
+    :type parameters: dict
+    """
+
+    try:
+        solver = ALGORITHMS[algorithm](target_sum, iterations, numbers, **parameters)
+        search = solver.iterate_solutions()
+        while True:
+            try:
+                update = next(search)
+            except StopIteration as stop:
+                solution = stop.value
+                break
+            connection.send(("update", update.solution, update.points, update.elapsed))
+        connection.send(("result", solution))
+    except Exception as error:
+        connection.send(("error", f"{type(error).__name__}: {error}"))
+    finally:
+        connection.close()
+
+
+async def _receive(connection):
+    """
+    The function that waits in event loop until message or end of pipe arrives and return the message, so
+    waiting jobs do not occupy threads.
+
+    :param connection: Receiving end of pipe.
+    :type connection: multiprocessing.connection.Connection
+    :return: Received message.
+    :rtype: tuple
+    """
+
+    loop = asyncio.get_running_loop()
+    while not connection.poll():
+        readable = loop.create_future()
+        loop.add_reader(connection.fileno(), lambda: readable.done() or readable.set_result(None))
+        try:
+            await readable
+        finally:
+            loop.remove_reader(connection.fileno())
+    return connection.recv()
+
+
+async def _read_line(reader):
+    """
+    The function that reads one line from stream. Line longer than limit of stream is skipped up to its end,
+    so the next line is read from its start, and ValueError is raised.
+
+    :param reader: Stream with lines.
+    :type reader: asyncio.StreamReader
+    :return: Line with newline, last line without newline or empty bytes at the end of stream.
+    :rtype: bytes
+    """
+
+    try:
+        return await reader.readuntil(b"\n")
+    except asyncio.IncompleteReadError as error:
+        return error.partial
+    except asyncio.LimitOverrunError:
+        pass
+    while True:
+        try:
+            await reader.readuntil(b"\n")
+            break
+        except asyncio.IncompleteReadError:
+            break
+        except asyncio.LimitOverrunError as error:
+            await reader.readexactly(error.consumed)
+    raise ValueError(f"line is longer than {LINE_LIMIT} bytes")
+
+
+class Job:
+    """Solve job of service: its state, the best solution found so far and clients waiting for its updates."""
+
+    def __init__(self, job_id, request):
+        self.job_id = job_id
+        self.request = request
+        self.state = "queued"
+        self.solution = None
+        self.points = None
+        self.elapsed = None
+        self.error = None
+        self.timed_out = False
+        self.process = None
+        self.task = None
+        self.finished = asyncio.Event()
+        self.subscribers = []
+
+    def update(self, solution, points, elapsed):
+        """
+        The function that stores solution, when it is better than the best one so far, and sends it to subscribers.
+        """
+
+        if self.points is not None and points >= self.points:
+            return
+        self.solution, self.points, self.elapsed = solution, points, elapsed
+        for subscriber in self.subscribers:
+            subscriber.put_nowait(self.describe("update"))
+
+    def finish(self, state, error = None):
+        """
+        The function that sets final state of job and ends updates of subscribers. Job which is already finished
+        (for example cancelled while its last messages were on the way) is not changed.
+        """
+
+        if self.state in FINISHED_STATES:
+            return
+        self.state = state
+        self.error = error
+        self.finished.set()
+        for subscriber in self.subscribers:
+            subscriber.put_nowait(None)
+
+    def describe(self, event = None):
+        """
+        The function that return state of job as JSON object.
+
+        :param event: Name of event added to description, for example "update".
+        :type event: str
+        :rtype: dict
+        """
+
+        description = {"job": self.job_id, "state": self.state, "points": self.points, "solution": self.solution,
+                       "elapsed": self.elapsed}
+        if event is not None:
+            description["event"] = event
+        if self.timed_out:
+            description["timed_out"] = True
+        if self.error is not None:
+            description["error"] = self.error
+        return description
+
+
+class SolveService:
+    """Asyncio server which accepts solve jobs and runs them in worker processes."""
+
+    def __init__(self, host = "127.0.0.1", port = 8765, path = None, max_workers = None, max_finished_jobs = 1000):
+        """
+
+        :param host: Address of TCP server.
+        :type host: str
+        :param port: Port of TCP server, 0 chooses free port.
+        :type port: int
+        :param path: Path of Unix socket, used instead of TCP when given.
+        :type path: str
+        :param max_workers: Maximal number of jobs solved at once, by default number of processors.
+        :type max_workers: int
+        :param max_finished_jobs: Number of finished jobs whose results are kept.
+        :type max_finished_jobs: int
+        """
+
+        self.host = host
+        self.port = port
+        self.path = path
+        self.max_workers = max_workers or os.cpu_count()
+        self.max_finished_jobs = max_finished_jobs
+        self.jobs = OrderedDict()
+        self.job_ids = itertools.count(1)
+        self.server = None
+        self.workers = None
+        if "forkserver" in multiprocessing.get_all_start_methods():
+            # Workers are forked from clean process with imported algorithms, which is fast and safe in
+            # process with event loop and threads. Algorithms are loaded lazily by registry, so they are
+            # preloaded here once instead of in every worker.
+            self.context = multiprocessing.get_context("forkserver")
+            self.context.set_forkserver_preload([__name__] + solver_modules())
+        else:
+            self.context = multiprocessing.get_context("spawn")
+
+    async def start(self):
+        """
+        The function that starts listening. Port of TCP server is stored in port.
+
+        :return: Server.
+        :rtype: asyncio.Server
+        """
+
+        self.workers = asyncio.Semaphore(self.max_workers)
+        if self.path is not None:
+            self.server = await asyncio.start_unix_server(self._handle_client, self.path, limit=LINE_LIMIT)
+        else:
+            self.server = await asyncio.start_server(self._handle_client, self.host, self.port, limit=LINE_LIMIT)
+            self.port = self.server.sockets[0].getsockname()[1]
+        return self.server
+
+    async def serve_forever(self):
+        if self.server is None:
+            await self.start()
+        async with self.server:
+            await self.server.serve_forever()
+
+    async def close(self):
+        """
+        The function that stops server and all running jobs.
+        """
+
+        for job in self.jobs.values():
+            if job.state not in FINISHED_STATES:
+                self._cancel(job)
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
+
+    def submit(self, request):
+        """
+        The function that creates job from solve request and starts it when worker is free.
+
+        :param request: Solve request.
+        :type request: dict
+        :return: Created job.
+        :rtype: Job
+        """
+
+        if request.get("algorithm") not in ALGORITHMS:
+            raise ValueError(f"unknown algorithm {request.get('algorithm')!r}, expected one of {sorted(ALGORITHMS)}")
+        if not isinstance(request.get("numbers"), list) or not isinstance(request.get("target"), int):
+            raise ValueError("'numbers' must be list and 'target' must be integer")
+        job = Job(next(self.job_ids), request)
+        self.jobs[job.job_id] = job
+        job.task = asyncio.ensure_future(self._run(job))
+        return job
+
+    async def _run(self, job):
+        async with self.workers:
+            if job.state != "queued":
+                return
+            request = job.request
+            parameters = dict(request.get("parameters") or {})
+            deadline = request.get("deadline")
+            if deadline is not None:
+                parameters.setdefault("time_limit", deadline)
+            receiving_end, sending_end = self.context.Pipe(duplex=False)
+            job.process = self.context.Process(target=_solve_job, daemon=True,
+                                               args=(sending_end, request["algorithm"], request["target"],
+                                                     request.get("iterations", 100), request["numbers"],
+                                                     parameters))
+            job.process.start()
+            sending_end.close()
+            job.state = "running"
+            started = time.perf_counter()
+            loop = asyncio.get_running_loop()
+            watchdog = None
+            if deadline is not None:
+                watchdog = loop.call_later(deadline + DEADLINE_GRACE, self._stop_overdue, job)
+
+            try:
+                while True:
+                    try:
+                        message = await _receive(receiving_end)
+                    except (EOFError, OSError):
+                        # Process was stopped (cancel or deadline) or died.
+                        if job.state == "cancelled":
+                            return
+                        if job.timed_out:
+                            job.finish("done")
+                        else:
+                            job.finish("failed", f"worker process ended with code {job.process.exitcode}")
+                        return
+                    if job.state == "cancelled":
+                        # Messages sent before the process was stopped are not used.
+                        return
+                    if message[0] == "update":
+                        job.update(message[1], message[2], message[3])
+                    elif message[0] == "result":
+                        solution = message[1]
+                        if solution is not None:
+                            job.update(solution, abs(request["target"] - sum(solution)),
+                                       time.perf_counter() - started)
+                        job.finish("done")
+                        return
+                    else:
+                        job.finish("failed", message[1])
+                        return
+            finally:
+                if watchdog is not None:
+                    watchdog.cancel()
+                receiving_end.close()
+                job.process.join(0)
+                self._forget_finished_jobs()
+
+    def _stop_overdue(self, job):
+        if job.state == "running":
+            job.timed_out = True
+            job.process.terminate()
+
+    def _cancel(self, job):
+        """
+        The function that cancels queued job or stops process of running job. Best solution found so far is kept.
+
+        :param job: Cancelled job.
+        :type job: Job
+        """
+
+        if job.state in FINISHED_STATES:
+            return
+        running = job.state == "running"
+        job.finish("cancelled")
+        if running:
+            job.process.terminate()
+
+    def _forget_finished_jobs(self):
+        finished_jobs = [job_id for job_id, job in self.jobs.items() if job.state in FINISHED_STATES]
+        for job_id in finished_jobs[:max(0, len(finished_jobs) - self.max_finished_jobs)]:
+            del self.jobs[job_id]
+
+    async def _handle_client(self, reader, writer):
+        try:
+            while True:
+                try:
+                    line = await _read_line(reader)
+                    if not line:
+                        break
+                    request = json.loads(line)
+                    await self._handle_request(request, writer)
+                except (ValueError, KeyError, TypeError) as error:
+                    await self._send(writer, {"error": f"{type(error).__name__}: {error}"})
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def _handle_request(self, request, writer):
+        operation = request.get("op")
+        if operation == "solve":
+            job = self.submit(request)
+            if not request.get("stream"):
+                await self._send(writer, job.describe())
+                return
+            subscriber = asyncio.Queue()
+            job.subscribers.append(subscriber)
+            try:
+                await self._send(writer, job.describe("queued"))
+                while True:
+                    description = await subscriber.get()
+                    if description is None:
+                        break
+                    await self._send(writer, description)
+            finally:
+                job.subscribers.remove(subscriber)
+            await self._send(writer, job.describe("finished"))
+            return
+
+        job = self.jobs.get(request.get("job"))
+        if job is None:
+            raise KeyError(f"unknown job {request.get('job')!r}")
+        if operation == "status":
+            await self._send(writer, job.describe())
+        elif operation == "result":
+            await job.finished.wait()
+            await self._send(writer, job.describe())
+        elif operation == "cancel":
+            self._cancel(job)
+            await self._send(writer, job.describe())
+        else:
+            raise ValueError(f"unknown operation {operation!r}")
+
+    @staticmethod
+    async def _send(writer, message):
+        writer.write(json.dumps(message).encode() + b"\n")
+        await writer.drain()
+
+
+class SolveClient:
+    """Asyncio client of SolveService. One client sends one request at a time; streaming of job uses own
+    connection."""
+
+    def __init__(self, host = "127.0.0.1", port = 8765, path = None):
+        self.host = host
+        self.port = port
+        self.path = path
+        self.reader = None
+        self.writer = None
+
+    async def _open(self):
+        if self.path is not None:
+            return await asyncio.open_unix_connection(self.path, limit=LINE_LIMIT)
+        return await asyncio.open_connection(self.host, self.port, limit=LINE_LIMIT)
+
+    async def connect(self):
+        self.reader, self.writer = await self._open()
+        return self
+
+    async def close(self):
+        if self.writer is not None:
+            self.writer.close()
+            await self.writer.wait_closed()
+            self.writer = None
+
+    async def __aenter__(self):
+        return await self.connect()
+
+    async def __aexit__(self, *exception):
+        await self.close()
+
+    async def request(self, message):
+        """
+        The function that sends request and return response.
+
+        :param message: Request.
+        :type message: dict
+        :rtype: dict
+        """
+
+        self.writer.write(json.dumps(message).encode() + b"\n")
+        await self.writer.drain()
+        response = json.loads(await self.reader.readline())
+        if "error" in response and "job" not in response:
+            raise RuntimeError(response["error"])
+        return response
+
+    @staticmethod
+    def _solve_request(numbers, target_sum, algorithm, iterations, parameters, deadline):
+        return {"op": "solve", "numbers": list(numbers), "target": target_sum, "algorithm": algorithm,
+                "iterations": iterations, "parameters": parameters or {}, "deadline": deadline}
+
+    async def solve(self, numbers, target_sum, algorithm = "simulated_annealing", iterations = 100, parameters = None,
+                    deadline = None):
+        """
+        The function that submits job and return its number without waiting for solution.
+
+        :rtype: int
+        """
+
+        response = await self.request(self._solve_request(numbers, target_sum, algorithm, iterations, parameters,
+                                                          deadline))
+        return response["job"]
+
+    async def status(self, job):
+        return await self.request({"op": "status", "job": job})
+
+    async def result(self, job):
+        return await self.request({"op": "result", "job": job})
+
+    async def cancel(self, job):
+        return await self.request({"op": "cancel", "job": job})
+
+    async def stream(self, numbers, target_sum, algorithm = "simulated_annealing", iterations = 100,
+                     parameters = None, deadline = None):
+        """
+        The function that submits job and yields its state after every new best solution, and at the end.
+
+        :return: Asynchronous generator of states of job.
+        """
+
+        reader, writer = await self._open()
+        try:
+            request = self._solve_request(numbers, target_sum, algorithm, iterations, parameters, deadline)
+            request["stream"] = True
+            writer.write(json.dumps(request).encode() + b"\n")
+            await writer.drain()
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                message = json.loads(line)
+                if "error" in message and "job" not in message:
+                    raise RuntimeError(message["error"])
+                yield message
+                if message.get("event") == "finished":
+                    break
+        finally:
+            writer.close()
+
+
+def main(arguments = None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--unix", help="path of Unix socket, used instead of TCP")
+    parser.add_argument("--workers", type=int, help="maximal number of jobs solved at once")
+    arguments = parser.parse_args(arguments)
+    service = SolveService(arguments.host, arguments.port, arguments.unix, arguments.workers)
+    try:
+        asyncio.run(service.serve_forever())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,640 @@
+import heapq
+import random
+import time
+from collections import namedtuple
+import numpy as np
+from .compact_subset import CompactSubset
+from .search_statistics import SearchStatistics
+from .subset_instance import SubsetInstance
+
+DEADLINE_CHECK_INTERVAL = 256
+RANDOM_BLOCK_SIZE = 1024
+START_STRATEGIES = ("random", "greedy", "differencing", "restricted_greedy")
+
+SolutionUpdate = namedtuple("SolutionUpdate", ["solution", "points", "elapsed"])
+SolutionUpdate.__doc__ = """New best solution found during search, its points and time from start of search (sec)."""
+
+class _SubsetCreator:
+    """A class contains functions which that are using to modifying solutions."""
+
+    # Number of the largest not yet considered numbers from which restricted greedy draws the next one.
+    restricted_candidates = 4
+
+    def __init__(self, target_sum, iterations, set_numbers, compact_subsets = False, time_limit = None,
+                 acceptable_gap = 0, seed = None, start_strategy = "random"):
+        """
+
+        :param target_sum: Searched sum of numbers.
+        :type target_sum: int
+        :param set_numbers: Initial set, from which are creating first subsets,
+                            which we search in order to find a solution. Already prepared SubsetInstance
+                            can be passed to share it between algorithms. Numbers have to be integers (TypeError
+                            is raised otherwise) which fit into int64 (ValueError is raised otherwise).
+        :type set_numbers: set or SubsetInstance
+        :param iterations: Number of algorithm executions.
+        :type iterations: int
+        :param compact_subsets: Subsets are stored as CompactSubset (one byte per number) instead of lists.
+        :type compact_subsets: bool
+        :param time_limit: Maximal time of search (sec). When it passes, the best solution found so far
+                           is returned. No limit by default.
+        :type time_limit: float
+        :param acceptable_gap: Search stops as soon as solution with at most this many points is found.
+        :type acceptable_gap: int
+        :param seed: Seed of random generators of algorithm, so search can be repeated. When not given, it is drawn
+                     from module random (so random.seed() also repeats search) and stored in attribute seed.
+        :type seed: int
+        :param start_strategy: How start subsets are created: "random" (every number is taken with probability 1/2),
+                               "greedy" (numbers from the largest absolute value are taken when they move sum
+                               closer to searched sum), "differencing" (Karmarkar-Karp differencing) or
+                               "restricted_greedy" (greedy which draws every next number from a few largest ones,
+                               so every start subset is different).
+        :type start_strategy: str
+        """
+
+        self.target_sum = target_sum
+        self.iterations = iterations
+        self.set_numbers = set_numbers
+        self.compact_subsets = compact_subsets
+        self.time_limit = time_limit
+        self.acceptable_gap = acceptable_gap
+        if seed is None:
+            seed = random.getrandbits(64)
+        self.seed = seed
+        self.random = random.Random(seed)
+        self.rng = np.random.default_rng(seed)
+        if start_strategy not in START_STRATEGIES:
+            raise ValueError(f"unknown start strategy {start_strategy!r}, expected one of {START_STRATEGIES}")
+        self.start_strategy = start_strategy
+        self._deterministic_start_subset = None
+        try:
+            self.instance = SubsetInstance.of(set_numbers)
+        except TypeError as error:
+            raise TypeError(f"incorrect type for 'set_numbers': {error}") from None
+        self.statistics = None
+        self.observers = []
+
+    def enable_statistics(self):
+        """
+        The function that turns on counting of goal evaluations, generated neighbors, accepted and rejected moves,
+        improvements and measuring time of phases. Counting is off by default and costs almost nothing then.
+
+        :return: Statistics which are filled during search.
+        :rtype: SearchStatistics
+        """
+
+        if self.statistics is None:
+            self.statistics = SearchStatistics()
+        return self.statistics
+
+    def add_observer(self, observer):
+        """
+        The function that registers function called on events of search: observer(algorithm, event, details).
+        Events are "improvement" (details: points, iteration) when better solution is found and "finished"
+        (details: points, statistics) at the end of search.
+
+        :param observer: Called function.
+        :type observer: callable
+        """
+
+        self.observers.append(observer)
+
+    def _notify(self, event, **details):
+        """
+        The function that calls all observers with event.
+
+        :param event: Name of event.
+        :type event: str
+        """
+
+        for observer in self.observers:
+            observer(self, event, details)
+
+    def iterate_solutions(self):
+        """
+        The function that search for solution like search_solution(), but yields every new best solution as soon
+        as it is found, so search can be stopped when found solution is good enough.
+
+        :return: Generator of SolutionUpdate(solution, points, elapsed).
+        :rtype: generator
+        """
+
+        return self._search(True)
+
+    def _search(self, report_improvements):
+        """
+        The function that performs search, yields SolutionUpdate for every new best solution when
+        report_improvements is True, and returns found solution. Algorithms which find solution at once use this
+        implementation, which reports only the final solution.
+
+        :param report_improvements: Yield new best solutions.
+        :type report_improvements: bool
+        :return: Found solution.
+        :rtype: list
+        """
+
+        search_start = time.perf_counter()
+        solution = self.search_solution()
+        if report_improvements and solution is not None:
+            yield SolutionUpdate(solution, self.points_of_sum(sum(solution)), time.perf_counter() - search_start)
+        return solution
+
+    @staticmethod
+    def _run_search(search):
+        """
+        The function that runs search generator to the end and return its result.
+
+        :param search: Generator returned by _search().
+        :type search: generator
+        :return: Result of search.
+        """
+
+        while True:
+            try:
+                next(search)
+            except StopIteration as stop:
+                return stop.value
+
+    def _search_deadline(self):
+        """
+        The function that return time (time.perf_counter) at which search started now has to stop,
+        or None when there is no time limit.
+
+        :rtype: float
+        """
+
+        if self.time_limit is None:
+            return None
+        return time.perf_counter() + self.time_limit
+
+    @staticmethod
+    def _deadline_passed(deadline):
+        """
+        The function that checks if deadline returned by _search_deadline() has passed.
+
+        :param deadline: Deadline of search.
+        :type deadline: float
+        :rtype: bool
+        """
+
+        return deadline is not None and time.perf_counter() >= deadline
+
+    def _phase_start(self):
+        """
+        The function that return start time of phase, or None when statistics are off.
+
+        :rtype: float
+        """
+
+        if self.statistics is None:
+            return None
+        return time.perf_counter()
+
+    def _phase_end(self, phase_name, start_time):
+        """
+        The function that adds time of phase, which started at start_time, to statistics.
+
+        :param phase_name: Name of phase.
+        :type phase_name: str
+        :param start_time: Value returned by _phase_start().
+        :type start_time: float
+        """
+
+        if start_time is not None:
+            self.statistics.add_phase_time(phase_name, time.perf_counter() - start_time)
+
+    def remove_duplicates(self):
+        """
+        The function that remove duplicate numbers from main set. Duplicates are removed once,
+        when SubsetInstance is created, so nothing is left to do here.
+        """
+
+
+    def create_start_subset(self):
+        """
+        The function that creates the subset from which start search, subset contains 0 and 1 numbers.
+        Subset is created with start_strategy.
+
+        :return: Subset which contains 0 and 1 numbers.
+        :rtype: list
+        """
+
+        self.remove_duplicates()
+        if self.start_strategy == "random":
+            start_subset = []
+            for i in range(len(self.instance)):
+                zero_or_one = self.random.randint(0,1)
+                start_subset.append(zero_or_one)
+        elif self.start_strategy == "restricted_greedy":
+            start_subset = self._restricted_greedy_subset()
+        else:
+            # Greedy and differencing always create the same subset, so it is created once.
+            if self._deterministic_start_subset is None:
+                if self.start_strategy == "greedy":
+                    self._deterministic_start_subset = self._greedy_subset()
+                else:
+                    self._deterministic_start_subset = self._differencing_subset()
+            start_subset = self._deterministic_start_subset.copy()
+
+        if self.compact_subsets:
+            return CompactSubset(start_subset)
+        return start_subset
+
+    def _closest_subset_out_of_range(self):
+        """
+        The function that checks with totals of instance if searched sum is outside of range of sums of subsets.
+        Then no subset has searched sum and subset of all positive (or all negative) numbers is the closest one,
+        so exact algorithms return it without search.
+
+        :return: Numbers of the closest subset, or None when searched sum is in range.
+        :rtype: list
+        """
+
+        if self.instance.is_in_range(self.target_sum):
+            return None
+        values = self.values_array
+        if self.target_sum > self.instance.positive_total:
+            return values[values > 0].tolist()
+        return values[values < 0].tolist()
+
+    def _positions_by_magnitude(self):
+        """
+        The function that return positions of numbers of main set from the largest absolute value, numbers with
+        equal absolute value by position. Sorted order of instance is reused: negative numbers in it are already
+        ordered from the largest absolute value and positive numbers in reversed order, so both runs are only
+        merged.
+
+        :rtype: list
+        """
+
+        order = self.instance.sorted_order
+        values = self.values_array
+        split = int(np.searchsorted(values[order], 0))
+        negative = order[:split]
+        non_negative = order[split:][::-1]
+        negative_magnitudes = -values[negative]
+        non_negative_magnitudes = values[non_negative]
+        # Number of non-negative numbers before every negative one: with larger absolute value, or with equal
+        # absolute value (at most one, numbers are different) and lower position.
+        before = np.searchsorted(-non_negative_magnitudes, -negative_magnitudes, side="left")
+        tie = before < len(non_negative)
+        tie[tie] = ((non_negative_magnitudes[before[tie]] == negative_magnitudes[tie])
+                    & (non_negative[before[tie]] < negative[tie]))
+        negative_slots = np.arange(len(negative)) + before + tie
+        positions = np.empty(len(order), dtype=order.dtype)
+        non_negative_slots = np.ones(len(order), dtype=np.bool_)
+        non_negative_slots[negative_slots] = False
+        positions[negative_slots] = negative
+        positions[non_negative_slots] = non_negative
+        return positions.tolist()
+
+    def _greedy_subset(self):
+        """
+        The function that creates subset by considering numbers from the largest absolute value and taking every
+        number which moves sum of subset closer to searched sum.
+
+        :return: Subset which contains 0 and 1 numbers.
+        :rtype: list
+        """
+
+        subset = [0] * len(self.instance)
+        missing_sum = self.target_sum
+        for index in self._positions_by_magnitude():
+            number = self.values[index]
+            if abs(missing_sum - number) < abs(missing_sum):
+                subset[index] = 1
+                missing_sum -= number
+
+        return subset
+
+    def _restricted_greedy_subset(self):
+        """
+        The function that creates subset like _greedy_subset(), but every next considered number is drawn from
+        restricted_candidates largest numbers which were not considered yet.
+
+        :return: Subset which contains 0 and 1 numbers.
+        :rtype: list
+        """
+
+        subset = [0] * len(self.instance)
+        missing_sum = self.target_sum
+        positions = iter(self._positions_by_magnitude())
+        candidates = [index for index, _ in zip(positions, range(self.restricted_candidates))]
+        while candidates:
+            candidate = self.random.randrange(len(candidates))
+            index = candidates[candidate]
+            next_index = next(positions, None)
+            if next_index is None:
+                candidates[candidate] = candidates[-1]
+                candidates.pop()
+            else:
+                candidates[candidate] = next_index
+            number = self.values[index]
+            if abs(missing_sum - number) < abs(missing_sum):
+                subset[index] = 1
+                missing_sum -= number
+
+        return subset
+
+    def _differencing_subset(self):
+        """
+        The function that creates subset with Karmarkar-Karp differencing. Subset with searched sum T exists when
+        main set with additional number S - 2T (S is sum of all numbers) can be split into two parts with equal
+        sums, and the subset is the part with the additional number. Differencing splits numbers into two parts
+        by repeatedly replacing two largest numbers with their difference, which means they are in different
+        parts. Negative number is differenced as its absolute value and then moved to the other part.
+
+        :return: Subset which contains 0 and 1 numbers.
+        :rtype: list
+        """
+
+        values = self.values
+        additional_number = sum(values) - 2 * self.target_sum
+        numbers = list(values) + [additional_number]
+        heap = [(-abs(number), index) for index, number in enumerate(numbers) if number != 0]
+        heapq.heapify(heap)
+        # Pairs (smaller, larger): smaller is in other part than larger.
+        differences = []
+        while len(heap) > 1:
+            negative_larger, larger = heapq.heappop(heap)
+            negative_smaller, smaller = heapq.heappop(heap)
+            differences.append((smaller, larger))
+            if negative_larger != negative_smaller:
+                heapq.heappush(heap, (negative_larger - negative_smaller, larger))
+
+        parts = [1] * len(numbers)
+        for smaller, larger in reversed(differences):
+            parts[smaller] = -parts[larger]
+        for index, number in enumerate(numbers):
+            if number < 0:
+                parts[index] = -parts[index]
+
+        subset_part = parts[-1] if additional_number != 0 else 1
+        return [1 if parts[index] == subset_part and values[index] != 0 else 0 for index in range(len(values))]
+
+    @property
+    def values(self):
+        """
+        Numbers of main set as tuple of Python ints, used by algorithms working with lists. For instance created
+        from numpy array (for example memory mapped file) tuple is created on first use, so vectorized algorithms,
+        which use values_array, do not create it.
+
+        :rtype: tuple
+        """
+
+        return self.instance.values
+
+    @property
+    def values_array(self):
+        """
+        Numbers of main set as read-only numpy array, used by CompactSubset and vectorized computations.
+
+        :rtype: numpy.ndarray
+        """
+
+        return self.instance.array
+
+    def sum_of_subset(self, subset):
+        """
+        The function that return sum of numbers from subset.
+
+        :param subset: Subset whose elements will be summed.
+        :type subset: list, CompactSubset or numpy.ndarray
+        :return: Sum of numbers of subset.
+        :rtype: int
+        """
+
+        if (isinstance(subset, (CompactSubset, np.ndarray))
+                and self.instance.positive_total - self.instance.negative_total > np.iinfo(np.int64).max):
+            # Sum could overflow int64, so taken numbers are summed as Python ints.
+            bits = subset.bits if isinstance(subset, CompactSubset) else subset
+            return sum(self.values_array[bits.astype(np.bool_)].tolist())
+        if isinstance(subset, CompactSubset):
+            return subset.sum(self.values_array)
+        if isinstance(subset, np.ndarray):
+            return int(np.dot(self.values_array, subset))
+
+        subset_sum = 0
+        for number, zero_or_one in zip(self.values, subset):
+            if zero_or_one == 1:
+                subset_sum += number
+
+        return subset_sum
+
+
+    def points_of_sum(self, subset_sum):
+        """
+        The function that evaluates the quality of a solution using already known sum of its numbers.
+
+        :param subset_sum: Sum of numbers of evaluated subset.
+        :type subset_sum: int
+        :return: Solution quality points.
+        :rtype: int
+        """
+
+        return abs(self.target_sum - subset_sum)
+
+    def flip_sum(self, subset, subset_sum, index):
+        """
+        The function that return sum of the neighboring solution which differs from subset only on given position.
+        Sum is computed from sum of subset in constant time, without summing whole neighbor again.
+
+        :param subset: Subset from which neighboring solution is created.
+        :type subset: list
+        :param subset_sum: Sum of numbers of subset.
+        :type subset_sum: int
+        :param index: Position on which 0 or 1 number is changed.
+        :type index: int
+        :return: Sum of numbers of neighboring solution.
+        :rtype: int
+        """
+
+        if subset[index] == 1:
+            return subset_sum - self.values[index]
+        return subset_sum + self.values[index]
+
+    def flip(self, subset, index):
+        """
+        The function that change 0 or 1 number on given position of subset in place.
+
+        :param subset: Subset that will be modified.
+        :type subset: list or CompactSubset
+        :param index: Position on which 0 or 1 number is changed.
+        :type index: int
+        """
+
+        if isinstance(subset, CompactSubset):
+            subset.flip(index)
+        elif subset[index] == 1:
+            subset[index] = 0
+        else:
+            subset[index] = 1
+
+    def find_closing_swap(self, subset, subset_sum):
+        """
+        The function that finds swap (one number of subset is removed and one number outside of subset is added)
+        which gives exactly searched sum. Number b added for removed number a has to be a + target_sum - subset_sum,
+        so numbers outside of subset are put into dictionary and every number of subset is looked up once,
+        in O(n) expected time instead of trying all O(n^2) pairs.
+
+        :param subset: Subset from which swap is made.
+        :type subset: list, CompactSubset or numpy.ndarray
+        :param subset_sum: Sum of numbers of subset.
+        :type subset_sum: int
+        :return: Position of removed number and position of added number, or None when no swap gives
+                 searched sum.
+        :rtype: tuple
+        """
+
+        residual = self.target_sum - subset_sum
+        if residual == 0:
+            return None
+        taken = np.asarray(subset, dtype=np.bool_)
+        outside_positions = np.flatnonzero(~taken)
+        outside = dict(zip(self.values_array[outside_positions].tolist(), outside_positions.tolist()))
+        inside_positions = np.flatnonzero(taken).tolist()
+        wanted_numbers = (self.values_array[taken] + residual).tolist()
+        for remove_index, add_index in zip(inside_positions, map(outside.get, wanted_numbers)):
+            if add_index is not None:
+                return remove_index, add_index
+        return None
+
+    def apply_swap(self, subset, subset_sum, swap):
+        """
+        The function that applies swap found by find_closing_swap() to subset in place.
+
+        :param subset: Changed subset.
+        :type subset: list or CompactSubset
+        :param subset_sum: Sum of numbers of subset.
+        :type subset_sum: int
+        :param swap: Position of removed number and position of added number.
+        :type swap: tuple
+        :return: Sum of numbers of subset after swap.
+        :rtype: int
+        """
+
+        for index in swap:
+            subset_sum = self.flip_sum(subset, subset_sum, index)
+            self.flip(subset, index)
+        return subset_sum
+
+    def random_flip_index(self, subset):
+        """
+        The function that draw position on which random neighboring solution differs from subset.
+
+        :param subset: Subset from which neighboring solution is created.
+        :type subset: list
+        :return: Position of changed 0 or 1 number.
+        :rtype: int
+        """
+
+        return self.random.randint(0, len(subset) - 1)
+
+    def _random_positions(self):
+        """
+        The function that generates random positions of subset. Positions are drawn from rng in blocks of
+        RANDOM_BLOCK_SIZE, so one position costs one next() call instead of one call of random module.
+
+        :return: Endless generator of positions.
+        :rtype: generator
+        """
+
+        length = len(self.instance)
+        while True:
+            yield from self.rng.integers(0, length, RANDOM_BLOCK_SIZE).tolist()
+
+    def _random_exponentials(self):
+        """
+        The function that generates random numbers from exponential distribution with mean 1, drawn from rng
+        in blocks of RANDOM_BLOCK_SIZE.
+
+        :return: Endless generator of numbers.
+        :rtype: generator
+        """
+
+        while True:
+            yield from self.rng.standard_exponential(RANDOM_BLOCK_SIZE).tolist()
+
+    def create_neighbours_for_subset(self, subset):
+        """
+        The function which create neighboring solutions for subset.
+
+        :param subset: Subset from which are creating neighboring solutions
+        :type subset: list
+        :return: Nested list with neighbouring solutions and current subset
+        :rtype: list
+        """
+
+        neighbours = []
+        neighbours.append(subset)
+
+        for i in range(len(self.instance)):
+
+            new_neighbor = subset.copy()
+            if new_neighbor[i] == 0:
+                new_neighbor[i] = 1
+            else:
+                new_neighbor[i] = 0
+
+            neighbours.append(new_neighbor)
+
+        return neighbours
+
+    def goal_function(self, subset):
+        """
+        The function that evaluates the quality of a given solution (subset).
+
+        :param subset: Evaluated subset.
+        :type subset: list
+        :return: Solution quality points.
+        :rtype: int
+        """
+
+        sum_of_subset = self.sum_of_subset(subset)
+        try:
+            points = abs(self.target_sum - sum_of_subset)
+        except TypeError:
+            print("TypeError: incorrect type of parameter for HillClimbingDeterministic()")
+        else:
+            return points
+
+    def convert_subset_into_decimal(self, subset):
+        """
+        The function that convert binary numbers in subset into decimal numbers.
+
+        :param subset: Subset that will be converted.
+        :type subset: list, CompactSubset or numpy.ndarray
+        :return: Converted subset.
+        :rtype: list
+        """
+
+        if isinstance(subset, CompactSubset):
+            return subset.decode(self.values_array)
+        if isinstance(subset, np.ndarray):
+            return self.values_array[subset.astype(np.bool_)].tolist()
+
+        decimal_numbers = []
+        for number, zero_or_one in zip(self.values, subset):
+            if zero_or_one == 1:
+                decimal_numbers.append(number)
+
+        return  decimal_numbers
+
+    def display_search_solution_steps(self, iterations, current_subset, current_subset_points,
+                                      best_subset, best_subset_points):
+        """
+        The function that display steps of searching for best solution.
+
+        :param iterations: Loop iterations
+        :type iterations: int
+        :param current_subset: Neighboring solution that is check
+        :type current_subset: list
+        :param current_subset_points: Points of current subset
+        :type current_subset_points: int
+        :param best_subset: Best found solution
+        :type best_subset: list
+        :param best_subset_points: Points of the best solution
+        :type best_subset_points: list
+        """
+        print(f"Iter: {iterations} current subset: {current_subset}, current subset points: "
+                                f"{current_subset_points}, best_subset points: {best_subset_points}, "
+                                f"best subset: {best_subset}")
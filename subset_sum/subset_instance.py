@@ -0,0 +1,139 @@
+import itertools
+import operator
+import numpy as np
+
+
+class SubsetInstance:
+    """Main set prepared once for all algorithms: numbers without duplicates and values computed from them,
+    which algorithms would otherwise compute again on every call. Instance is immutable, so one instance can be
+    shared by many algorithms by passing it as set_numbers."""
+
+    def __init__(self, set_numbers):
+        """
+
+        :param set_numbers: Initial set of integer numbers. Duplicates are removed, order of first
+                            occurrences is kept. One-dimensional numpy array of integers (also memory mapped file)
+                            is used without creating Python ints and without copy when it is int64 array without
+                            duplicates. Numbers have to fit into int64, otherwise ValueError is raised; TypeError
+                            is raised when set_numbers are not integer numbers.
+        :type set_numbers: set or numpy.ndarray
+        """
+
+        if isinstance(set_numbers, np.ndarray):
+            self._values = None
+            array, sorted_order = self._unique_in_order(set_numbers)
+            self.array = self._read_only(array)
+            self.sorted_order = self._read_only(sorted_order)
+        else:
+            self._values = tuple(map(operator.index, dict.fromkeys(set_numbers)))
+            try:
+                self.array = self._read_only(np.array(self._values, dtype=np.int64))
+            except OverflowError:
+                raise ValueError("numbers of main set must fit into int64") from None
+            self.sorted_order = self._read_only(np.argsort(self.array, kind="stable"))
+        sorted_values = self.array[self.sorted_order]
+        self.prefix_sums = self._read_only(self._prefix_sums(sorted_values))
+        self.negative_total = int(self.prefix_sums[np.searchsorted(sorted_values, 0)])
+        self.positive_total = int(self.prefix_sums[-1]) - self.negative_total
+
+    @property
+    def values(self):
+        """
+        Numbers of main set as tuple of Python ints. For instance created from numpy array, tuple is created on
+        first use.
+
+        :rtype: tuple
+        """
+
+        if self._values is None:
+            self._values = tuple(self.array.tolist())
+        return self._values
+
+    @staticmethod
+    def _unique_in_order(numbers):
+        """
+        The function that removes duplicates from array and keeps order of first occurrences. One sort finds
+        duplicates and gives also sorted order of numbers without duplicates.
+
+        :param numbers: One-dimensional array of integers.
+        :type numbers: numpy.ndarray
+        :return: Array without duplicates (view of numbers, when there are no duplicates) and its sorted order.
+        :rtype: tuple
+        """
+
+        if numbers.ndim != 1 or numbers.dtype.kind not in "iu":
+            raise TypeError("set_numbers array must be one-dimensional array of integers")
+        if numbers.dtype == np.uint64 and len(numbers) and numbers.max() > np.iinfo(np.int64).max:
+            raise ValueError("numbers of main set must fit into int64")
+        array = numbers.astype(np.int64, copy=False).view(np.ndarray)
+        # Numbers without duplicates are different, so unstable (faster) sort gives the same order as stable one.
+        order = np.argsort(array)
+        sorted_values = array[order]
+        first = np.ones(len(array), dtype=np.bool_)
+        np.not_equal(sorted_values[1:], sorted_values[:-1], out=first[1:])
+        if first.all():
+            return array, order
+
+        first_positions = np.minimum.reduceat(order, np.flatnonzero(first))
+        kept = np.sort(first_positions)
+        new_positions = np.empty(len(array), dtype=np.intp)
+        new_positions[kept] = np.arange(len(kept))
+        return array[kept], new_positions[first_positions]
+
+    @staticmethod
+    def _prefix_sums(sorted_values):
+        """
+        The function that return sums of the lowest numbers, starting with 0. Sums are int64 when no sum can
+        overflow it, otherwise they are exact Python ints (object array).
+
+        :param sorted_values: Sorted numbers.
+        :type sorted_values: numpy.ndarray
+        :rtype: numpy.ndarray
+        """
+
+        if len(sorted_values) == 0:
+            return np.zeros(1, dtype=np.int64)
+        magnitude = max(-int(sorted_values[0]), int(sorted_values[-1]))
+        if magnitude * len(sorted_values) <= np.iinfo(np.int64).max:
+            return np.concatenate(([0], np.cumsum(sorted_values)))
+        return np.array([0] + list(itertools.accumulate(sorted_values.tolist())), dtype=object)
+
+    @staticmethod
+    def _read_only(array):
+        array.flags.writeable = False
+        return array
+
+    @classmethod
+    def of(cls, set_numbers):
+        """
+        The function that return instance for set_numbers, which are prepared only when they are not
+        an instance already.
+
+        :param set_numbers: Initial set or already prepared instance.
+        :type set_numbers: set or SubsetInstance
+        :return: Prepared instance.
+        :rtype: SubsetInstance
+        """
+
+        if isinstance(set_numbers, cls):
+            return set_numbers
+        return cls(set_numbers)
+
+    def is_in_range(self, target_sum):
+        """
+        The function that checks if searched sum lies between the lowest and the highest sum of any subset.
+        Sums outside of this range can not be reached.
+
+        :param target_sum: Searched sum of numbers.
+        :type target_sum: int
+        :return: True if searched sum can be reachable.
+        :rtype: bool
+        """
+
+        return self.negative_total <= target_sum <= self.positive_total
+
+    def __len__(self):
+        return len(self.array)
+
+    def __iter__(self):
+        return iter(self.values)
@@ -0,0 +1,210 @@
+from  .subset_creator import _SubsetCreator, SolutionUpdate
+import time
+import numpy as np
+from .search_statistics import GOAL_EVALUATIONS, NEIGHBOURS_GENERATED, ACCEPTED_MOVES, IMPROVEMENTS
+
+NOT_ALLOWED = np.iinfo(np.int64).max
+
+class TabuSearch(_SubsetCreator):
+    """Tabu search always moves to the best allowed neighboring solution, also when it is worse than current one,
+    so it leaves local optima without randomness. Positions changed in the last tabu_tenure iterations can not be
+    changed again (they are tabu), unless the change gives solution better than any found before (aspiration).
+    Hashes of visited solutions are remembered and the search does not come back to them."""
+
+    def __init__(self, target_sum, iterations, set_numbers, tabu_tenure = 10, display_steps = False,
+                 compact_subsets = False, time_limit = None, acceptable_gap = 0, seed = None,
+                 start_strategy = "random"):
+        """
+
+        :param target_sum: Searched sum of numbers.
+        :type target_sum: int
+        :param iterations: Number of algorithm executions.
+        :type iterations: int
+        :param set_numbers: Initial set, from which we create subsets, which we search in order to find a solution.
+        :type set_numbers: set
+        :param tabu_tenure: Number of iterations for which changed position is tabu. It is limited to half of
+               size of main set.
+        :type tabu_tenure: int
+        :param display_steps: Allows to display the steps that the algorithm performs in order to find
+               solutions. Not recommended due to the huge amount of displayed information.
+        :type display_steps: bool
+        :param compact_subsets: Subsets are stored as CompactSubset (one byte per number) instead of lists.
+        :type compact_subsets: bool
+        :param time_limit: Maximal time of search (sec), after which the best solution found so far is returned.
+               Time is checked once per iteration.
+        :type time_limit: float
+        :param acceptable_gap: Search stops when solution with at most this many points is found.
+        :type acceptable_gap: int
+        :param seed: Seed of random generators, so search can be repeated.
+        :type seed: int
+        :param start_strategy: How start subsets are created: "random", "greedy", "differencing" or
+                               "restricted_greedy", see _SubsetCreator.
+        :type start_strategy: str
+        """
+        super().__init__(target_sum, iterations, set_numbers, compact_subsets, time_limit, acceptable_gap, seed,
+                         start_strategy)
+        self.tabu_tenure = tabu_tenure
+        self.display_steps = display_steps
+
+    def search_solution(self):
+        """
+        The function that search for best solution.
+
+        :return: Best found solution.
+        :rtype: list
+        """
+
+        return self._run_search(self._search(False))
+
+    def _search(self, report_improvements):
+        """
+        The function that search for best solution and yields every better solution when report_improvements
+        is True. Points of all neighbors are computed at once as abs(target_sum - (subset_sum +/- value)),
+        like in HillClimbingDeterministic with implicit_neighbours.
+
+        :param report_improvements: Yield new best solutions.
+        :type report_improvements: bool
+        :return: Best found solution.
+        :rtype: list
+        """
+
+        search_start = time.perf_counter()
+        deadline = self._search_deadline()
+        phase_start = self._phase_start()
+        current_subset = self.create_start_subset()
+        values = self.values_array
+        signs = 1 - 2 * np.array(current_subset, dtype=np.int64)
+        neighbours_points = np.empty(len(values), dtype=np.int64)
+        # Position is tabu while iteration is lower than its entry.
+        tabu_until = np.zeros(len(values), dtype=np.int64)
+        tabu_tenure = min(self.tabu_tenure, len(values) // 2)
+        # Zobrist hashing: hash of subset is xor of random keys of taken positions, so changing one position
+        # changes hash with one xor.
+        zobrist_keys = self.rng.integers(0, 2 ** 63, len(values), dtype=np.int64)
+        subset_hash = int(np.bitwise_xor.reduce(zobrist_keys[signs < 0])) if len(values) else 0
+        zobrist_keys = zobrist_keys.tolist()
+        visited_hashes = {subset_hash}
+        current_sum = self.sum_of_subset(signs < 0)
+        # None while current subset is the best one, so it is copied only before search moves away from it.
+        best_subset = None
+        best_subset_points = self.points_of_sum(current_sum)
+        iter_count = 1
+        counters = self.statistics.counters if self.statistics is not None else None
+        if counters is not None:
+            counters[GOAL_EVALUATIONS] += 1
+        self._phase_end("start", phase_start)
+        if report_improvements:
+            yield SolutionUpdate(self.convert_subset_into_decimal(signs < 0), best_subset_points,
+                                 time.perf_counter() - search_start)
+        phase_start = self._phase_start()
+
+        if self.display_steps:
+                print(f"Iter: {iter_count} start subset: {current_subset} start subset points: "
+                      f" {best_subset_points}")
+
+        if len(values) == 0:
+            return []
+
+        while iter_count <= self.iterations:
+            if best_subset_points <= self.acceptable_gap or self._deadline_passed(deadline):
+                break
+            np.multiply(signs, values, out=neighbours_points)
+            neighbours_points += current_sum - self.target_sum
+            np.abs(neighbours_points, out=neighbours_points)
+            if counters is not None:
+                counters[GOAL_EVALUATIONS] += len(values)
+                counters[NEIGHBOURS_GENERATED] += len(values)
+
+            change_index = int(neighbours_points.argmin())
+            current_points = int(neighbours_points[change_index])
+            neighbour_hash = subset_hash ^ zobrist_keys[change_index]
+            if ((tabu_until[change_index] > iter_count and current_points >= best_subset_points)
+                    or neighbour_hash in visited_hashes):
+                # Tabu positions are allowed only when they give the best solution so far (aspiration).
+                allowed_points = np.where((tabu_until <= iter_count) | (neighbours_points < best_subset_points),
+                                          neighbours_points, NOT_ALLOWED)
+                while True:
+                    change_index = int(allowed_points.argmin())
+                    current_points = int(allowed_points[change_index])
+                    neighbour_hash = subset_hash ^ zobrist_keys[change_index]
+                    if current_points == NOT_ALLOWED or neighbour_hash not in visited_hashes:
+                        break
+                    allowed_points[change_index] = NOT_ALLOWED
+                if current_points == NOT_ALLOWED:
+                    break
+
+            if current_points >= best_subset_points and best_subset is None:
+                best_subset = current_subset.copy()
+            current_sum += int(signs[change_index] * values[change_index])
+            self.flip(current_subset, change_index)
+            signs[change_index] = -signs[change_index]
+            subset_hash = neighbour_hash
+            visited_hashes.add(subset_hash)
+            tabu_until[change_index] = iter_count + tabu_tenure + 1
+            iter_count += 1
+            if counters is not None:
+                counters[ACCEPTED_MOVES] += 1
+
+            if current_points < best_subset_points:
+                best_subset = None
+                best_subset_points = current_points
+                if counters is not None:
+                    counters[IMPROVEMENTS] += 1
+                if self.observers:
+                    self._notify("improvement", points=best_subset_points, iteration=iter_count - 1)
+                if report_improvements:
+                    yield SolutionUpdate(self.convert_subset_into_decimal(signs < 0), best_subset_points,
+                                         time.perf_counter() - search_start)
+
+            if self.display_steps:
+                print(f"Iter: {iter_count - 1} changed position: {change_index}, current subset points: "
+                      f"{current_points}, best_subset points: {best_subset_points}, current subset: "
+                      f"{current_subset}")
+
+        if best_subset is None:
+            best_subset = current_subset
+        self._phase_end("search", phase_start)
+        phase_start = self._phase_start()
+        best_solution = self.convert_subset_into_decimal(np.array(best_subset, dtype=np.bool_))
+        self._phase_end("decode", phase_start)
+        if self.observers:
+            self._notify("finished", points=best_subset_points, statistics=self.statistics)
+        return best_solution
+
+    def execution_time(self):
+        """
+        The function that return execution time for search of solution (sec).
+
+        :return: Time execution of search of solution.
+        :rtype: str
+        """
+
+        start_time = time.perf_counter()
+        self.search_solution()
+        formatted_time = "{:.9f}".format(time.perf_counter() - start_time)
+        return formatted_time
+
+    def how_algorithm_works(self):
+        """
+        The function that display description how tabu search works for subset sum problem.
+        """
+
+        print("""
+        Start arguments: main_set = {5, 1, 2, 3, 4} , sum_to_find = 5, tabu_tenure = 2
+
+        1. Like in hill climbing deterministic, we start from random subset, for example [0, 1, 0, 1, 1] -> {1, 3, 4},
+            and rate all neighboring solutions (subsets with one changed position) with
+                points = abs(sum_to_find - sum_of_neighbor)
+
+        2. We always move to the neighbor with the lowest points, also when it is worse than current subset.
+            That is how the search leaves a local optimum, where all neighbors are worse.
+
+        3. Changed position is tabu for next 2 iterations, so the search can not simply go back.
+            Tabu position can be changed only if it gives solution better than all found before (aspiration).
+
+        4. Every visited subset is remembered by its hash. Hash is xor of random numbers of taken positions,
+            so one change of position changes hash with one xor. Neighbors which were already visited are skipped.
+
+        5. The best subset found during whole search is returned. Search stops when solution has 0 points
+            or after given number of iterations.
+        """)
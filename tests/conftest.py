@@ -0,0 +1,27 @@
+import itertools
+import random
+
+import pytest
+
+
+def _closest_gap(numbers, target_sum):
+    numbers = list(dict.fromkeys(numbers))
+    return min(abs(target_sum - sum(subset)) for size in range(len(numbers) + 1)
+               for subset in itertools.combinations(numbers, size))
+
+
+@pytest.fixture
+def closest_gap():
+    """Distance of the closest subset sum to searched sum, found by checking all subsets."""
+    return _closest_gap
+
+
+@pytest.fixture
+def small_instances():
+    """Small random sets with searched sums, both reachable and unreachable, with negative numbers."""
+    instances = []
+    for seed in range(60):
+        generator = random.Random(seed)
+        numbers = [generator.randint(-40, 60) * generator.choice([1, 1, 997]) for i in range(generator.randint(0, 11))]
+        instances.append((numbers, generator.randint(-200, 400) * generator.choice([1, 1, 50])))
+    return instances
@@ -0,0 +1,37 @@
+import itertools
+
+import pytest
+
+from subset_sum import ApproximationScheme
+
+
+def _highest_sum_not_above(numbers, target_sum):
+    numbers = list(dict.fromkeys(numbers))
+    return max(total for size in range(len(numbers) + 1) for subset in itertools.combinations(numbers, size)
+               if (total := sum(subset)) <= target_sum)
+
+
+@pytest.mark.parametrize("epsilon", [0.5, 0.1, 0.01])
+def test_found_sum_is_within_guarantee(epsilon, small_instances):
+    for numbers, target_sum in small_instances:
+        negative_total = sum(number for number in set(numbers) if number < 0)
+        if target_sum < negative_total:
+            continue
+        solution = ApproximationScheme(target_sum, 1, numbers, epsilon=epsilon, checkpoint_interval=2).search_solution()
+        assert len(set(solution)) == len(solution) and set(solution) <= set(numbers)
+        best = _highest_sum_not_above(numbers, target_sum)
+        assert sum(solution) <= target_sum
+        assert sum(solution) - negative_total >= (1 - epsilon) * (best - negative_total)
+
+
+def test_sums_higher_than_int64_are_exact():
+    numbers = [2 ** 62 + 3, 2 ** 62 - 5, 2 ** 61 + 7, 2 ** 60, 12345]
+    target_sum = 3 * 2 ** 62
+    solution = ApproximationScheme(target_sum, 1, numbers, epsilon=0.001).search_solution()
+    best = _highest_sum_not_above(numbers, target_sum)
+    assert best * (1 - 0.001) <= sum(solution) <= target_sum
+
+
+def test_invalid_epsilon_is_refused():
+    with pytest.raises(ValueError, match="epsilon"):
+        ApproximationScheme(5, 1, [1, 2], epsilon=1)
@@ -0,0 +1,28 @@
+import json
+
+from subset_sum import SOLVERS
+from subset_sum.benchmark import DEFAULT_MATRIX, find_regressions, main, run_benchmark
+
+
+def test_default_matrix_measures_every_algorithm():
+    measured = {algorithm["name"] for algorithm in DEFAULT_MATRIX["algorithms"]
+                if any(size <= algorithm.get("max_size", size) for size in DEFAULT_MATRIX["sizes"])}
+    assert measured == set(SOLVERS)
+
+
+def test_run_is_repeatable_and_has_no_regressions_against_itself():
+    matrix = dict(DEFAULT_MATRIX, sizes=[12], target_positions=[0.5], iterations=10)
+    results = run_benchmark(matrix, warmups=0, repeats=1, seed=3)
+    assert {result["algorithm"] for result in results} == {algorithm.get("label", algorithm["name"])
+                                                           for algorithm in matrix["algorithms"]}
+    again = run_benchmark(matrix, warmups=0, repeats=1, seed=3)
+    assert [result["gaps"] for result in results] == [result["gaps"] for result in again]
+    assert not find_regressions(again, results, time_tolerance=1000, gap_tolerance=0)
+    assert all(result["max_gap"] == 0 for result in results if result["algorithm"] in ("dynamic_programming",
+                                                                                        "meet_in_the_middle"))
+
+
+def test_command_writes_results(tmp_path):
+    output = tmp_path / "results.json"
+    main(["--sizes", "10", "--repeats", "1", "--warmups", "0", "--output", str(output)])
+    assert json.loads(output.read_text())["results"]
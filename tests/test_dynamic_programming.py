@@ -0,0 +1,32 @@
+import pytest
+
+from subset_sum import DynamicProgramming
+
+
+@pytest.mark.parametrize("checkpoint_interval", [None, 1, 3])
+def test_finds_closest_sum(checkpoint_interval, small_instances, closest_gap):
+    for numbers, target_sum in small_instances:
+        solver = DynamicProgramming(target_sum, 1, numbers, checkpoint_interval=checkpoint_interval)
+        solution = solver.search_solution()
+        assert len(set(solution)) == len(solution) and set(solution) <= set(numbers)
+        assert abs(target_sum - sum(solution)) == closest_gap(numbers, target_sum)
+        assert solver.is_reachable() == (closest_gap(numbers, target_sum) == 0)
+
+
+def test_target_out_of_range():
+    solver = DynamicProgramming(100, 1, [5, -3, 8])
+    assert solver.is_reachable() is False
+    assert sorted(solver.search_solution()) == [5, 8]
+    assert DynamicProgramming(-100, 1, [5, -3, 8]).search_solution() == [-3]
+
+
+def test_acceptable_gap_stops_early():
+    numbers = [2 * number for number in range(1, 40)]
+    solver = DynamicProgramming(101, 1, numbers, checkpoint_interval=4, acceptable_gap=1)
+    assert abs(101 - sum(solver.search_solution())) <= 1
+    assert solver.is_reachable() is None
+
+
+def test_too_large_bitset_is_refused():
+    with pytest.raises(ValueError, match="dynamic programming needs"):
+        DynamicProgramming(5, 1, [10 ** 12, 7, 3]).search_solution()
@@ -0,0 +1,35 @@
+import random
+
+import numpy as np
+import pytest
+
+from subset_sum import GeneticAlgorithm
+
+HUGE_NUMBERS = [2 ** 62 + 3, 2 ** 62 - 5, 2 ** 61 + 7, 2 ** 60, -2 ** 62, 12345, 2 ** 62 + 11, -9 * 10 ** 18]
+
+
+def test_population_sums_are_exact_in_every_range():
+    for numbers in ([3, -7, 11, 2 ** 40], [2 ** 60, 2 ** 60 + 1, -5], HUGE_NUMBERS):
+        algorithm = GeneticAlgorithm(0, 1, numbers, 4, vectorized=True, seed=1)
+        population = np.random.default_rng(2).integers(0, 2, (50, len(numbers)), dtype=np.uint8)
+        expected = [sum(number for number, taken in zip(numbers, individual) if taken) for individual in population]
+        assert algorithm._population_sums(population).tolist() == expected
+
+
+@pytest.mark.parametrize("selection", ["roulette", "stochastic_universal", "tournament"])
+def test_sums_out_of_int64_do_not_overflow(selection):
+    target_sum = 3 * 2 ** 62 + 2 ** 60 + 1
+    algorithm = GeneticAlgorithm(target_sum, 20, HUGE_NUMBERS, 8, vectorized=True, selection=selection, seed=1)
+    solution = algorithm.search_for_best_individual()
+    assert set(solution) <= set(HUGE_NUMBERS)
+    assert len(set(solution)) == len(solution)
+
+
+@pytest.mark.parametrize("vectorized", [False, True])
+def test_seed_repeats_search(vectorized):
+    generator = random.Random(4)
+    numbers = list(dict.fromkeys(generator.randint(-1000, 1000) for i in range(100)))
+    solutions = [GeneticAlgorithm(2500, 15, numbers, 10, vectorized=vectorized, seed=9).search_for_best_individual()
+                 for i in range(2)]
+    assert solutions[0] == solutions[1]
+    assert set(solutions[0]) <= set(numbers)
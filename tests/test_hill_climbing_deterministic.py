@@ -0,0 +1,60 @@
+import random
+
+import pytest
+
+from subset_sum import HillClimbingDeterministic
+
+
+def _numbers(seed, count = 200):
+    generator = random.Random(seed)
+    return list(dict.fromkeys(generator.randint(-1000, 1000) for i in range(count)))
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_time_limit_does_not_change_search(seed):
+    numbers = _numbers(seed)
+    results = []
+    for time_limit in (None, 100):
+        algorithm = HillClimbingDeterministic(5000, 30, numbers, seed=seed, time_limit=time_limit)
+        statistics = algorithm.enable_statistics()
+        results.append((algorithm.search_solution(), list(statistics.counters)))
+    assert results[0] == results[1]
+
+
+def test_time_limit_stops_scoring_of_large_set():
+    numbers = _numbers(1, 20000)
+    algorithm = HillClimbingDeterministic(10 ** 9, 10 ** 6, numbers, seed=1, time_limit=0.05)
+    solution = algorithm.search_solution()
+    assert set(solution) <= set(numbers)
+
+
+@pytest.mark.parametrize("implicit_neighbours", [False, True])
+def test_solution_is_subset_with_reported_points(implicit_neighbours):
+    numbers = _numbers(5)
+    algorithm = HillClimbingDeterministic(777, 50, numbers, seed=3, implicit_neighbours=implicit_neighbours)
+    updates = list(algorithm.iterate_solutions())
+    assert [update.points for update in updates] == sorted((update.points for update in updates), reverse=True)
+    assert updates[-1].points == abs(777 - sum(updates[-1].solution))
+    assert set(updates[-1].solution) <= set(numbers)
+
+
+def test_swap_moves_give_the_same_search_with_and_without_list_of_neighbours():
+    for seed in range(300):
+        generator = random.Random(seed)
+        numbers = list(dict.fromkeys(generator.randint(-30, 30) for i in range(generator.randint(1, 12))))
+        target_sum = generator.randint(-40, 80)
+        results = []
+        for implicit_neighbours in (False, True):
+            algorithm = HillClimbingDeterministic(target_sum, 20, numbers, seed=seed, use_swap_moves=True,
+                                                  implicit_neighbours=implicit_neighbours)
+            statistics = algorithm.enable_statistics()
+            results.append((algorithm.search_solution(), list(statistics.counters)[2:]))
+        assert results[0] == results[1], seed
+
+
+def test_swap_is_searched_also_on_plateau():
+    numbers = [4, 20, 23, 25, 21, 17, 8, 9]
+    for implicit_neighbours in (False, True):
+        algorithm = HillClimbingDeterministic(42, 20, numbers, seed=14, use_swap_moves=True,
+                                              implicit_neighbours=implicit_neighbours)
+        assert sorted(algorithm.search_solution()) == [4, 8, 9, 21]
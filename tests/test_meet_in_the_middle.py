@@ -0,0 +1,52 @@
+import pytest
+
+from subset_sum import MeetInTheMiddle
+from subset_sum import meet_in_the_middle
+
+
+def _check_solution(solver, solution, numbers):
+    assert len(set(solution)) == len(solution)
+    assert set(solution) <= set(numbers)
+    assert solver.best_sum == sum(solution)
+
+
+@pytest.mark.parametrize("variant", ["horowitz_sahni", "schroeppel_shamir"])
+@pytest.mark.parametrize("chunk_size", [2, 2 ** 20])
+def test_finds_closest_sum(variant, chunk_size, small_instances, closest_gap, monkeypatch):
+    monkeypatch.setattr(meet_in_the_middle, "JOIN_CHUNK_SIZE", chunk_size)
+    for numbers, target_sum in small_instances:
+        solver = MeetInTheMiddle(target_sum, 1, numbers, variant=variant)
+        solution = solver.search_solution()
+        _check_solution(solver, solution, numbers)
+        assert abs(target_sum - sum(solution)) == closest_gap(numbers, target_sum)
+        assert solver.is_reachable() == (closest_gap(numbers, target_sum) == 0)
+
+
+@pytest.mark.parametrize("variant", ["horowitz_sahni", "schroeppel_shamir"])
+def test_sums_out_of_int64_are_exact(variant, closest_gap):
+    numbers = [2 ** 62 + 3, 2 ** 62 - 5, 2 ** 61 + 7, 2 ** 60, -2 ** 62, 12345, 2 ** 62 + 11]
+    target_sum = 3 * 2 ** 62 + 2 ** 60 + 1
+    solver = MeetInTheMiddle(target_sum, 1, numbers, variant=variant)
+    solution = solver.search_solution()
+    _check_solution(solver, solution, numbers)
+    assert abs(target_sum - sum(solution)) == closest_gap(numbers, target_sum)
+
+
+def test_acceptable_gap_stops_early():
+    numbers = [2 * number for number in range(1, 30)]
+    solver = MeetInTheMiddle(101, 1, numbers, acceptable_gap=1)
+    assert abs(101 - sum(solver.search_solution())) == 1
+    assert solver.is_reachable() is None
+
+
+def test_time_limit_stops_join_of_large_set():
+    numbers = [2 * (3 ** 35 // (number + 2)) for number in range(60)]
+    solver = MeetInTheMiddle(sum(numbers) // 3 // 2 * 2 + 1, 1, numbers, time_limit=0.2)
+    solution = solver.search_solution()
+    assert solver.stopped_early
+    _check_solution(solver, solution, numbers)
+
+
+def test_too_large_set_is_refused():
+    with pytest.raises(ValueError, match="at most 60 numbers"):
+        MeetInTheMiddle(5, 1, range(1, 62)).search_solution()
@@ -0,0 +1,64 @@
+import numpy as np
+import pytest
+
+from subset_sum.number_loader import load_instance, map_binary, read_text, save_binary
+
+
+def _write(tmp_path, name, content):
+    path = tmp_path / name
+    path.write_bytes(content)
+    return str(path)
+
+
+def test_text_chunks_split_lines_and_keep_order(tmp_path):
+    numbers = list(range(-500, 1500, 3))
+    path = _write(tmp_path, "numbers.txt", "\n".join(f"{a}, {a + 1}" for a in numbers).encode())
+    loaded = read_text(path, chunk_size=64)
+    assert loaded.tolist() == [number for a in numbers for number in (a, a + 1)]
+
+
+def test_instance_removes_duplicates_and_reports_statistics(tmp_path):
+    path = _write(tmp_path, "numbers.txt", b"5 -3 5 7 -3 0\n")
+    instance, statistics = load_instance(path)
+    assert list(instance.values) == [5, -3, 7, 0]
+    assert statistics == (6, 4, -3, 7, -3, 12)
+
+
+def test_csv_column_with_header(tmp_path):
+    path = _write(tmp_path, "numbers.csv", b"name,amount\na,10\nb,-4\nc,10\n")
+    instance, statistics = load_instance(path, column=1)
+    assert list(instance.values) == [10, -4]
+    assert statistics.count == 3
+
+
+def test_header_without_numbers_is_skipped(tmp_path):
+    path = _write(tmp_path, "numbers.txt", b"amounts\n1 2 3\n")
+    assert read_text(path).tolist() == [1, 2, 3]
+
+
+def test_first_line_with_mistake_is_not_skipped(tmp_path):
+    path = _write(tmp_path, "numbers.txt", b"1 2 x\n3 4\n")
+    with pytest.raises(ValueError, match="'x' is not integer number"):
+        read_text(path)
+
+
+@pytest.mark.parametrize("number", [b"99999999999999999999", b"-99999999999999999999", b"9223372036854775808"])
+def test_numbers_out_of_int64_are_refused(tmp_path, number):
+    path = _write(tmp_path, "numbers.txt", b"1 " + number + b" 2\n")
+    with pytest.raises(ValueError, match="does not fit into int64"):
+        read_text(path)
+
+
+def test_int64_bounds_are_read_exactly(tmp_path):
+    bounds = np.iinfo(np.int64)
+    path = _write(tmp_path, "numbers.txt", f"{bounds.min} 1 {bounds.max}\n".encode())
+    assert read_text(path).tolist() == [bounds.min, 1, bounds.max]
+
+
+def test_binary_round_trip_is_memory_mapped(tmp_path):
+    path = str(tmp_path / "numbers.i64")
+    save_binary(np.array([4, -2, 9, 4]), path)
+    assert isinstance(map_binary(path), np.memmap)
+    instance, statistics = load_instance(path)
+    assert list(instance.values) == [4, -2, 9]
+    assert statistics == (4, 3, -2, 9, -2, 13)
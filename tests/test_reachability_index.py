@@ -0,0 +1,41 @@
+import itertools
+
+import pytest
+
+from subset_sum import ReachabilityIndex
+
+
+def _reachable_sums(numbers):
+    numbers = list(dict.fromkeys(numbers))
+    return {sum(subset) for size in range(len(numbers) + 1) for subset in itertools.combinations(numbers, size)}
+
+
+def test_answers_every_sum(small_instances):
+    for numbers, target_sum in small_instances:
+        index = ReachabilityIndex(numbers)
+        reachable = _reachable_sums(numbers)
+        targets = list(range(min(reachable) - 3, max(reachable) + 4, 7)) + [target_sum]
+        assert index.are_reachable(targets).tolist() == [target in reachable for target in targets]
+        for target in targets:
+            assert index.is_reachable(target) == (target in reachable)
+            solution = index.solution(target)
+            if target in reachable:
+                assert sum(solution) == target
+                assert len(set(solution)) == len(solution) and set(solution) <= set(numbers)
+            else:
+                assert solution is None
+
+
+def test_save_and_load_under_the_same_path(tmp_path):
+    index = ReachabilityIndex([5, -3, 8, 13])
+    path = str(tmp_path / "index")
+    index.save(path)
+    loaded = ReachabilityIndex.load(path)
+    targets = range(-5, 30)
+    assert loaded.are_reachable(targets).tolist() == index.are_reachable(targets).tolist()
+    assert loaded.solutions([10, 18, 4]) == index.solutions([10, 18, 4])
+
+
+def test_too_large_index_is_refused():
+    with pytest.raises(ValueError, match="reachability index needs"):
+        ReachabilityIndex([10 ** 15, 3, -10 ** 15])
@@ -0,0 +1,79 @@
+from subset_sum import DynamicProgramming, MeetInTheMiddle, ResultCache, TabuSearch
+
+
+def test_key_ignores_order_and_duplicates():
+    key = ResultCache.key(TabuSearch, 50, 100, [5, 3, 8, 3], {"seed": 1})
+    assert ResultCache.key(TabuSearch, 50, 100, [8, 5, 3], {"seed": 1}) == key
+    assert ResultCache.key(TabuSearch, 50, 100, [8, 5, 3], {"seed": 2}) != key
+    assert ResultCache.key(TabuSearch, 50, 200, [8, 5, 3], {"seed": 1}) != key
+    assert ResultCache.key(TabuSearch, 51, 100, [8, 5, 3], {"seed": 1}) != key
+    assert ResultCache.key(TabuSearch, 50, 100, [8, 5, 4], {"seed": 1}) != key
+
+
+def test_exact_algorithms_share_one_key():
+    assert ResultCache.is_exact(DynamicProgramming, {})
+    assert ResultCache.is_exact(MeetInTheMiddle, {"variant": "schroeppel_shamir"})
+    assert not ResultCache.is_exact(DynamicProgramming, {"time_limit": 1.0})
+    assert not ResultCache.is_exact(MeetInTheMiddle, {"acceptable_gap": 3})
+    assert not ResultCache.is_exact(TabuSearch, {})
+
+    key = ResultCache.key(DynamicProgramming, 20, 1, [4, 9, 13], {})
+    assert ResultCache.key(MeetInTheMiddle, 20, 7, [13, 9, 4], {"variant": "schroeppel_shamir"}) == key
+    assert ResultCache.key(DynamicProgramming, 20, 1, [4, 9, 13], {"acceptable_gap": 2}) != key
+
+
+def test_cached_solution_is_the_closest(small_instances, closest_gap):
+    cache = ResultCache()
+    for numbers, target_sum in small_instances:
+        gap = closest_gap(numbers, target_sum)
+        solution = cache.search_solution(DynamicProgramming, target_sum, 1, numbers)
+        assert abs(target_sum - sum(solution)) == gap
+        hits = cache.hits
+        assert cache.search_solution(MeetInTheMiddle, target_sum, 1, list(reversed(numbers))) == solution
+        assert cache.hits == hits + 1
+        assert cache.is_reachable(MeetInTheMiddle, target_sum, 1, numbers) == (gap == 0)
+        assert cache.hits == hits + 2
+
+
+def test_heuristic_does_not_answer_unreachable_sum():
+    cache = ResultCache()
+    assert cache.is_reachable(TabuSearch, 1, 10, [4, 6, 10], seed=3) is None
+    assert cache.is_reachable(DynamicProgramming, 1, 1, [4, 6, 10]) is False
+    assert cache.is_reachable(TabuSearch, 20, 10, [4, 6, 10], seed=3) is True
+
+
+def test_memory_keeps_the_least_recently_used_results():
+    cache = ResultCache(max_entries=2)
+    for key in ("a", "b"):
+        cache.put(key, [1], 0, True)
+    assert cache.get("a") is not None
+    cache.put("c", [2], 0, True)
+    assert len(cache) == 2
+    assert cache.get("b") is None
+    assert cache.get("a") is not None and cache.get("c") is not None
+
+
+def test_sqlite_file_keeps_results_between_runs(tmp_path):
+    path = str(tmp_path / "results.sqlite")
+    cache = ResultCache(path=path)
+    solution = cache.search_solution(DynamicProgramming, 17, 1, [3, 5, 9, 11])
+    cache.close()
+
+    cache = ResultCache(path=path)
+    assert cache.search_solution(MeetInTheMiddle, 17, 1, [11, 9, 5, 3]) == solution
+    assert (cache.hits, cache.misses) == (1, 0)
+    cache.clear()
+    assert cache.get(ResultCache.key(DynamicProgramming, 17, 1, [3, 5, 9, 11], {})) is None
+    cache.close()
+
+
+def test_sqlite_file_removes_the_least_recently_used_results(tmp_path):
+    cache = ResultCache(max_entries=1, path=str(tmp_path / "results.sqlite"), max_disk_bytes=40)
+    cache.put("a", [1, 2], 3, True)
+    cache.put("b", [4, 5], 3, True)
+    cache.put("c", [6, 7], 3, True)
+    cache.memory.clear()
+    assert cache.get("a") is None
+    assert cache.get("b") == ((4, 5), 3, True)
+    assert cache.get("c") == ((6, 7), 3, True)
+    cache.close()
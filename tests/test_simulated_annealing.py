@@ -0,0 +1,53 @@
+import random
+
+import pytest
+
+from subset_sum import COOLING_SCHEDULES, ParallelTempering, SimulatedAnnealing, create_cooling_schedule
+from subset_sum.cooling_schedule import AdaptiveSchedule, GeometricSchedule, LinearSchedule, LundyMeesSchedule
+
+
+def _numbers():
+    generator = random.Random(2)
+    return list(dict.fromkeys(generator.randint(-1000, 1000) for i in range(200)))
+
+
+@pytest.mark.parametrize("schedule", sorted(COOLING_SCHEDULES))
+@pytest.mark.parametrize("temperature", [0, 1000, "auto"])
+def test_every_schedule_finds_subset(schedule, temperature):
+    numbers = _numbers()
+    algorithm = SimulatedAnnealing(3210, 2000, numbers, temperature=temperature, cooling_schedule=schedule, seed=4,
+                                   reheat_after=500)
+    solution = algorithm.search_solution()
+    assert set(solution) <= set(numbers)
+
+
+@pytest.mark.parametrize("create", [
+    lambda: GeometricSchedule(alpha=1),
+    lambda: LinearSchedule(cooling_steps=0),
+    lambda: LundyMeesSchedule(beta=0),
+    lambda: AdaptiveSchedule(target_acceptance=1),
+    lambda: AdaptiveSchedule(factor=1),
+    lambda: create_cooling_schedule("unknown"),
+])
+def test_invalid_schedule_parameters_are_refused(create):
+    with pytest.raises(ValueError):
+        create()
+
+
+@pytest.mark.parametrize("initial_acceptance", [0, 1, 1.5, -0.2])
+def test_invalid_initial_acceptance_is_refused(initial_acceptance):
+    with pytest.raises(ValueError, match="initial_acceptance"):
+        SimulatedAnnealing(5, 10, [1, 2, 3], temperature="auto", initial_acceptance=initial_acceptance)
+    with pytest.raises(ValueError, match="initial_acceptance"):
+        ParallelTempering(5, 10, [1, 2, 3], initial_acceptance=initial_acceptance)
+
+
+def test_lundy_mees_keeps_zero_temperature():
+    assert LundyMeesSchedule().next_temperature(0, 0, 16, 0, 0.0) == 0
+
+
+def test_seed_repeats_search():
+    numbers = _numbers()
+    solutions = [SimulatedAnnealing(4321, 3000, numbers, seed=11, cooling_schedule="geometric").search_solution()
+                 for i in range(2)]
+    assert solutions[0] == solutions[1]
@@ -0,0 +1,100 @@
+import asyncio
+import json
+
+from subset_sum import solve_service
+from subset_sum.solve_service import Job, SolveClient, SolveService
+
+
+def _run_with_service(client_code):
+    async def run():
+        service = SolveService(port=0, max_workers=2)
+        await service.start()
+        try:
+            return await client_code(service)
+        finally:
+            await service.close()
+
+    return asyncio.run(run())
+
+
+def test_solve_and_result_round_trip():
+    async def client_code(service):
+        async with SolveClient(port=service.port) as client:
+            job = await client.solve([3, 34, 4, 12, 5, 2], 9, "dynamic_programming")
+            return await client.result(job)
+
+    response = _run_with_service(client_code)
+    assert response["state"] == "done"
+    assert response["points"] == 0
+    assert sum(response["solution"]) == 9
+
+
+def test_stream_ends_with_finished_event():
+    async def client_code(service):
+        client = SolveClient(port=service.port)
+        return [message async for message in client.stream([3, 34, 4, 12, 5, 2], 9, "meet_in_the_middle")]
+
+    messages = _run_with_service(client_code)
+    assert messages[0]["event"] == "queued"
+    assert messages[-1]["event"] == "finished"
+    assert messages[-1]["state"] == "done"
+    assert sum(messages[-1]["solution"]) == 9
+
+
+def test_request_longer_than_default_stream_limit():
+    numbers = list(range(1, 20001))
+
+    async def client_code(service):
+        async with SolveClient(port=service.port) as client:
+            job = await client.solve(numbers, 12345, "hill_climbing_first_choice", iterations=10)
+            return await client.result(job)
+
+    response = _run_with_service(client_code)
+    assert response["state"] == "done"
+    assert response["points"] == abs(12345 - sum(response["solution"]))
+
+
+def test_too_long_and_malformed_lines_get_error_reply(monkeypatch):
+    monkeypatch.setattr(solve_service, "LINE_LIMIT", 1000)
+
+    async def client_code(service):
+        reader, writer = await asyncio.open_connection("127.0.0.1", service.port)
+        responses = []
+        for line in (b"x" * 5000 + b"\n", b"{not json\n", json.dumps({"op": "status", "job": 99}).encode() + b"\n"):
+            writer.write(line)
+            await writer.drain()
+            responses.append(json.loads(await reader.readline()))
+        writer.close()
+        return responses
+
+    responses = _run_with_service(client_code)
+    assert all("error" in response for response in responses)
+    assert "longer than" in responses[0]["error"]
+    assert responses[2]["error"].startswith("KeyError")
+
+
+def test_cancel_keeps_state_of_running_job():
+    async def client_code(service):
+        async with SolveClient(port=service.port) as client:
+            job = await client.solve(list(range(1, 200)), 10 ** 9, "simulated_annealing", iterations=10 ** 9)
+            cancelled = await client.cancel(job)
+            await asyncio.sleep(0.5)
+            return cancelled, await client.result(job)
+
+    cancelled, result = _run_with_service(client_code)
+    assert cancelled["state"] == "cancelled"
+    assert result["state"] == "cancelled"
+
+
+def test_finished_job_is_not_changed():
+    async def run():
+        job = Job(1, {})
+        subscriber = asyncio.Queue()
+        job.subscribers.append(subscriber)
+        job.finish("cancelled")
+        job.finish("done")
+        return job, subscriber
+
+    job, subscriber = asyncio.run(run())
+    assert job.state == "cancelled"
+    assert subscriber.qsize() == 1
@@ -0,0 +1,57 @@
+import numpy as np
+import pytest
+
+from subset_sum import HillClimbingFirstChoice, SubsetInstance
+
+
+@pytest.mark.parametrize("numbers", [[7, -2, 7, 0, 5, -2, 3], np.array([7, -2, 7, 0, 5, -2, 3])])
+def test_duplicates_are_removed_in_order_of_first_occurrence(numbers):
+    instance = SubsetInstance(numbers)
+    assert list(instance.values) == [7, -2, 0, 5, 3]
+    assert instance.array[instance.sorted_order].tolist() == [-2, 0, 3, 5, 7]
+    assert (instance.negative_total, instance.positive_total) == (-2, 15)
+    assert instance.prefix_sums.tolist() == [0, -2, -2, 1, 6, 13]
+
+
+def test_array_and_list_give_the_same_instance():
+    numbers = np.random.default_rng(1).integers(-1000, 1000, 5000)
+    from_array = SubsetInstance(numbers)
+    from_list = SubsetInstance(numbers.tolist())
+    assert from_array.values == from_list.values
+    assert from_array.sorted_order.tolist() == from_list.sorted_order.tolist()
+    assert from_array.prefix_sums.tolist() == from_list.prefix_sums.tolist()
+
+
+def test_totals_are_exact_when_they_do_not_fit_into_int64():
+    numbers = [2 ** 62, 2 ** 62 + 1, 2 ** 62 + 2, -2 ** 62, -2 ** 62 - 1]
+    instance = SubsetInstance(numbers)
+    assert instance.positive_total == 3 * 2 ** 62 + 3
+    assert instance.negative_total == -2 ** 63 - 1
+    assert instance.is_in_range(3 * 2 ** 62)
+    assert not instance.is_in_range(3 * 2 ** 62 + 4)
+
+
+def test_is_in_range():
+    instance = SubsetInstance([4, -3, 6])
+    assert [target for target in range(-5, 13) if instance.is_in_range(target)] == list(range(-3, 11))
+
+
+def test_numbers_out_of_int64_are_refused():
+    with pytest.raises(ValueError, match="int64"):
+        SubsetInstance([1, 2 ** 63])
+    with pytest.raises(ValueError, match="int64"):
+        SubsetInstance(np.array([1, 2 ** 63], dtype=np.uint64))
+
+
+def test_algorithm_refuses_numbers_which_are_not_integers():
+    with pytest.raises(TypeError, match="set_numbers"):
+        HillClimbingFirstChoice(5, 10, ["a", 1])
+    with pytest.raises(ValueError, match="int64"):
+        HillClimbingFirstChoice(5, 10, [1, 2 ** 70])
+
+
+def test_instance_is_read_only_and_shared():
+    instance = SubsetInstance([1, 2, 3])
+    assert SubsetInstance.of(instance) is instance
+    with pytest.raises(ValueError):
+        instance.array[0] = 5
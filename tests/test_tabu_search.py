@@ -0,0 +1,23 @@
+import random
+
+from subset_sum import TabuSearch
+
+
+def test_empty_set():
+    assert TabuSearch(5, 10, []).search_solution() == []
+    assert list(TabuSearch(5, 10, []).iterate_solutions())[-1].solution == []
+
+
+def test_solution_is_subset_with_reported_points():
+    generator = random.Random(3)
+    numbers = list(dict.fromkeys(generator.randint(-1000, 1000) for i in range(300)))
+    updates = list(TabuSearch(4321, 200, numbers, seed=7).iterate_solutions())
+    assert [update.points for update in updates] == sorted((update.points for update in updates), reverse=True)
+    assert updates[-1].points == abs(4321 - sum(updates[-1].solution))
+    assert set(updates[-1].solution) <= set(numbers)
+
+
+def test_seed_repeats_search():
+    numbers = list(range(-50, 300, 7))
+    assert TabuSearch(999, 100, numbers, seed=1).search_solution() == TabuSearch(999, 100, numbers,
+                                                                                 seed=1).search_solution()